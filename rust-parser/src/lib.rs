@@ -1,7 +1,9 @@
+use pyo3::intern;
 use pyo3::prelude::*;
-use pyo3::types::PyDict;
+use pyo3::types::{PyDict, PyString, PyTuple};
 use regex::Regex;
 use once_cell::sync::Lazy;
+use std::collections::HashMap;
 use std::fs::File;
 use std::io::{BufRead, BufReader};
 
@@ -30,83 +32,141 @@ static DISPLAY_PATTERNS: Lazy<Vec<Regex>> = Lazy::new(|| {
     ]
 });
 
-/// 로그 라인을 파싱하여 딕셔너리로 반환
-#[pyfunction]
-fn parse_log_line(line: &str) -> Option<PyObject> {
-    Python::with_gil(|py| {
-        let line = line.trim();
-        if line.is_empty() {
-            return None;
-        }
+/// 파싱된 로그 한 줄 (원본 라인을 빌려 씀, GIL 불필요)
+struct ParsedLine<'a> {
+    timestamp: &'a str,
+    level: &'a str,
+    pid: &'a str,
+    tid: &'a str,
+    tag: &'a str,
+    message: &'a str,
+    display: &'static str,
+}
 
-        // 시간 패턴 찾기
-        let time_match = TIME_PATTERN.find(line)?;
-        let timestamp = time_match.as_str();
-        let remaining = &line[time_match.end()..].trim();
+/// 로그 라인을 필드로 분리 (Python 객체 생성 없음)
+fn parse_fields(line: &str) -> Option<ParsedLine<'_>> {
+    let line = line.trim();
+    if line.is_empty() {
+        return None;
+    }
 
-        // 형식 1: mm-dd HH:MM:SS.mmm  PID  -  -  Tag: Message (Level 없음)
-        if let Some(caps) = THREADTIME_SIMPLE.captures(remaining) {
-            let pid = caps.get(1)?.as_str();
-            let tag = caps.get(2)?.as_str().trim();
-            let message = caps.get(3)?.as_str().trim();
-            let display = classify_display(tag, message);
+    // 시간 패턴 찾기
+    let time_match = TIME_PATTERN.find(line)?;
+    let timestamp = time_match.as_str();
+    let remaining = line[time_match.end()..].trim();
 
-            let dict = PyDict::new_bound(py);
-            dict.set_item("timestamp", timestamp).ok()?;
-            dict.set_item("level", "-").ok()?;
-            dict.set_item("pid", pid).ok()?;
-            dict.set_item("tid", "-").ok()?;
-            dict.set_item("tag", tag).ok()?;
-            dict.set_item("message", message).ok()?;
-            dict.set_item("display", display).ok()?;
-            return Some(dict.into());
-        }
+    // 형식 1: mm-dd HH:MM:SS.mmm  PID  -  -  Tag: Message (Level 없음)
+    if let Some(caps) = THREADTIME_SIMPLE.captures(remaining) {
+        let tag = caps.get(2)?.as_str().trim();
+        let message = caps.get(3)?.as_str().trim();
+        return Some(ParsedLine {
+            timestamp,
+            level: "-",
+            pid: caps.get(1)?.as_str(),
+            tid: "-",
+            tag,
+            message,
+            display: classify_display(tag, message),
+        });
+    }
+
+    // 형식 2: mm-dd HH:MM:SS.mmm  Level  -  -  PID  TID  Level  Tag: Message
+    if let Some(caps) = THREADTIME_COMPLEX.captures(remaining) {
+        let tag = caps.get(5)?.as_str().trim();
+        let message = caps.get(6)?.as_str().trim();
+        return Some(ParsedLine {
+            timestamp,
+            level: caps.get(4)?.as_str(),
+            pid: caps.get(2)?.as_str(),
+            tid: caps.get(3)?.as_str(),
+            tag,
+            message,
+            display: classify_display(tag, message),
+        });
+    }
 
-        // 형식 2: mm-dd HH:MM:SS.mmm  Level  -  -  PID  TID  Level  Tag: Message
-        if let Some(caps) = THREADTIME_COMPLEX.captures(remaining) {
-            let level = caps.get(4)?.as_str();
-            let pid = caps.get(2)?.as_str();
-            let tid = caps.get(3)?.as_str();
-            let tag = caps.get(5)?.as_str().trim();
-            let message = caps.get(6)?.as_str().trim();
-            let display = classify_display(tag, message);
+    // 형식 3: Level/Tag(  PID  TID  Message
+    if let Some(caps) = LEVEL_TAG_PATTERN.captures(remaining) {
+        let tag = caps.get(2)?.as_str().trim();
+        let pid_tid = caps.get(3)?.as_str().trim();
+        let message = caps.get(4)?.as_str().trim();
 
-            let dict = PyDict::new_bound(py);
-            dict.set_item("timestamp", timestamp).ok()?;
-            dict.set_item("level", level).ok()?;
-            dict.set_item("pid", pid).ok()?;
-            dict.set_item("tid", tid).ok()?;
-            dict.set_item("tag", tag).ok()?;
-            dict.set_item("message", message).ok()?;
-            dict.set_item("display", display).ok()?;
-            return Some(dict.into());
-        }
+        let mut pid_tid_parts = pid_tid.split_whitespace();
+        let pid = pid_tid_parts.next().unwrap_or("-");
+        let tid = pid_tid_parts.next().unwrap_or("-");
+        return Some(ParsedLine {
+            timestamp,
+            level: caps.get(1)?.as_str(),
+            pid,
+            tid,
+            tag,
+            message,
+            display: classify_display(tag, message),
+        });
+    }
 
-        // 형식 3: Level/Tag(  PID  TID  Message
-        if let Some(caps) = LEVEL_TAG_PATTERN.captures(remaining) {
-            let level = caps.get(1)?.as_str();
-            let tag = caps.get(2)?.as_str().trim();
-            let pid_tid = caps.get(3)?.as_str().trim();
-            let message = caps.get(4)?.as_str().trim();
+    None
+}
 
-            let pid_tid_parts: Vec<&str> = pid_tid.split_whitespace().collect();
-            let pid = pid_tid_parts.get(0).unwrap_or(&"-");
-            let tid = pid_tid_parts.get(1).unwrap_or(&"-");
-            let display = classify_display(tag, message);
+/// 청크 단위 문자열 캐시
+/// 같은 level/display/tag는 처음 한 번만 intern하고 이후 행은 같은 PyString을 재사용
+/// (행마다 PyString 생성 + intern 테이블 조회 없음)
+struct StrCache<'py, 'a> {
+    py: Python<'py>,
+    map: HashMap<&'a str, Bound<'py, PyString>>,
+}
 
-            let dict = PyDict::new_bound(py);
-            dict.set_item("timestamp", timestamp).ok()?;
-            dict.set_item("level", level).ok()?;
-            dict.set_item("pid", *pid).ok()?;
-            dict.set_item("tid", *tid).ok()?;
-            dict.set_item("tag", tag).ok()?;
-            dict.set_item("message", message).ok()?;
-            dict.set_item("display", display).ok()?;
-            return Some(dict.into());
+impl<'py, 'a> StrCache<'py, 'a> {
+    fn new(py: Python<'py>) -> Self {
+        StrCache { py, map: HashMap::new() }
+    }
+
+    fn get(&mut self, value: &'a str) -> Bound<'py, PyString> {
+        if let Some(s) = self.map.get(value) {
+            return s.clone();
         }
+        let s = PyString::intern_bound(self.py, value);
+        self.map.insert(value, s.clone());
+        s
+    }
+}
 
-        None
-    })
+/// 파싱 결과 -> Python 딕셔너리 (키는 intern!으로 한 번만 생성)
+fn fields_to_dict<'py, 'a>(fields: &ParsedLine<'a>, cache: &mut StrCache<'py, 'a>) -> Option<PyObject> {
+    let py = cache.py;
+    let dict = PyDict::new_bound(py);
+    dict.set_item(intern!(py, "timestamp"), fields.timestamp).ok()?;
+    dict.set_item(intern!(py, "level"), cache.get(fields.level)).ok()?;
+    dict.set_item(intern!(py, "pid"), fields.pid).ok()?;
+    dict.set_item(intern!(py, "tid"), fields.tid).ok()?;
+    dict.set_item(intern!(py, "tag"), cache.get(fields.tag)).ok()?;
+    dict.set_item(intern!(py, "message"), fields.message).ok()?;
+    dict.set_item(intern!(py, "display"), cache.get(fields.display)).ok()?;
+    Some(dict.into())
+}
+
+/// 파싱 결과 -> 테이블 모델용 튜플 (timestamp, level, display, tag, message)
+/// level/display/tag는 intern 문자열로 만들어 행끼리 같은 객체를 공유
+fn fields_to_tuple<'py, 'a>(fields: &ParsedLine<'a>, cache: &mut StrCache<'py, 'a>) -> PyObject {
+    let py = cache.py;
+    PyTuple::new_bound(
+        py,
+        [
+            PyString::new_bound(py, fields.timestamp),
+            cache.get(fields.level),
+            cache.get(fields.display),
+            cache.get(fields.tag),
+            PyString::new_bound(py, fields.message),
+        ],
+    )
+    .into()
+}
+
+/// 로그 라인을 파싱하여 딕셔너리로 반환
+#[pyfunction]
+fn parse_log_line(line: &str) -> Option<PyObject> {
+    let fields = parse_fields(line)?;
+    Python::with_gil(|py| fields_to_dict(&fields, &mut StrCache::new(py)))
 }
 
 /// 배치 파싱 (벡터화된 처리로 더 빠름)
@@ -121,28 +181,31 @@ fn parse_log_batch(lines: Vec<String>) -> Vec<PyObject> {
 /// 파일에서 로그를 읽고 파싱 (고성능 파일 I/O + 파싱)
 /// 배치 단위로 결과를 반환하여 메모리 효율적 처리
 #[pyfunction]
-fn parse_log_file_chunk(file_path: &str, batch_size: usize) -> PyResult<Vec<PyObject>> {
-    // 파일 읽기 (GIL 밖에서 수행)
-    let file = File::open(file_path)
-        .map_err(|e| PyErr::new::<pyo3::exceptions::PyIOError, _>(format!("Failed to open file: {}", e)))?;
-    
-    let reader = BufReader::new(file);
-    let mut lines = Vec::new();
-    
-    for line in reader.lines() {
-        match line {
-            Ok(line) => {
-                let trimmed = line.trim();
-                if !trimmed.is_empty() {
-                    lines.push(trimmed.to_string());  // 소유권 확보
+fn parse_log_file_chunk(py: Python<'_>, file_path: &str, batch_size: usize) -> PyResult<Vec<PyObject>> {
+    // 파일 읽기 (GIL을 풀고 수행)
+    let lines = py.allow_threads(|| -> PyResult<Vec<String>> {
+        let file = File::open(file_path)
+            .map_err(|e| PyErr::new::<pyo3::exceptions::PyIOError, _>(format!("Failed to open file: {}", e)))?;
+        
+        let reader = BufReader::new(file);
+        let mut lines = Vec::new();
+        
+        for line in reader.lines() {
+            match line {
+                Ok(line) => {
+                    let trimmed = line.trim();
+                    if !trimmed.is_empty() {
+                        lines.push(trimmed.to_string());  // 소유권 확보
+                    }
+                }
+                Err(e) => {
+                    // 읽기 오류는 로그하고 계속 진행
+                    eprintln!("Line read error: {}", e);
                 }
-            }
-            Err(e) => {
-                // 읽기 오류는 로그하고 계속 진행
-                eprintln!("Line read error: {}", e);
             }
         }
-    }
+        Ok(lines)
+    })?;
     
     // 파싱 (GIL 필요)
     Python::with_gil(|_py| {
@@ -174,84 +237,180 @@ fn count_file_lines(file_path: &str) -> PyResult<usize> {
 
 /// 파일을 한 번만 읽고 청크마다 콜백 호출 (O(n) - 가장 효율적)
 /// callback(parsed_logs: List[Dict], progress: int, total: int) -> bool
+/// as_tuples=True면 parsed_logs가 List[Tuple[timestamp, level, display, tag, message]]
+/// (Python 쪽에서 dict -> 튜플 재구성 없음)
+/// progress_bytes=True면 progress/total이 (읽은 바이트, 파일 크기) - 줄 수 계산용 사전 읽기 없음
 /// 콜백이 False 반환하면 중단
+/// 파일 읽기와 필드 분리는 GIL을 풀고 수행, 청크마다 Python 객체 생성과 콜백 호출 때만 GIL 획득
 #[pyfunction]
+#[pyo3(signature = (file_path, chunk_size, callback, as_tuples=false, chunk_bytes=0, progress_bytes=false))]
 fn parse_file_streaming(
+    py: Python<'_>,
     file_path: &str, 
     chunk_size: usize, 
-    callback: PyObject
+    callback: PyObject,
+    as_tuples: bool,
+    chunk_bytes: usize,
+    progress_bytes: bool,
 ) -> PyResult<usize> {
-    let file = File::open(file_path)
-        .map_err(|e| PyErr::new::<pyo3::exceptions::PyIOError, _>(format!("Failed to open file: {}", e)))?;
-    
-    // 먼저 총 줄 수 계산 (진행률용)
-    let total_lines = {
+    py.allow_threads(|| {
         let file = File::open(file_path)
             .map_err(|e| PyErr::new::<pyo3::exceptions::PyIOError, _>(format!("Failed to open file: {}", e)))?;
-        BufReader::new(file).lines().count()
-    };
     
-    let reader = BufReader::new(file);
-    let mut lines_buffer: Vec<String> = Vec::with_capacity(chunk_size);
-    let mut total_parsed = 0usize;
-    let mut current_line = 0usize;
+        // 진행률 기준: 바이트면 파일 크기, 아니면 총 줄 수 (파일을 한 번 더 읽음)
+        let total = if progress_bytes {
+            file.metadata().map(|m| m.len() as usize).unwrap_or(0)
+        } else {
+            let file = File::open(file_path)
+                .map_err(|e| PyErr::new::<pyo3::exceptions::PyIOError, _>(format!("Failed to open file: {}", e)))?;
+            BufReader::new(file).lines().count()
+        };
     
-    for line in reader.lines() {
-        match line {
-            Ok(line) => {
-                let trimmed = line.trim();
-                if !trimmed.is_empty() {
-                    lines_buffer.push(trimmed.to_string());
-                }
-                current_line += 1;
+        let reader = BufReader::new(file);
+        let mut lines_buffer: Vec<String> = Vec::with_capacity(chunk_size);
+        let mut buffered_bytes = 0usize;
+        let mut total_parsed = 0usize;
+        let mut current_line = 0usize;
+        let mut bytes_read = 0usize;
+        let position = |line: usize, bytes: usize| if progress_bytes { bytes.min(total) } else { line };
+    
+        for line in reader.lines() {
+            match line {
+                Ok(line) => {
+                    bytes_read += line.len() + 1; // 줄바꿈 포함 (진행률용 근사치)
+                    let trimmed = line.trim();
+                    if !trimmed.is_empty() {
+                        buffered_bytes += trimmed.len();
+                        lines_buffer.push(trimmed.to_string());
+                    }
+                    current_line += 1;
                 
-                // chunk_size마다 콜백 호출
-                if lines_buffer.len() >= chunk_size {
-                    let should_continue = Python::with_gil(|py| {
-                        // 파싱
-                        let parsed: Vec<PyObject> = lines_buffer
-                            .drain(..)
-                            .filter_map(|l| parse_log_line(&l))
-                            .collect();
-                        
-                        let count = parsed.len();
+                    // chunk_size줄 또는 chunk_bytes바이트마다 콜백 호출
+                    if chunk_full(lines_buffer.len(), buffered_bytes, chunk_size, chunk_bytes) {
+                        let (count, should_continue) = emit_chunk(
+                            &lines_buffer, position(current_line, bytes_read), total, &callback, as_tuples,
+                        );
                         total_parsed += count;
-                        
-                        // 콜백 호출: callback(parsed_logs, progress, total)
-                        let result = callback.call1(py, (parsed, current_line, total_lines));
-                        
-                        match result {
-                            Ok(obj) => obj.extract::<bool>(py).unwrap_or(true),
-                            Err(_) => false, // 에러 시 중단
+                        lines_buffer.clear();
+                        buffered_bytes = 0;
+                        if !should_continue {
+                            return Ok(total_parsed);
                         }
-                    });
-                    
-                    if !should_continue {
-                        return Ok(total_parsed);
                     }
                 }
+                Err(e) => {
+                    eprintln!("Line read error: {}", e);
+                    current_line += 1;
+                }
+            }
+        }
+    
+        // 남은 라인 처리
+        if !lines_buffer.is_empty() {
+            let (count, _) = emit_chunk(
+                &lines_buffer, position(current_line, total), total, &callback, as_tuples,
+            );
+            total_parsed += count;
+        }
+    
+        Ok(total_parsed)
+    })
+}
+
+/// 메모리에 통째로 읽은 파일 내용을 파싱하고 청크마다 콜백 호출
+/// 줄을 String으로 복사하지 않고 원본 버퍼의 &str 슬라이스로 처리
+/// 콜백 규약과 GIL 처리는 parse_file_streaming과 동일
+#[pyfunction]
+#[pyo3(signature = (data, chunk_size, callback, as_tuples=false, chunk_bytes=0, progress_bytes=false))]
+fn parse_bytes_streaming(
+    py: Python<'_>,
+    data: &[u8],
+    chunk_size: usize,
+    callback: PyObject,
+    as_tuples: bool,
+    chunk_bytes: usize,
+    progress_bytes: bool,
+) -> PyResult<usize> {
+    py.allow_threads(|| {
+        let text = String::from_utf8_lossy(data);
+        // 바이트 기준이면 줄 수를 미리 세지 않음 (위치는 버퍼 내 오프셋)
+        let total = if progress_bytes { text.len() } else { text.lines().count() };
+        let base = text.as_ptr() as usize;
+    
+        let mut lines_buffer: Vec<&str> = Vec::with_capacity(chunk_size);
+        let mut buffered_bytes = 0usize;
+        let mut total_parsed = 0usize;
+        let mut current_line = 0usize;
+    
+        for line in text.lines() {
+            let trimmed = line.trim();
+            if !trimmed.is_empty() {
+                buffered_bytes += trimmed.len();
+                lines_buffer.push(trimmed);
             }
-            Err(e) => {
-                eprintln!("Line read error: {}", e);
-                current_line += 1;
+            current_line += 1;
+        
+            if chunk_full(lines_buffer.len(), buffered_bytes, chunk_size, chunk_bytes) {
+                let position = if progress_bytes {
+                    line.as_ptr() as usize - base + line.len()
+                } else {
+                    current_line
+                };
+                let (count, should_continue) =
+                    emit_chunk(&lines_buffer, position, total, &callback, as_tuples);
+                total_parsed += count;
+                lines_buffer.clear();
+                buffered_bytes = 0;
+                if !should_continue {
+                    return Ok(total_parsed);
+                }
             }
         }
-    }
     
-    // 남은 라인 처리
-    if !lines_buffer.is_empty() {
-        Python::with_gil(|py| {
-            let parsed: Vec<PyObject> = lines_buffer
-                .into_iter()
-                .filter_map(|l| parse_log_line(&l))
-                .collect();
-            
-            total_parsed += parsed.len();
-            let _ = callback.call1(py, (parsed, current_line, total_lines));
-        });
-    }
+        if !lines_buffer.is_empty() {
+            let position = if progress_bytes { total } else { current_line };
+            let (count, _) = emit_chunk(&lines_buffer, position, total, &callback, as_tuples);
+            total_parsed += count;
+        }
     
-    Ok(total_parsed)
+        Ok(total_parsed)
+    })
+}
+
+/// 줄 수 또는 바이트 수 기준으로 청크가 찼는지 (chunk_bytes=0이면 줄 수만 사용)
+fn chunk_full(lines: usize, bytes: usize, chunk_size: usize, chunk_bytes: usize) -> bool {
+    lines >= chunk_size || (chunk_bytes > 0 && bytes >= chunk_bytes)
+}
+
+/// 청크 파싱 후 콜백 호출 (필드 분리는 GIL 없이, Python 객체 생성과 콜백만 with_gil 안에서)
+/// 호출자가 py.allow_threads 안에서 호출해야 필드 분리 동안 다른 Python 스레드가 실행됨
+/// position/total은 줄 번호/총 줄 수 또는 바이트 위치/총 바이트 (progress_bytes)
+/// 반환: (파싱된 로그 수, 계속 진행 여부)
+fn emit_chunk<S: AsRef<str>>(
+    lines: &[S],
+    position: usize,
+    total: usize,
+    callback: &PyObject,
+    as_tuples: bool,
+) -> (usize, bool) {
+    let parsed_fields: Vec<ParsedLine<'_>> = lines.iter().filter_map(|l| parse_fields(l.as_ref())).collect();
+    let count = parsed_fields.len();
+    
+    let should_continue = Python::with_gil(|py| {
+        let mut cache = StrCache::new(py);
+        let parsed: Vec<PyObject> = if as_tuples {
+            parsed_fields.iter().map(|f| fields_to_tuple(f, &mut cache)).collect()
+        } else {
+            parsed_fields.iter().filter_map(|f| fields_to_dict(f, &mut cache)).collect()
+        };
+        
+        // 콜백 호출: callback(parsed_logs, progress, total)
+        match callback.call1(py, (parsed, position, total)) {
+            Ok(obj) => obj.extract::<bool>(py).unwrap_or(true),
+            Err(_) => false, // 에러 시 중단
+        }
+    });
+    (count, should_continue)
 }
 
 /// AAOS 다중 디스플레이 자동 분류
@@ -291,5 +450,6 @@ fn logcat_parser_rs(m: &Bound<'_, PyModule>) -> PyResult<()> {
     m.add_function(wrap_pyfunction!(parse_log_file_chunk, m)?)?;
     m.add_function(wrap_pyfunction!(count_file_lines, m)?)?;
     m.add_function(wrap_pyfunction!(parse_file_streaming, m)?)?;
+    m.add_function(wrap_pyfunction!(parse_bytes_streaming, m)?)?;
     Ok(())
 }
@@ -1,12 +1,23 @@
 """이슈 설명 기반 분석 및 프롬프트 관리"""
+import hashlib
 import logging
-from typing import Optional, List, Dict, Any
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Optional, List, Dict, Any
 from datetime import datetime
 
 from .opencode_client import OpenCodeClient
 
 logger = logging.getLogger(__name__)
 
+# 분석 요청에 포함할 로그 상한 (최근 로그부터, 줄 수 / 문자 수 - 대략 4자당 1토큰)
+MAX_LOG_LINES = 100
+MAX_LOG_CHARS = 32000
+
+# 같은 요청(작업 공간 + 이슈 설명 + 로그)의 분석 결과 캐시 크기 (중복 클릭 시 즉시 반환)
+ANALYSIS_CACHE_SIZE = 16
+
 
 class LogAnalyzer:
     """로그 분석 및 OpenCode 연동 클래스"""
@@ -18,9 +29,13 @@ class LogAnalyzer:
         """
         self.client = OpenCodeClient(workspace_path)
         self.conversation_history: List[Dict[str, str]] = []
+        self._analysis_cache: "OrderedDict[bytes, Dict[str, Any]]" = OrderedDict()
+        self._analysis_cache_lock = threading.Lock()  # 분석은 워커 스레드에서 실행
         
     def analyze(self, issue_description: str, log_context: Optional[str] = None,
-                selected_logs: Optional[List[Dict[str, Any]]] = None) -> Dict[str, Any]:
+                selected_logs: Optional[List[Dict[str, Any]]] = None,
+                progress_cb: Optional[Callable[[str], None]] = None,
+                should_cancel: Optional[Callable[[], bool]] = None) -> Dict[str, Any]:
         """
         이슈 설명과 로그 컨텍스트를 기반으로 분석 수행
         
@@ -28,19 +43,46 @@ class LogAnalyzer:
             issue_description: 사용자가 입력한 이슈 설명
             log_context: 로그 컨텍스트 문자열 (직접 제공)
             selected_logs: 선택된 로그 리스트 (구조화된 데이터)
+            progress_cb: 분석 출력이 도착할 때마다 지금까지의 출력으로 호출 (선택사항)
+            should_cancel: True를 반환하면 분석 중단 (선택사항)
             
         Returns:
-            분석 결과 딕셔너리
+            분석 결과 딕셔너리 ('_timings': 단계별 소요 시간 ns - format_ns, opencode_ns, cached)
         """
         # 로그 컨텍스트 구성
+        t0 = time.perf_counter_ns()
         if selected_logs and not log_context:
-            log_context = self._format_logs_for_analysis(selected_logs)
+            log_context = self.format_logs_for_analysis(selected_logs)
+        t1 = time.perf_counter_ns()
         
-        # OpenCode 분석 요청
-        result = self.client.analyze_issue(
-            issue_description=issue_description,
-            log_context=log_context
-        )
+        cache_key = self.analysis_key(issue_description, log_context)
+        with self._analysis_cache_lock:
+            cached = self._analysis_cache.get(cache_key)
+            if cached is not None:
+                self._analysis_cache.move_to_end(cache_key)
+        
+        if cached is not None:
+            logger.info("Returning cached analysis result")
+            result = dict(cached)
+        else:
+            # OpenCode 분석 요청
+            result = self.client.analyze_issue(
+                issue_description=issue_description,
+                log_context=log_context,
+                on_output=progress_cb,
+                should_cancel=should_cancel
+            )
+            if result['success']:
+                with self._analysis_cache_lock:
+                    self._analysis_cache[cache_key] = dict(result)
+                    if len(self._analysis_cache) > ANALYSIS_CACHE_SIZE:
+                        self._analysis_cache.popitem(last=False)
+        
+        result['_timings'] = {
+            'format_ns': t1 - t0,
+            'opencode_ns': time.perf_counter_ns() - t1,
+            'cached': cached is not None,
+        }
         
         if result['success']:
             # 대화 히스토리에 추가
@@ -55,19 +97,21 @@ class LogAnalyzer:
         
         return result
     
-    def chat(self, message: str) -> Dict[str, Any]:
+    def chat(self, message: str, should_cancel: Optional[Callable[[], bool]] = None) -> Dict[str, Any]:
         """
         OpenCode와 대화형 채팅
         
         Args:
             message: 사용자 메시지
+            should_cancel: True를 반환하면 요청 중단 (선택사항)
             
         Returns:
             AI 응답 딕셔너리
         """
         result = self.client.chat(
             message=message,
-            conversation_history=self.conversation_history
+            conversation_history=self.conversation_history,
+            should_cancel=should_cancel
         )
         
         if result['success']:
@@ -83,13 +127,15 @@ class LogAnalyzer:
         
         return result
     
-    def _format_logs_for_analysis(self, logs: List[Dict[str, Any]], max_lines: int = 100) -> str:
+    def format_logs_for_analysis(self, logs: List[Dict[str, Any]], max_lines: int = MAX_LOG_LINES,
+                                  max_chars: int = MAX_LOG_CHARS) -> str:
         """
         구조화된 로그 데이터를 분석용 텍스트로 변환
         
         Args:
             logs: 로그 딕셔너리 리스트
             max_lines: 최대 라인 수 (너무 많으면 잘라냄)
+            max_chars: 최대 문자 수 (긴 메시지가 많으면 오래된 로그부터 제외)
             
         Returns:
             포맷된 로그 문자열
@@ -97,11 +143,10 @@ class LogAnalyzer:
         if not logs:
             return ""
         
-        # 최근 로그만 선택
-        selected_logs = logs[-max_lines:] if len(logs) > max_lines else logs
-        
+        # 최근 로그부터 거꾸로 포맷하며 줄 수/문자 수 예산 안에서만 유지
         formatted_lines = []
-        for log in selected_logs:
+        total_chars = 0
+        for log in reversed(logs[-max_lines:]):
             # 로그 형식: [Timestamp] Level Tag: Message
             timestamp = log.get('timestamp', '')
             level = log.get('level', 'I')
@@ -114,15 +159,38 @@ class LogAnalyzer:
             else:
                 line = f"[{timestamp}] {level}/{tag}: {message}"
             
+            if total_chars + len(line) > max_chars:
+                if not formatted_lines:
+                    formatted_lines.append(line[:max_chars])  # 가장 최근 로그는 잘라서라도 포함
+                break
+            total_chars += len(line) + 1
             formatted_lines.append(line)
         
+        dropped = len(logs) - len(formatted_lines)
+        if dropped:
+            logger.warning(f"Log context trimmed: {dropped} of {len(logs)} lines dropped "
+                           f"(limit {max_lines} lines / {max_chars} chars)")
+        
+        formatted_lines.reverse()
         return "\n".join(formatted_lines)
     
+    def analysis_key(self, issue_description: str, log_context: Optional[str]) -> bytes:
+        """분석 요청 키 (작업 공간 + 이슈 설명 + 로그 텍스트의 blake2b 해시, 캐시/중복 요청 판별용)"""
+        h = hashlib.blake2b(digest_size=16)
+        for part in (self.client.workspace_path or '', issue_description, log_context or ''):
+            h.update(part.encode('utf-8', 'replace'))
+            h.update(b'\0')
+        return h.digest()
+    
     def clear_history(self):
         """대화 히스토리 초기화"""
         self.conversation_history = []
         logger.info("Conversation history cleared")
     
+    def warm_up(self):
+        """OpenCode 실행 명령 탐색을 백그라운드에서 미리 수행 (앱 시작 시 한 번)"""
+        threading.Thread(target=self.client.warm_up, name="opencode-warm-up", daemon=True).start()
+    
     def set_workspace(self, workspace_path: str):
         """작업 공간 경로 설정"""
         self.client.set_workspace(workspace_path)
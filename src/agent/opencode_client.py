@@ -3,11 +3,55 @@ import subprocess
 import json
 import os
 import logging
-from typing import Optional, Dict, List, Any
+import shutil
+import signal
+import tempfile
+import threading
+import time
+from typing import Callable, Optional, Dict, List, Any
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
+# OpenCode 명령 타임아웃 (초)
+OPENCODE_TIMEOUT = 300
+
+# 스트리밍 출력 콜백 최소 간격 (초) - 줄마다 UI를 다시 그리지 않도록
+STREAM_CALLBACK_INTERVAL = 0.2
+
+# 실행 중 프로세스의 타임아웃/취소 확인 간격 (초)
+PROCESS_POLL_INTERVAL = 0.1
+
+# shell=True로 띄운 셸과 그 자식(npx/node)을 한 프로세스 그룹으로 묶어 함께 종료할 수 있도록
+if os.name == 'nt':
+    _PROCESS_GROUP_KWARGS: Dict[str, Any] = {'creationflags': subprocess.CREATE_NEW_PROCESS_GROUP}
+else:
+    _PROCESS_GROUP_KWARGS = {'start_new_session': True}
+
+
+def _kill_process_tree(process: subprocess.Popen):
+    """
+    프로세스와 그 자식까지 종료
+    
+    process.kill()은 셸(cmd.exe / /bin/sh)만 종료하므로 stdout을 잡고 있는 npx/node가 남아
+    출력 읽기가 끝나지 않음
+    """
+    try:
+        if os.name == 'nt':
+            subprocess.run(['taskkill', '/F', '/T', '/PID', str(process.pid)],
+                           capture_output=True, timeout=10,
+                           creationflags=subprocess.CREATE_NO_WINDOW)
+        else:
+            os.killpg(process.pid, signal.SIGKILL)
+    except (OSError, subprocess.SubprocessError) as e:
+        logger.debug("프로세스 그룹 종료 실패, 셸만 종료: %s", e)
+        process.kill()
+
+
+# 찾은 OpenCode 실행 명령 (모든 클라이언트가 공유, 처음 사용할 때 한 번만 탐색)
+_opencode_cmd_cache: Optional[str] = None
+_opencode_cmd_lock = threading.Lock()
+
 
 class OpenCodeClient:
     """OpenCode CLI를 Python에서 사용하기 위한 래퍼 클래스"""
@@ -18,54 +62,74 @@ class OpenCodeClient:
             workspace_path: OpenCode가 분석할 프로젝트 경로 (Git 저장소)
         """
         self.workspace_path = workspace_path
-        self.opencode_cmd = self._find_opencode_command()
+    
+    @property
+    def opencode_cmd(self) -> str:
+        """OpenCode 실행 명령 ('npx' 또는 'opencode', 처음 접근할 때 탐색 후 공유)"""
+        global _opencode_cmd_cache
+        with _opencode_cmd_lock:
+            if _opencode_cmd_cache is None:
+                _opencode_cmd_cache = self._find_opencode_command()
+            return _opencode_cmd_cache
+    
+    def warm_up(self):
+        """실행 명령을 미리 탐색 (첫 분석/채팅 요청이 탐색 비용을 내지 않도록)"""
+        return self.opencode_cmd
         
     def _find_opencode_command(self) -> str:
         """OpenCode CLI 명령어 찾기"""
         # npx를 우선적으로 사용 (npm 설치 문제를 피하기 위해)
-        try:
-            result = subprocess.run(
-                ['npx', '--version'],
-                capture_output=True,
-                text=True,
-                encoding='utf-8',
-                errors='replace',
-                timeout=2,
-                shell=True  # Windows에서 실행 정책 문제를 피하기 위해
-            )
-            if result.returncode == 0:
-                logger.info("Using OpenCode via npx (recommended)")
-                return 'npx'
-        except (subprocess.TimeoutExpired, FileNotFoundError):
-            pass
+        # PATH에 없는 명령은 셸을 띄워 FileNotFoundError를 받아오지 않고 바로 건너뜀
+        if shutil.which('npx') is not None:
+            try:
+                result = subprocess.run(
+                    ['npx', '--version'],
+                    capture_output=True,
+                    text=True,
+                    encoding='utf-8',
+                    errors='replace',
+                    timeout=2,
+                    shell=True  # Windows에서 실행 정책 문제를 피하기 위해
+                )
+                if result.returncode == 0:
+                    logger.info("Using OpenCode via npx (recommended)")
+                    return 'npx'
+            except (subprocess.TimeoutExpired, FileNotFoundError):
+                pass
         
         # 전역 설치 확인 (선택사항)
-        try:
-            result = subprocess.run(
-                ['opencode', '--version'],
-                capture_output=True,
-                text=True,
-                encoding='utf-8',
-                errors='replace',
-                timeout=2,
-                shell=True
-            )
-            if result.returncode == 0:
-                logger.info("OpenCode CLI found in PATH")
-                return 'opencode'
-        except (subprocess.TimeoutExpired, FileNotFoundError):
-            pass
+        if shutil.which('opencode') is not None:
+            try:
+                result = subprocess.run(
+                    ['opencode', '--version'],
+                    capture_output=True,
+                    text=True,
+                    encoding='utf-8',
+                    errors='replace',
+                    timeout=2,
+                    shell=True
+                )
+                if result.returncode == 0:
+                    logger.info("OpenCode CLI found in PATH")
+                    return 'opencode'
+            except (subprocess.TimeoutExpired, FileNotFoundError):
+                pass
         
         logger.warning("OpenCode CLI not found. Will try to use npx automatically.")
         return 'npx'  # 기본값으로 npx 사용 (자동 다운로드)
     
-    def _run_opencode(self, command: List[str], input_data: Optional[str] = None) -> Dict[str, Any]:
+    def _run_opencode(self, command: List[str], input_data: Optional[str] = None,
+                      on_output: Optional[Callable[[str], None]] = None,
+                      should_cancel: Optional[Callable[[], bool]] = None) -> Dict[str, Any]:
         """
         OpenCode CLI 명령 실행
         
         Args:
             command: OpenCode 명령어 리스트
             input_data: stdin으로 전달할 데이터
+            on_output: 지정하면 stdout을 줄 단위로 읽으며 지금까지의 출력 전체로 호출
+                       (STREAM_CALLBACK_INTERVAL 간격, 워커 스레드에서 호출됨)
+            should_cancel: True를 반환하면 프로세스를 종료하고 취소 결과 반환
             
         Returns:
             실행 결과 딕셔너리
@@ -83,6 +147,9 @@ class OpenCodeClient:
             else:
                 cwd = None
             
+            if on_output is not None or should_cancel is not None:
+                return self._run_opencode_streaming(cmd, input_data, cwd, env, on_output, should_cancel)
+            
             process = subprocess.run(
                 cmd,
                 input=input_data,
@@ -90,7 +157,7 @@ class OpenCodeClient:
                 text=True,
                 encoding='utf-8',
                 errors='replace',
-                timeout=300,  # 5분 타임아웃
+                timeout=OPENCODE_TIMEOUT,  # 5분 타임아웃
                 cwd=cwd,
                 env=env,
                 shell=True  # Windows PowerShell 실행 정책 문제 해결
@@ -114,7 +181,8 @@ class OpenCodeClient:
                 'success': False,
                 'stdout': '',
                 'stderr': 'Command timed out after 5 minutes',
-                'returncode': -1
+                'returncode': -1,
+                'error_type': 'TimeoutExpired'
             }
         except Exception as e:
             logger.error(f"Error running OpenCode: {str(e)}")
@@ -122,11 +190,119 @@ class OpenCodeClient:
                 'success': False,
                 'stdout': '',
                 'stderr': str(e),
+                'returncode': -1,
+                'error_type': type(e).__name__
+            }
+    
+    def _run_opencode_streaming(self, cmd: List[str], input_data: Optional[str], cwd: Optional[str],
+                                env: Dict[str, str], on_output: Optional[Callable[[str], None]],
+                                should_cancel: Optional[Callable[[], bool]]) -> Dict[str, Any]:
+        """stdout을 줄 단위로 읽으며 중간 결과 전달/취소 확인 (_run_opencode와 같은 결과 형식)"""
+        # stderr는 임시 파일로 받아 끝난 뒤 한 번에 읽음 (파이프가 차서 멈추지 않고, 읽기 전용 스레드도 불필요)
+        with tempfile.TemporaryFile(mode='w+', encoding='utf-8', errors='replace') as stderr_file:
+            process = subprocess.Popen(
+                cmd,
+                stdin=subprocess.PIPE if input_data is not None else subprocess.DEVNULL,
+                stdout=subprocess.PIPE,
+                stderr=stderr_file,
+                text=True,
+                encoding='utf-8',
+                errors='replace',
+                cwd=cwd,
+                env=env,
+                shell=True,  # Windows PowerShell 실행 정책 문제 해결
+                **_PROCESS_GROUP_KWARGS
+            )
+            stdout, cancelled, timed_out = self._read_process_output(process, input_data, on_output, should_cancel)
+            stderr_file.seek(0)
+            stderr = stderr_file.read()
+        
+        if cancelled:
+            logger.info("OpenCode command cancelled")
+            return {
+                'success': False,
+                'stdout': '',
+                'stderr': 'Cancelled',
                 'returncode': -1
             }
+        
+        if timed_out:
+            logger.error("OpenCode command timed out")
+            return {
+                'success': False,
+                'stdout': '',
+                'stderr': 'Command timed out after 5 minutes',
+                'returncode': -1,
+                'error_type': 'TimeoutExpired'
+            }
+        
+        result = {
+            'success': process.returncode == 0,
+            'stdout': stdout,
+            'stderr': stderr,
+            'returncode': process.returncode
+        }
+        if not result['success']:
+            logger.error(f"OpenCode command failed: {result['stderr']}")
+        return result
+    
+    @staticmethod
+    def _read_process_output(process: subprocess.Popen, input_data: Optional[str],
+                             on_output: Optional[Callable[[str], None]],
+                             should_cancel: Optional[Callable[[], bool]]):
+        """
+        프로세스 stdout을 끝까지 읽음 (타임아웃/취소 시 프로세스 종료)
+        
+        Returns:
+            (stdout 전체, 취소 여부, 타임아웃 여부)
+        """
+        # 출력이 없는 동안에도 타임아웃/취소를 확인하도록 감시 스레드에서 폴링
+        timed_out = threading.Event()
+        cancelled = threading.Event()
+        done = threading.Event()
+        def watch():
+            deadline = time.monotonic() + OPENCODE_TIMEOUT
+            while not done.wait(PROCESS_POLL_INTERVAL):
+                if should_cancel is not None and should_cancel():
+                    cancelled.set()
+                elif time.monotonic() >= deadline:
+                    timed_out.set()
+                else:
+                    continue
+                _kill_process_tree(process)
+                return
+        watcher = threading.Thread(target=watch, daemon=True)
+        watcher.start()
+        
+        try:
+            if input_data is not None:
+                process.stdin.write(input_data)
+                process.stdin.close()
+            
+            chunks: List[str] = []
+            last_callback = 0.0
+            for line in process.stdout:
+                if should_cancel is not None and should_cancel():
+                    cancelled.set()
+                    _kill_process_tree(process)
+                    break
+                chunks.append(line)
+                if on_output is None:
+                    continue
+                now = time.monotonic()
+                if now - last_callback >= STREAM_CALLBACK_INTERVAL:
+                    last_callback = now
+                    on_output(''.join(chunks))
+            process.wait()
+        finally:
+            done.set()
+        
+        return ''.join(chunks), cancelled.is_set(), timed_out.is_set()
     
     def analyze_issue(self, issue_description: str, log_context: Optional[str] = None, 
-                     selected_code: Optional[str] = None) -> Dict[str, Any]:
+                     selected_code: Optional[str] = None,
+                     on_output: Optional[Callable[[str], None]] = None,
+                     should_cancel: Optional[Callable[[], bool]] = None) -> Dict[str, Any]:
         """
         이슈 설명과 로그 컨텍스트를 기반으로 분석 요청
         
@@ -134,6 +310,8 @@ class OpenCodeClient:
             issue_description: 사용자가 입력한 이슈 설명
             log_context: 관련 로그 컨텍스트 (최근 에러 로그 등)
             selected_code: 선택된 코드 스니펫 (선택사항)
+            on_output: 분석 출력이 도착할 때마다 지금까지의 출력으로 호출 (선택사항)
+            should_cancel: True를 반환하면 분석 중단 (선택사항)
             
         Returns:
             분석 결과 딕셔너리
@@ -162,7 +340,7 @@ class OpenCodeClient:
         command = ['run', full_prompt]
         
         logger.info("Running OpenCode analysis...")
-        result = self._run_opencode(command)
+        result = self._run_opencode(command, on_output=on_output, should_cancel=should_cancel)
         
         if result['success']:
             return {
@@ -174,16 +352,19 @@ class OpenCodeClient:
             return {
                 'success': False,
                 'error': result['stderr'],
+                'error_type': result.get('error_type'),  # 타임아웃/예외로 실패한 경우 예외 종류 (재시도 판단용)
                 'analysis': None
             }
     
-    def chat(self, message: str, conversation_history: Optional[List[Dict[str, str]]] = None) -> Dict[str, Any]:
+    def chat(self, message: str, conversation_history: Optional[List[Dict[str, str]]] = None,
+             should_cancel: Optional[Callable[[], bool]] = None) -> Dict[str, Any]:
         """
         OpenCode와 대화형 채팅
         
         Args:
             message: 사용자 메시지
             conversation_history: 이전 대화 기록 (선택사항)
+            should_cancel: True를 반환하면 요청 중단 (선택사항)
             
         Returns:
             AI 응답 딕셔너리
@@ -201,7 +382,7 @@ class OpenCodeClient:
         command = ['run', full_prompt]
         
         logger.info("Sending chat message to OpenCode...")
-        result = self._run_opencode(command)
+        result = self._run_opencode(command, should_cancel=should_cancel)
         
         if result['success']:
             return {
@@ -213,6 +394,7 @@ class OpenCodeClient:
             return {
                 'success': False,
                 'error': result['stderr'],
+                'error_type': result.get('error_type'),
                 'response': None
             }
     
@@ -226,6 +408,8 @@ class OpenCodeClient:
     
     def check_installation(self) -> bool:
         """OpenCode CLI 설치 확인"""
+        if shutil.which(self.opencode_cmd) is None:
+            return False
         try:
             if self.opencode_cmd == 'npx':
                 # npx는 항상 사용 가능 (없으면 자동 다운로드)
@@ -1,13 +1,21 @@
 """로그 버퍼 관리 - 슬라이딩 윈도우 컨텍스트 버퍼"""
 from collections import deque
-from typing import List, Dict, Any, Optional
+from itertools import islice
+from typing import List, Dict, Any, Optional, Tuple
 import logging
+import threading
+
+from core.parser import log_tuple_to_dict
 
 logger = logging.getLogger(__name__)
 
 
 class LogBuffer:
-    """로그 버퍼 - 최근 N개의 로그를 메모리에 보관"""
+    """
+    로그 버퍼 - 최근 N개의 로그를 메모리에 보관
+    
+    파일 로드 스레드가 추가하고 GUI 스레드가 조회/초기화하므로 모든 접근은 _lock 안에서 수행.
+    """
     
     def __init__(self, max_size: int = 1000):
         """
@@ -17,6 +25,7 @@ class LogBuffer:
         self.max_size = max_size
         self.buffer: deque = deque(maxlen=max_size)
         self.error_logs: deque = deque(maxlen=100)  # 에러 로그만 별도 보관
+        self._lock = threading.Lock()
     
     def add(self, log_data: Dict[str, Any]):
         """
@@ -28,12 +37,46 @@ class LogBuffer:
         if not log_data:
             return
         
-        self.buffer.append(log_data)
+        with self._lock:
+            self.buffer.append(log_data)
+            
+            # 에러 레벨 로그는 별도 보관
+            level = log_data.get('level', '').upper()
+            if level in ['E', 'F', 'A']:  # Error, Fatal, Assert
+                self.error_logs.append(log_data)
+    
+    def add_batch(self, logs: List[Dict[str, Any]]):
+        """
+        로그 여러 개를 한 번에 추가 (add를 행마다 호출하는 것과 결과 동일)
+        
+        Args:
+            logs: 파싱된 로그 딕셔너리 리스트
+        """
+        if not logs:
+            return
         
-        # 에러 레벨 로그는 별도 보관
-        level = log_data.get('level', '').upper()
-        if level in ['E', 'F', 'A']:  # Error, Fatal, Assert
-            self.error_logs.append(log_data)
+        errors = [log for log in logs if log and log.get('level', '').upper() in ('E', 'F', 'A')]
+        with self._lock:
+            # deque(maxlen).extend는 C 레벨에서 오래된 항목을 밀어냄
+            self.buffer.extend(filter(None, logs))
+            self.error_logs.extend(errors)
+    
+    def add_tuples(self, logs: List[Tuple[str, str, str, str, str]]):
+        """
+        테이블 모델용 튜플 배치 추가 (timestamp, level, display, tag, message)
+        
+        버퍼에 실제로 남을 마지막 max_size개와 에러 로그만 dict로 변환.
+        """
+        if not logs:
+            return
+        
+        # dict 변환은 락 밖에서 (GUI 스레드 조회를 오래 막지 않도록)
+        recent = list(map(log_tuple_to_dict, logs[-self.max_size:]))
+        errors = [log for log in logs if log[1].upper() in ('E', 'F', 'A')]
+        error_dicts = list(map(log_tuple_to_dict, errors[-self.error_logs.maxlen:]))
+        with self._lock:
+            self.buffer.extend(recent)
+            self.error_logs.extend(error_dicts)
     
     def get_recent(self, count: int = 100) -> List[Dict[str, Any]]:
         """
@@ -45,7 +88,8 @@ class LogBuffer:
         Returns:
             최근 로그 리스트
         """
-        return list(self.buffer)[-count:]
+        with self._lock:
+            return self._tail(self.buffer, count)
     
     def get_error_logs(self, count: int = 50) -> List[Dict[str, Any]]:
         """
@@ -57,7 +101,17 @@ class LogBuffer:
         Returns:
             최근 에러 로그 리스트
         """
-        return list(self.error_logs)[-count:]
+        with self._lock:
+            return self._tail(self.error_logs, count)
+    
+    @staticmethod
+    def _tail(buf: deque, count: int) -> List[Dict[str, Any]]:
+        """deque 끝에서 count개를 순서대로 반환 (전체 list 복사 없이 O(count))"""
+        if count <= 0 or count >= len(buf):
+            return list(buf)[-count:]
+        tail = list(islice(reversed(buf), count))
+        tail.reverse()
+        return tail
     
     def get_context_around_error(self, error_index: int, context_lines: int = 10) -> List[Dict[str, Any]]:
         """
@@ -70,17 +124,18 @@ class LogBuffer:
         Returns:
             컨텍스트 로그 리스트
         """
-        if error_index < 0 or error_index >= len(self.error_logs):
-            return []
-        
-        error_log = self.error_logs[error_index]
+        with self._lock:
+            if error_index < 0 or error_index >= len(self.error_logs):
+                return []
+            error_log = self.error_logs[error_index]
+            buffer = list(self.buffer)
         error_timestamp = error_log.get('timestamp', '')
         
         # 전체 버퍼에서 해당 에러 주변 로그 찾기
         context = []
         found_error = False
         
-        for log in self.buffer:
+        for log in buffer:
             if log == error_log:
                 found_error = True
                 context.append(log)
@@ -97,8 +152,9 @@ class LogBuffer:
     
     def clear(self):
         """버퍼 초기화"""
-        self.buffer.clear()
-        self.error_logs.clear()
+        with self._lock:
+            self.buffer.clear()
+            self.error_logs.clear()
     
     def size(self) -> int:
         """현재 버퍼 크기"""
@@ -159,6 +159,25 @@ class ErrorDetector:
         
         return None
     
+    def detect_batch(self, logs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        로그 여러 개에서 에러 패턴 감지 (Error 이상 레벨만 골라서 detect)
+        
+        Args:
+            logs: 파싱된 로그 딕셔너리 리스트
+            
+        Returns:
+            감지된 에러 정보 리스트
+        """
+        detect = self.detect
+        detected = []
+        for log_data in logs:
+            if log_data and log_data.get('level', '').upper() in ('E', 'F', 'A'):
+                error_info = detect(log_data)
+                if error_info:
+                    detected.append(error_info)
+        return detected
+    
     def detect_in_text(self, text: str) -> List[Dict[str, Any]]:
         """
         텍스트에서 모든 에러 패턴 감지
@@ -1,7 +1,9 @@
 """로그 파서 - 로그 라인을 구조화된 데이터로 변환"""
 import re
+import sys
 import logging
-from typing import Optional, Tuple, Dict, Any
+from operator import itemgetter
+from typing import Optional, Tuple, Dict, Any, Iterable, List
 
 logger = logging.getLogger(__name__)
 
@@ -25,6 +27,33 @@ try:
 except ImportError:
     logger.debug("[Parser] pylogcatparser 라이브러리를 사용할 수 없음 - fallback 파싱 사용")
 
+# 파싱 결과 dict -> 테이블 모델용 튜플 (timestamp, level, display, tag, message)
+# 모든 파서(Rust/라이브러리/fallback)가 7개 키를 항상 채우므로 .get() 기본값 없이 C 레벨에서 한 번에 추출
+to_log_tuple = itemgetter('timestamp', 'level', 'display', 'tag', 'message')
+
+
+def to_log_tuples(parsed_dicts: Iterable[Dict[str, Any]]) -> List[Tuple[str, str, str, str, str]]:
+    """
+    파싱 결과 dict 목록 -> 테이블 모델용 튜플 목록
+    
+    level/display/tag는 종류가 적고 수백만 행에서 반복되므로 sys.intern으로 문자열 객체를 공유
+    (행마다 같은 내용의 str 객체를 따로 들고 있지 않음 -> 메모리 절감, 비교 시 동일 객체)
+    """
+    intern = sys.intern
+    return [
+        (ts, intern(level), intern(display), intern(tag), message)
+        for ts, level, display, tag, message in map(to_log_tuple, parsed_dicts)
+    ]
+
+
+def log_tuple_to_dict(log_tuple: Tuple[str, str, str, str, str]) -> Dict[str, Any]:
+    """테이블 모델용 튜플 -> 파싱 결과 dict (튜플에 없는 pid/tid는 '-')"""
+    timestamp, level, display, tag, message = log_tuple
+    return {
+        'timestamp': timestamp, 'level': level, 'pid': '-', 'tid': '-',
+        'tag': tag, 'message': message, 'display': display,
+    }
+
 
 class LogParser:
     """로그 라인 파서 (Rust 파서 우선 사용)"""
@@ -155,6 +184,29 @@ class LogParser:
         # Fallback: 직접 파싱
         return self._parse_fallback(line)
     
+    def parse_batch(self, lines: List[str]) -> List[Dict[str, Any]]:
+        """
+        여러 로그 라인을 한 번에 파싱 (실시간 logcat 배치용)
+        
+        Rust 파서가 있으면 배치 API 한 번 호출로 처리 (라인당 파이썬 호출 없음),
+        없으면 라인별 parse로 처리.
+        
+        Args:
+            lines: 로그 라인 리스트
+            
+        Returns:
+            파싱된 로그 딕셔너리 리스트 (파싱 실패한 라인은 제외)
+        """
+        if not lines:
+            return []
+        
+        if self.use_rust and self.rust_parser:
+            parsed = self.rust_parser.parse_batch(lines)
+            if parsed:
+                return parsed
+        
+        return [d for d in map(self.parse, lines) if d]
+    
     def _parse_fallback(self, line: str) -> Optional[Dict[str, Any]]:
         """Fallback 파싱 (정규식 기반)"""
         # 시간 패턴 찾기
@@ -182,7 +234,7 @@ class LogParser:
                 'level': level,
                 'pid': pid,
                 'tid': tid,
-                'tag': tag,
+                'tag': sys.intern(tag),
                 'message': message,
                 'display': display,
             }
@@ -202,7 +254,7 @@ class LogParser:
                 'level': level,
                 'pid': pid,
                 'tid': tid,
-                'tag': tag,
+                'tag': sys.intern(tag),
                 'message': message,
                 'display': display,
             }
@@ -227,7 +279,7 @@ class LogParser:
                 'level': level,
                 'pid': pid,
                 'tid': tid,
-                'tag': tag,
+                'tag': sys.intern(tag),
                 'message': message,
                 'display': display,
             }
@@ -33,6 +33,12 @@ try:
     except ImportError:
         logger.warning("[Parser] Rust 스트리밍 파서를 사용할 수 없음 - 파서를 다시 빌드하세요")
         rust_parse_file_streaming = None
+    
+    # 메모리 버퍼 파서 (파일을 한 번에 읽은 경우)
+    try:
+        from logcat_parser_rs import parse_bytes_streaming as rust_parse_bytes_streaming
+    except ImportError:
+        rust_parse_bytes_streaming = None
 except ImportError:
     logger.debug("[Parser] Rust 파서를 사용할 수 없음 - Python 파서 사용")
     rust_parse_log_line = None
@@ -40,6 +46,7 @@ except ImportError:
     rust_parse_log_file_chunk = None
     rust_count_file_lines = None
     rust_parse_file_streaming = None
+    rust_parse_bytes_streaming = None
 
 
 class RustLogParser:
@@ -142,7 +149,8 @@ class RustLogParser:
             logger.error(f"[RustParser] 파일 파싱 실패: {str(e)}", exc_info=True)
             return []
     
-    def parse_file_streaming(self, file_path: str, chunk_size: int, callback) -> int:
+    def parse_file_streaming(self, file_path: str, chunk_size: int, callback, as_tuples: bool = False,
+                             chunk_bytes: int = 0, progress_bytes: bool = False) -> int:
         """
         파일을 스트리밍으로 읽고 청크마다 콜백 호출 (O(n) - 가장 효율적)
         
@@ -151,6 +159,11 @@ class RustLogParser:
             chunk_size: 청크 크기
             callback: 콜백 함수 (parsed_logs, current_line, total_lines) -> bool
                      False 반환 시 중단
+            as_tuples: True면 Rust에서 바로 (timestamp, level, display, tag, message) 튜플 리스트 전달
+                       (이전 빌드라 지원하지 않으면 dict 리스트로 전달되므로 콜백에서 타입 확인 필요)
+            chunk_bytes: 0보다 크면 이 바이트 수마다도 콜백 호출 (as_tuples 모드, 미지원 빌드면 줄 수만 사용)
+            progress_bytes: True면 콜백 진행 인자가 (읽은 바이트, 파일 크기) - 줄 수 사전 계산 없음
+                            (미지원 빌드면 줄 기준이므로 콜백은 두 값의 비율만 사용해야 함)
             
         Returns:
             총 파싱된 로그 수
@@ -176,12 +189,70 @@ class RustLogParser:
                         logger.debug(f"[RustParser] dict 변환 실패: {str(e)}")
             return callback(converted, current_line, total_lines)
         
+        if as_tuples:
+            # 인자 미지원(TypeError)이면 이전 빌드 시그니처로 재시도 (새 인자부터 제거)
+            attempts = [{'as_tuples': True}]
+            if chunk_bytes > 0:
+                attempts.insert(0, {'as_tuples': True, 'chunk_bytes': chunk_bytes})
+            if progress_bytes:
+                attempts.insert(0, {'as_tuples': True, 'chunk_bytes': chunk_bytes, 'progress_bytes': True})
+            for kwargs in attempts:
+                try:
+                    # 튜플은 Rust에서 완성되어 오므로 변환 래퍼 없이 콜백 직접 전달
+                    return rust_parse_file_streaming(file_path, chunk_size, callback, **kwargs)
+                except TypeError:
+                    continue
+                except Exception as e:
+                    logger.error(f"[RustParser] 스트리밍 파싱 실패: {str(e)}", exc_info=True)
+                    return 0
+            logger.warning("[RustParser] as_tuples 미지원 빌드 - dict 모드로 진행 (Rust 파서를 다시 빌드하세요)")
+        
         try:
             return rust_parse_file_streaming(file_path, chunk_size, wrapper_callback)
         except Exception as e:
             logger.error(f"[RustParser] 스트리밍 파싱 실패: {str(e)}", exc_info=True)
             return 0
     
+    @staticmethod
+    def has_file_streaming() -> bool:
+        """parse_file_streaming 지원 빌드인지 여부"""
+        return rust_parse_file_streaming is not None
+    
+    @staticmethod
+    def has_bytes_streaming() -> bool:
+        """parse_bytes_streaming 지원 빌드인지 여부"""
+        return rust_parse_bytes_streaming is not None
+    
+    def parse_bytes_streaming(self, data: bytes, chunk_size: int, callback, chunk_bytes: int = 0,
+                              progress_bytes: bool = False) -> int:
+        """
+        메모리에 읽은 파일 내용을 파싱하고 청크마다 콜백 호출 (튜플 리스트 전달)
+        
+        Args:
+            data: 파일 전체 내용
+            chunk_size: 청크 크기
+            callback: 콜백 함수 (parsed_logs, current_line, total_lines) -> bool
+            chunk_bytes: 0보다 크면 이 바이트 수마다도 콜백 호출
+            progress_bytes: True면 콜백 진행 인자가 (버퍼 내 바이트 위치, 버퍼 크기)
+            
+        Returns:
+            총 파싱된 로그 수
+        """
+        if rust_parse_bytes_streaming is None:
+            raise ImportError(
+                "Rust 메모리 버퍼 파서를 사용할 수 없습니다. "
+                "Rust 파서를 다시 빌드하고 설치하세요: "
+                "cd rust-parser && python -m maturin build --release"
+            )
+        
+        try:
+            return rust_parse_bytes_streaming(
+                data, chunk_size, callback, as_tuples=True, chunk_bytes=chunk_bytes, progress_bytes=progress_bytes
+            )
+        except Exception as e:
+            logger.error(f"[RustParser] 버퍼 파싱 실패: {str(e)}", exc_info=True)
+            return 0
+    
     @staticmethod
     def count_file_lines(file_path: str) -> int:
         """
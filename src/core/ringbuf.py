@@ -0,0 +1,105 @@
+"""단일 생산자/단일 소비자(SPSC) 링 버퍼 - 스레드 간 로그 전달용 (생산자: LogcatThread, 소비자: LogTable.update_timer)"""
+from typing import Any, List
+
+
+class SPSCRingBuffer:
+    """
+    고정 크기 SPSC 링 버퍼 (락 없음)
+
+    생산자 스레드는 _head만, 소비자 스레드는 _tail만 갱신함.
+    CPython에서 int 속성 대입은 GIL 하에서 원자적이므로 별도 락 없이 안전.
+    소비자는 인덱스만 전진시키므로 list 슬라이스 복사(pending[n:])가 없음.
+    """
+
+    __slots__ = ('_buf', '_capacity', '_mask', '_head', '_tail')
+
+    def __init__(self, capacity: int = 65536):
+        """
+        Args:
+            capacity: 최대 보관 항목 수 (2의 거듭제곱으로 올림)
+        """
+        size = 1
+        while size < capacity:
+            size <<= 1
+        self._buf: List[Any] = [None] * size
+        self._capacity = size
+        self._mask = size - 1
+        self._head = 0  # 다음에 쓸 위치 (생산자 전용)
+        self._tail = 0  # 다음에 읽을 위치 (소비자 전용)
+
+    def __len__(self) -> int:
+        return self._head - self._tail
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    def push(self, item: Any) -> bool:
+        """
+        항목 추가 (생산자 스레드에서만 호출)
+
+        Returns:
+            가득 차 있으면 False (호출자가 재시도/대기)
+        """
+        head = self._head
+        if head - self._tail >= self._capacity:
+            return False
+        self._buf[head & self._mask] = item
+        self._head = head + 1
+        return True
+
+    def push_many(self, items: List[Any]) -> int:
+        """
+        여러 항목을 한 번에 추가 (생산자 스레드에서만 호출)
+
+        Returns:
+            실제로 추가한 항목 수 (공간이 부족하면 앞에서부터 들어간 만큼)
+        """
+        head = self._head
+        count = min(len(items), self._capacity - (head - self._tail))
+        if count <= 0:
+            return 0
+
+        buf = self._buf
+        start = head & self._mask
+        end = start + count
+        if end <= self._capacity:
+            buf[start:end] = items[:count]
+        else:
+            first = self._capacity - start
+            buf[start:] = items[:first]
+            buf[:count - first] = items[first:count]
+
+        self._head = head + count
+        return count
+
+    def drain_up_to(self, max_count: int) -> List[Any]:
+        """
+        최대 max_count개 항목을 꺼냄 (소비자 스레드에서만 호출)
+
+        Returns:
+            꺼낸 항목 리스트 (비어 있으면 빈 리스트)
+        """
+        tail = self._tail
+        count = min(max_count, self._head - tail)
+        if count <= 0:
+            return []
+
+        buf = self._buf
+        start = tail & self._mask
+        end = start + count
+        if end <= self._capacity:
+            items = buf[start:end]
+            buf[start:end] = [None] * count
+        else:
+            end -= self._capacity
+            items = buf[start:] + buf[:end]
+            buf[start:] = [None] * (self._capacity - start)
+            buf[:end] = [None] * end
+
+        self._tail = tail + count
+        return items
+
+    def clear(self) -> None:
+        """남은 항목 버림 (소비자 스레드에서만 호출)"""
+        self.drain_up_to(len(self))
@@ -17,12 +17,16 @@ logging.basicConfig(
 
 from PyQt6.QtWidgets import QApplication
 from ui.main_window import MainWindow
+from utils.api_keys import load_api_keys
 
 def main():
     # 메인 스레드 ID (나중에 시그널 슬롯이 어느 스레드에서 도는지 비교용)
     print(f"[Main] 메인 스레드 ID: {threading.get_ident()}")
     app = QApplication(sys.argv)
     
+    # 저장된 API 키를 환경 변수로 (keyring 조회가 느릴 수 있어 백그라운드에서)
+    threading.Thread(target=load_api_keys, daemon=True).start()
+    
     # TODO: Setup dark theme (pyqtdarktheme.apply() when available)
     
     # Create and show main window
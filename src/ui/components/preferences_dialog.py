@@ -18,6 +18,10 @@ class PreferencesDialog(QDialog):
         self.setMinimumHeight(500)
         self.installer = OpenCodeInstaller()
         self._setup_ui()
+    
+    def showEvent(self, event):
+        """열 때마다 설정/상태를 다시 읽음 (다이얼로그 인스턴스는 재사용)"""
+        super().showEvent(event)
         self._load_settings()
     
     def _setup_ui(self):
@@ -63,6 +63,11 @@ class WorkspaceDialog(QDialog):
         self.cancel_btn.clicked.connect(self.reject)
         self.workspace_list.itemDoubleClicked.connect(self._load_selected)
     
+    def showEvent(self, event):
+        """열 때마다 입력 중이던 URL 초기화 (다이얼로그 인스턴스는 재사용)"""
+        super().showEvent(event)
+        self.git_url_input.clear()
+    
     def _add_workspace(self):
         url = self.git_url_input.text().strip()
         branch = self.branch_combo.currentText().strip()
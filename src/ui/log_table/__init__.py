@@ -8,6 +8,7 @@ QTableView + QAbstractTableModel 기반 가상화 테이블
 """
 from .log_table import LogTable
 from .log_model import LogTableModel
+from .filter_model import FilterTableModel
 from .filter_dialog import FilterDialog
 
-__all__ = ['LogTable', 'LogTableModel', 'FilterDialog']
+__all__ = ['LogTable', 'LogTableModel', 'FilterTableModel', 'FilterDialog']
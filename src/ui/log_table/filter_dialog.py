@@ -1,10 +1,11 @@
 """
 필터 설정 다이얼로그
 """
+import re
 from PyQt6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QGroupBox, QRadioButton,
     QPushButton, QLabel, QGridLayout, QComboBox, QLineEdit, QCheckBox,
-    QColorDialog
+    QColorDialog, QMessageBox
 )
 from PyQt6.QtGui import QColor
 
@@ -160,7 +161,14 @@ class FilterDialog(QDialog):
         }
     
     def accept(self):
-        """확인"""
+        """확인 (정규식 키워드는 여기서 한 번 검증)"""
+        keyword = self.keyword_edit.text().strip()
+        if keyword and self.keyword_regex_cb.isChecked():
+            try:
+                re.compile(keyword)
+            except re.error as e:
+                QMessageBox.warning(self, "Invalid Regex", f"정규식 오류: {e}")
+                return
         super().accept()
     
     def reject(self):
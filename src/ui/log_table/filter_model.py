@@ -0,0 +1,154 @@
+"""
+필터 목록 테이블 모델 (QAbstractTableModel 기반)
+
+QTableWidget 대신 QTableView + 모델을 사용하여:
+- 셀마다 QTableWidgetItem / 행마다 QCheckBox 위젯 생성 없음
+- 필터 추가/삭제는 beginInsertRows / beginRemoveRows 한 번
+- Enable 체크는 CheckStateRole로 처리
+"""
+from typing import Any, List, Dict, Optional
+from PyQt6.QtCore import QAbstractTableModel, QModelIndex, Qt
+from PyQt6.QtGui import QColor
+
+
+class FilterTableModel(QAbstractTableModel):
+    """필터 딕셔너리 리스트를 보여주는 테이블 모델"""
+
+    COLUMNS = ["Enable", "Level", "PID", "TID", "Display", "Tag", "Message"]
+    COLUMN_COUNT = len(COLUMNS)
+
+    # 컬럼 인덱스
+    COL_ENABLE = 0
+    COL_DISPLAY = 4
+
+    # 컬럼 -> fields 키 (Enable/Display 제외)
+    _FIELD_KEYS = {1: 'level', 2: 'pid', 3: 'tid', 5: 'tag', 6: 'keyword'}
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._filters: List[Dict] = []
+        self._enabled: List[bool] = []  # Enable 체크 상태 (필터 dict와 별도로 관리, 저장 파일에 포함 안 함)
+        self._bg_colors: List[Optional[QColor]] = []  # 행 배경색 캐시
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        return len(self._filters)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        return self.COLUMN_COUNT
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if not index.isValid():
+            return None
+        row = index.row()
+        col = index.column()
+        if row < 0 or row >= len(self._filters):
+            return None
+
+        if role == Qt.ItemDataRole.DisplayRole:
+            if col == self.COL_DISPLAY:
+                return "Main"
+            key = self._FIELD_KEYS.get(col)
+            if key:
+                return self._filters[row].get('fields', {}).get(key, '') or ''
+        elif role == Qt.ItemDataRole.CheckStateRole:
+            if col == self.COL_ENABLE:
+                return Qt.CheckState.Checked if self._enabled[row] else Qt.CheckState.Unchecked
+        elif role == Qt.ItemDataRole.BackgroundRole:
+            return self._bg_colors[row]
+        return None
+
+    def setData(self, index: QModelIndex, value: Any, role: int = Qt.ItemDataRole.EditRole) -> bool:
+        if not index.isValid() or index.column() != self.COL_ENABLE or role != Qt.ItemDataRole.CheckStateRole:
+            return False
+        row = index.row()
+        self._enabled[row] = Qt.CheckState(value) == Qt.CheckState.Checked
+        self.dataChanged.emit(index, index, [Qt.ItemDataRole.CheckStateRole])
+        return True
+
+    def flags(self, index: QModelIndex) -> Qt.ItemFlag:
+        if not index.isValid():
+            return Qt.ItemFlag.NoItemFlags
+        flags = Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+        if index.column() == self.COL_ENABLE:
+            flags |= Qt.ItemFlag.ItemIsUserCheckable
+        return flags
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            if 0 <= section < self.COLUMN_COUNT:
+                return self.COLUMNS[section]
+        return super().headerData(section, orientation, role)
+
+    # ========== 필터 관리 메서드 ==========
+
+    @staticmethod
+    def _make_bg_color(filter_data: Dict) -> Optional[QColor]:
+        """필터 색상 -> 배경색 (투명도 적용)"""
+        if not filter_data.get('color'):
+            return None
+        color = QColor(filter_data['color'])
+        color.setAlpha(70)
+        return color
+
+    def filters(self) -> List[Dict]:
+        """필터 목록 (저장용)"""
+        return self._filters
+
+    def filter_at(self, row: int) -> Optional[Dict]:
+        """특정 행의 필터"""
+        if 0 <= row < len(self._filters):
+            return self._filters[row]
+        return None
+
+    def enabled_filters(self) -> List[Dict]:
+        """체크된 필터 복사본 목록 ('enabled': True 설정)"""
+        enabled = []
+        for filter_data, is_enabled in zip(self._filters, self._enabled):
+            if is_enabled:
+                filter_copy = filter_data.copy()
+                filter_copy['enabled'] = True
+                enabled.append(filter_copy)
+        return enabled
+
+    def add_filter(self, filter_data: Dict) -> None:
+        """필터 추가 (체크된 상태)"""
+        row = len(self._filters)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._filters.append(filter_data)
+        self._enabled.append(True)
+        self._bg_colors.append(self._make_bg_color(filter_data))
+        self.endInsertRows()
+
+    def update_filter(self, row: int, filter_data: Dict) -> None:
+        """필터 수정 (체크 상태 유지)"""
+        if row < 0 or row >= len(self._filters):
+            return
+        self._filters[row] = filter_data
+        self._bg_colors[row] = self._make_bg_color(filter_data)
+        self.dataChanged.emit(self.index(row, 0), self.index(row, self.COLUMN_COUNT - 1))
+
+    def remove_filter(self, row: int) -> None:
+        """필터 삭제"""
+        if row < 0 or row >= len(self._filters):
+            return
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._filters[row]
+        del self._enabled[row]
+        del self._bg_colors[row]
+        self.endRemoveRows()
+
+    def set_filters(self, filters: List[Dict]) -> None:
+        """필터 목록 전체 교체 (모두 체크된 상태)"""
+        self.beginResetModel()
+        self._filters = list(filters)
+        self._enabled = [True] * len(self._filters)
+        self._bg_colors = [self._make_bg_color(f) for f in self._filters]
+        self.endResetModel()
+
+    def clear(self) -> None:
+        """모든 필터 삭제"""
+        self.set_filters([])
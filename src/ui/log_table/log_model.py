@@ -8,91 +8,381 @@ QTableWidget 대신 QTableView + QAbstractTableModel을 사용하여:
 - UI 블로킹 없음
 """
 import re
-from typing import Any, List, Dict, Optional, Tuple
-from PyQt6.QtCore import QAbstractTableModel, QModelIndex, Qt
+import logging
+from array import array
+from bisect import bisect_left, bisect_right
+from functools import partial
+from itertools import compress, filterfalse
+from operator import is_not, itemgetter, methodcaller
+from typing import Any, Callable, Iterable, Iterator, List, Dict, Optional, Sequence, Tuple
+from PyQt6.QtCore import QAbstractItemModel, QAbstractTableModel, QModelIndex, Qt
 from PyQt6.QtGui import QColor, QFont
 
+logger = logging.getLogger(__name__)
 
-def compute_filtered_indices_and_matches(
-    logs: List[Tuple[str, str, str, str, str]],
+# PID/TID 추출용 정규식 (모듈 로드 시 한 번만 컴파일)
+_PID_RE = re.compile(r'pid[=:](\d+)', re.IGNORECASE)
+_TID_RE = re.compile(r'tid[=:](\d+)', re.IGNORECASE)
+
+# Hyperscan (선택적): 여러 키워드 필터를 메시지 한 번 스캔으로 동시에 검사
+HYPERSCAN_AVAILABLE = False
+try:
+    import hyperscan
+    HYPERSCAN_AVAILABLE = True
+except ImportError:
+    hyperscan = None
+
+# 키워드 필터가 이 개수 이상일 때만 Hyperscan 사용 (적으면 re가 더 빠름)
+HYPERSCAN_MIN_KEYWORD_FILTERS = 4
+
+# pyahocorasick (선택적): Hyperscan이 없을 때 리터럴 키워드 필터를 Aho-Corasick 한 번 스캔으로 검사
+AHOCORASICK_AVAILABLE = False
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    ahocorasick = None
+
+# 리터럴 키워드 필터가 이 개수 이상일 때만 Aho-Corasick 사용
+AHOCORASICK_MIN_KEYWORD_FILTERS = 4
+
+
+class RowRanges:
+    """
+    필터 결과 인덱스를 연속 구간(run)으로 압축해 저장 (run-length encoding)
+    
+    "t1~t2 구간의 ERROR 로그"처럼 결과가 몇 개의 연속 구간이면 행마다 int를 두지 않고
+    구간 시작값만 저장. 행 -> 원본 인덱스는 구간 시작 행 목록(prefix)에서 bisect로 찾음.
+    list 대신 쓸 수 있도록 len / [] / append / extend / clear / iter 만 제공.
+    """
+    
+    __slots__ = ('_starts', '_prefix', '_len')
+    
+    def __init__(self, indices: Iterable[int] = ()):
+        self._starts: List[int] = []  # 각 구간의 원본 시작 인덱스
+        self._prefix: List[int] = []  # 각 구간이 시작하는 행 번호
+        self._len = 0
+        self.extend(indices)
+    
+    def __len__(self) -> int:
+        return self._len
+    
+    def __getitem__(self, row: int) -> int:
+        if row < 0:
+            row += self._len
+        if row < 0 or row >= self._len:
+            raise IndexError(row)
+        k = bisect_right(self._prefix, row) - 1
+        return self._starts[k] + (row - self._prefix[k])
+    
+    def __iter__(self) -> Iterator[int]:
+        ends = self._prefix[1:] + [self._len]
+        for start, first_row, end_row in zip(self._starts, self._prefix, ends):
+            yield from range(start, start + (end_row - first_row))
+    
+    def append(self, idx: int) -> None:
+        if self._starts and self._starts[-1] + (self._len - self._prefix[-1]) == idx:
+            self._len += 1
+            return
+        self._starts.append(idx)
+        self._prefix.append(self._len)
+        self._len += 1
+    
+    def extend(self, indices: Iterable[int]) -> None:
+        if isinstance(indices, range) and indices.step == 1:
+            if not indices:
+                return
+            self.append(indices.start)
+            self._len += len(indices) - 1
+            return
+        for idx in indices:
+            self.append(idx)
+    
+    def clear(self) -> None:
+        self._starts.clear()
+        self._prefix.clear()
+        self._len = 0
+    
+    def run_count(self) -> int:
+        """구간 개수"""
+        return len(self._starts)
+
+
+# 구간 하나당 평균 이 행 수 이상일 때만 RowRanges로 압축 (행 단위로 흩어진 결과는 int 배열로 저장)
+RLE_MIN_RUN_LENGTH = 8
+
+# 흩어진 필터 결과 저장 타입 (C int 4바이트, list[int]의 박싱된 int 대비 메모리 약 1/7)
+INDEX_TYPECODE = 'i'
+
+
+def compact_indices(indices: List[int]) -> Sequence[int]:
+    """연속 구간이 충분히 길면 RowRanges로 압축, 아니면 array('i')로 패킹해 반환"""
+    if not indices:
+        return array(INDEX_TYPECODE)
+    runs = 1
+    prev = indices[0]
+    limit = len(indices) // RLE_MIN_RUN_LENGTH
+    for idx in indices:
+        if idx != prev:
+            runs += 1
+            if runs > limit:
+                return array(INDEX_TYPECODE, indices)
+        prev = idx + 1
+    return RowRanges(indices)
+
+
+def build_keyword_scanner(
     filters: List[Dict],
-) -> Tuple[List[int], List[Optional[Dict]]]:
+) -> Optional[Tuple[Callable[[str], set], Dict[int, int]]]:
     """
-    워커 스레드에서 호출 가능. 필터 적용 결과 (filtered_indices, matched_filters) 반환.
-    메인 스레드 블로킹 없이 대량 로그 필터링용.
+    키워드 필터 전체를 하나의 Hyperscan DB로 컴파일 (호출한 스레드 전용 scratch 사용)
+    Hyperscan이 없으면 리터럴 키워드만 Aho-Corasick 오토마톤으로 대체.
+    
+    Returns:
+        (scan(message) -> 매칭된 키워드 id 집합, {id(filter): 키워드 id})
+        {id(filter): 키워드 id}에 없는 키워드 필터는 re 경로로 검사해야 함
+        사용할 라이브러리가 없거나 키워드 필터가 적거나 컴파일 실패 시 None (re 경로 사용)
     """
-    if not logs:
-        return [], []
-    pid_pattern = re.compile(r'pid[=:](\d+)', re.IGNORECASE)
-    tid_pattern = re.compile(r'tid[=:](\d+)', re.IGNORECASE)
-    regex_cache: Dict[Tuple[str, int], re.Pattern] = {}
+    if not HYPERSCAN_AVAILABLE:
+        return build_ahocorasick_scanner(filters)
+    kw_filters = [f for f in filters if f.get('fields', {}).get('keyword')]
+    if len(kw_filters) < HYPERSCAN_MIN_KEYWORD_FILTERS:
+        return None
+    
+    expressions: List[bytes] = []
+    flags: List[int] = []
+    for f in kw_filters:
+        fields = f['fields']
+        keyword = fields['keyword']
+        pattern = keyword if fields.get('keyword_regex', False) else re.escape(keyword)
+        expressions.append(pattern.encode('utf-8'))
+        flag = hyperscan.HS_FLAG_SINGLEMATCH | hyperscan.HS_FLAG_UTF8
+        if not fields.get('keyword_case_sensitive', False):
+            flag |= hyperscan.HS_FLAG_CASELESS
+        flags.append(flag)
+    
+    try:
+        db = hyperscan.Database()
+        db.compile(expressions=expressions, ids=list(range(len(expressions))),
+                   elements=len(expressions), flags=flags)
+        scratch = hyperscan.Scratch(db)
+    except Exception as e:
+        logger.warning(f"[LogTableModel] Hyperscan 컴파일 실패, re 사용: {e}")
+        return None
+    
+    def scan(message: str) -> set:
+        hits: set = set()
+        
+        def on_match(kw_id, start, end, match_flags, context):
+            hits.add(kw_id)
+        
+        db.scan(message.encode('utf-8'), match_event_handler=on_match, scratch=scratch)
+        return hits
+    
+    return scan, {id(f): kw_id for kw_id, f in enumerate(kw_filters)}
 
-    def get_regex(pattern: str, flags: int = 0) -> Optional[re.Pattern]:
-        key = (pattern, flags)
-        if key not in regex_cache:
-            try:
-                regex_cache[key] = re.compile(pattern, flags)
-            except Exception:
-                return None
-        return regex_cache[key]
 
-    def match_filter(f: Dict, log_data: Tuple[str, str, str, str, str]) -> bool:
-        _, level, _, tag, message = log_data
+def build_ahocorasick_scanner(
+    filters: List[Dict],
+) -> Optional[Tuple[Callable[[str], set], Dict[int, int]]]:
+    """
+    리터럴(정규식 아님) 키워드 필터를 Aho-Corasick 오토마톤으로 컴파일
+    
+    대소문자 구분 키워드는 원문, 무시 키워드는 소문자 메시지를 스캔 (각각 오토마톤 하나).
+    메시지당 한 번 스캔으로 키워드 개수와 무관하게 매칭된 필터 id를 모두 얻음.
+    """
+    if not AHOCORASICK_AVAILABLE:
+        return None
+    kw_filters = [
+        f for f in filters
+        if f.get('fields', {}).get('keyword') and not f['fields'].get('keyword_regex', False)
+    ]
+    if len(kw_filters) < AHOCORASICK_MIN_KEYWORD_FILTERS:
+        return None
+    
+    # 키워드 -> 키워드 id 목록 (같은 키워드를 쓰는 필터가 여럿일 수 있음)
+    sensitive_words: Dict[str, List[int]] = {}
+    insensitive_words: Dict[str, List[int]] = {}
+    for kw_id, f in enumerate(kw_filters):
+        fields = f['fields']
+        if fields.get('keyword_case_sensitive', False):
+            sensitive_words.setdefault(fields['keyword'], []).append(kw_id)
+        else:
+            insensitive_words.setdefault(fields['keyword'].lower(), []).append(kw_id)
+    
+    def make_automaton(words: Dict[str, List[int]]):
+        if not words:
+            return None
+        automaton = ahocorasick.Automaton()
+        for word, ids in words.items():
+            automaton.add_word(word, tuple(ids))
+        automaton.make_automaton()
+        return automaton
+    
+    try:
+        sensitive = make_automaton(sensitive_words)
+        insensitive = make_automaton(insensitive_words)
+    except Exception as e:
+        logger.warning(f"[LogTableModel] Aho-Corasick 오토마톤 생성 실패, re 사용: {e}")
+        return None
+    
+    def scan(message: str) -> set:
+        hits: set = set()
+        if sensitive is not None:
+            for _, ids in sensitive.iter(message):
+                hits.update(ids)
+        if insensitive is not None:
+            for _, ids in insensitive.iter(message.lower()):
+                hits.update(ids)
+        return hits
+    
+    return scan, {id(f): kw_id for kw_id, f in enumerate(kw_filters)}
+
+
+def _narrow(cand: List[int], column: List[Any], pred: Callable[[Any], Any]) -> List[int]:
+    """cand 행 중 column 값이 pred를 만족하는 행만 남김 (map/compress로 C 레벨 순회)"""
+    return list(compress(cand, map(pred, map(column.__getitem__, cand))))
+
+
+def extend_log_columns(columns: Dict[str, List[Any]], logs: List[Tuple[str, str, str, str, str]]) -> None:
+    """
+    컬럼(SoA) 캐시의 각 컬럼을 logs 길이까지 채움 (이미 만들어진 컬럼만, 새 행만 추가)
+    
+    컬럼: 'level'(대문자), 'tag', 'tag_lower', 'message'
+    """
+    # 태그는 종류가 적으므로 고유 태그당 한 번만 lower
+    tag_lower_memo: Dict[str, str] = {}
+    
+    def tag_lower(tag: str) -> str:
+        value = tag_lower_memo.get(tag)
+        if value is None:
+            value = tag_lower_memo[tag] = tag.lower()
+        return value
+    
+    n = len(logs)
+    for name, col in columns.items():
+        start = len(col)
+        if start >= n:
+            continue
+        rows = logs[start:] if start else logs
+        if name == 'level':
+            col.extend(map(str.upper, map(itemgetter(1), rows)))
+        elif name == 'tag':
+            col.extend(map(itemgetter(3), rows))
+        elif name == 'tag_lower':
+            col.extend(map(tag_lower, map(itemgetter(3), rows)))
+        elif name == 'message':
+            col.extend(map(itemgetter(4), rows))
+
+
+def filter_rows_by_columns(
+    logs: List[Tuple[str, str, str, str, str]],
+    show_filters: List[Dict],
+    ignore_filters: List[Dict],
+    columns: Optional[Dict[str, List[Any]]] = None,
+) -> Tuple[List[int], List[Optional[Dict]]]:
+    """
+    컬럼 단위(SoA) 필터 평가 -> (filtered_indices, matched_filters)
+    
+    행마다 필터 dict를 순회하지 않고, 필터마다 조건 하나씩 후보 행 목록을 줄여 나감.
+    레벨/태그/메시지 컬럼은 필요할 때 한 번만 만들고, 각 조건은 바운드 메서드(C 함수)로 평가.
+    
+    Args:
+        columns: 호출 간 유지하는 컬럼 캐시 (extend_log_columns로 logs와 길이를 맞춘 상태).
+                 없으면 이번 호출에서만 만들어 씀
+    """
+    n = len(logs)
+    scanner = build_keyword_scanner(ignore_filters + show_filters)
+    scan, kw_ids = scanner if scanner else (None, {})
+    pid_search = _PID_RE.search
+    tid_search = _TID_RE.search
+    
+    # 컬럼 캐시 (필요한 컬럼만 지연 생성)
+    if columns is None:
+        columns = {}
+    kw_hits: List[Optional[set]] = [None]  # 키워드 스캔 결과는 필터 구성에 따라 달라 이번 호출에서만 사용
+    
+    def column(name: str) -> List[Any]:
+        if name == 'kw_hits':
+            if kw_hits[0] is None:
+                kw_hits[0] = list(map(scan, column('message')))
+            return kw_hits[0]
+        col = columns.get(name)
+        if col is None:
+            col = columns[name] = []
+            extend_log_columns({name: col}, logs)
+        return col
+    
+    def id_equals(search: Callable, value: str) -> Callable[[str], bool]:
+        def pred(message: str) -> bool:
+            m = search(message)
+            return (m.group(1) if m else '-') == value
+        return pred
+    
+    def match_rows(f: Dict, cand: List[int]) -> List[int]:
         fields = f.get('fields', {})
-        if fields.get('level') and level.upper() != fields['level'].upper():
-            return False
-        if fields.get('pid'):
-            m = pid_pattern.search(message)
-            if (m.group(1) if m else '-') != fields['pid']:
-                return False
-        if fields.get('tid'):
-            m = tid_pattern.search(message)
-            if (m.group(1) if m else '-') != fields['tid']:
-                return False
-        if fields.get('tag'):
+        if fields.get('level'):
+            cand = _narrow(cand, column('level'), fields['level'].upper().__eq__)
+        if cand and fields.get('tag'):
             tag_val = fields['tag']
             if fields.get('tag_case_sensitive', False):
-                if tag_val not in tag:
-                    return False
-            elif tag_val.lower() not in tag.lower():
-                return False
-        if fields.get('keyword'):
+                cand = _narrow(cand, column('tag'), re.compile(re.escape(tag_val)).search)
+            else:
+                cand = _narrow(cand, column('tag_lower'), re.compile(re.escape(tag_val.lower())).search)
+        if cand and fields.get('keyword'):
             kw = fields['keyword']
-            if fields.get('keyword_regex', False):
-                rx = get_regex(kw, 0 if fields.get('keyword_case_sensitive', False) else re.IGNORECASE)
-                if not rx or not rx.search(message):
-                    return False
+            kw_id = kw_ids.get(id(f))
+            if kw_id is not None:
+                cand = _narrow(cand, column('kw_hits'), methodcaller('__contains__', kw_id))
             else:
-                if fields.get('keyword_case_sensitive', False):
-                    if kw not in message:
-                        return False
-                elif kw.lower() not in message.lower():
-                    return False
-        return True
-
-    def evaluate_log(log_data: Tuple[str, str, str, str, str]) -> Optional[Dict]:
-        if not filters:
-            return None
-        show_filters = [f for f in filters if f.get('enabled', True) and f.get('type', 'Show') == 'Show']
-        ignore_filters = [f for f in filters if f.get('enabled', True) and f.get('type', 'Show') == 'Ignore']
+                if '_compiled_kw' in f:
+                    rx = f['_compiled_kw']
+                else:
+                    case_sensitive = fields.get('keyword_case_sensitive', False)
+                    try:
+                        rx = re.compile(
+                            kw if fields.get('keyword_regex', False) else re.escape(kw),
+                            0 if case_sensitive else re.IGNORECASE,
+                        )
+                    except re.error:
+                        rx = None
+                if rx is None:
+                    return []
+                cand = _narrow(cand, column('message'), rx.search)
+        if cand and fields.get('pid'):
+            cand = _narrow(cand, column('message'), id_equals(pid_search, fields['pid']))
+        if cand and fields.get('tid'):
+            cand = _narrow(cand, column('message'), id_equals(tid_search, fields['tid']))
+        return cand
+    
+    # 1) Ignore: 하나라도 매치한 행 제외
+    alive: List[int] = list(range(n))
+    if ignore_filters:
+        ignored: set = set()
         for f in ignore_filters:
-            if match_filter(f, log_data):
-                return False
-        if show_filters:
-            for f in show_filters:
-                if match_filter(f, log_data):
-                    return f
-            return False
-        return None
-
-    filtered_indices: List[int] = []
-    matched_filters: List[Optional[Dict]] = []
-    for i, log_data in enumerate(logs):
-        matched = evaluate_log(log_data)
-        if matched is not False:
-            filtered_indices.append(i)
-            matched_filters.append(matched)
-    return filtered_indices, matched_filters
+            ignored.update(match_rows(f, alive))
+        if ignored:
+            alive = list(filterfalse(ignored.__contains__, alive))
+    
+    if not show_filters:
+        return alive, [None] * len(alive)
+    
+    # 2) Show: 앞 필터부터 매치한 행에 할당, 남은 행만 다음 필터로
+    shown: List[Optional[Dict]] = [None] * n
+    remaining = alive
+    for f in show_filters:
+        if not remaining:
+            break
+        hits = match_rows(f, remaining)
+        if not hits:
+            continue
+        for i in hits:
+            shown[i] = f
+        hit_set = set(hits)
+        remaining = list(filterfalse(hit_set.__contains__, remaining))
+    
+    filtered_indices = list(compress(range(n), map(partial(is_not, None), shown)))
+    return filtered_indices, list(filter(None, shown))
 
 
 class LogTableModel(QAbstractTableModel):
@@ -116,14 +406,17 @@ class LogTableModel(QAbstractTableModel):
     COL_TAG = 5
     COL_MESSAGE = 6
     
+    # 필터 재적용 시 변경 구간이 이보다 많으면 증분 알림 대신 전체 리셋
+    MAX_INCREMENTAL_RUNS = 256
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         
         # 모든 로그 데이터 (튜플: timestamp, level, display, tag, message)
         self._all_logs: List[Tuple[str, str, str, str, str]] = []
         
-        # 필터링된 로그 인덱스 (all_logs의 인덱스를 저장)
-        self._filtered_indices: List[int] = []
+        # 필터링된 로그 인덱스 (all_logs의 인덱스를 저장, 연속 구간이 길면 RowRanges)
+        self._filtered_indices: Sequence[int] = RowRanges()
         
         # 필터링된 로그에 매칭된 필터 정보 (색상용)
         self._matched_filters: List[Optional[Dict]] = []
@@ -131,12 +424,25 @@ class LogTableModel(QAbstractTableModel):
         # 필터 목록
         self._filters: List[Dict] = []
         
-        # 정규식 캐시
-        self._regex_cache: Dict[Tuple[str, int], re.Pattern] = {}
+        # 활성 Show/Ignore 필터 (set_filters에서 한 번만 분류)
+        self._show_filters: List[Dict] = []
+        self._ignore_filters: List[Dict] = []
+        
+        # Hyperscan 키워드 스캐너 (사용 불가/필터 적음이면 None)
+        self._kw_scan: Optional[Callable[[str], set]] = None
+        self._kw_ids: Dict[int, int] = {}
+        
+        # 대소문자 무시 태그 매칭용 소문자 bytes 캐시 (_all_logs와 같은 인덱스, 필요할 때만 채움)
+        self._tag_bytes_lower: List[bytes] = []
+        self._tag_lower_memo: Dict[str, bytes] = {}  # 태그 -> 소문자 bytes (고유 태그당 한 번만 계산, 행끼리 공유)
+        self._needs_lower_cache = False
         
-        # PID/TID 추출용 정규식 (미리 컴파일)
-        self._pid_pattern = re.compile(r'pid[=:](\d+)', re.IGNORECASE)
-        self._tid_pattern = re.compile(r'tid[=:](\d+)', re.IGNORECASE)
+        # 필터 재적용용 컬럼(SoA) 캐시 (필터가 쓴 컬럼만 생성, 이후 새 로그만 이어 붙임)
+        self._columns: Dict[str, List[Any]] = {}
+        
+        # PID/TID 추출용 정규식 (모듈 레벨 패턴 공유)
+        self._pid_pattern = _PID_RE
+        self._tid_pattern = _TID_RE
         
         # 폰트 캐시
         self._default_font = QFont("Consolas", 9)
@@ -151,6 +457,17 @@ class LogTableModel(QAbstractTableModel):
             'V': (QColor(200, 200, 200), None),  # Verbose
             '-': (QColor(150, 150, 150), None),  # Unknown
         }
+        # 레벨 첫 글자 코드(0~255) -> 전경/배경색 평면 테이블 (셀당 인덱싱 한 번)
+        default_fg, default_bg = self._level_colors['-']
+        self._level_fg_table: List[QColor] = [default_fg] * 256
+        self._level_bg_table: List[Optional[QColor]] = [default_bg] * 256
+        for key, (fg, bg) in self._level_colors.items():
+            for ch in {key, key.lower()}:
+                self._level_fg_table[ord(ch)] = fg
+                self._level_bg_table[ord(ch)] = bg
+        
+        # data() 디스패치 테이블 ((role, col) -> 핸들러)
+        self._dispatch = self._build_dispatch()
     
     def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
         """필터링된 로그 개수 반환"""
@@ -170,82 +487,98 @@ class LogTableModel(QAbstractTableModel):
         
         뷰가 화면에 표시할 셀을 요청할 때만 호출됨.
         100만 개 로그여도 화면에 보이는 셀만 이 메서드가 호출됨.
+        (role, col) 디스패치 테이블로 셀당 분기를 딕셔너리 조회 한 번으로 줄임.
         """
-        if not index.isValid():
+        fn = self._dispatch.get((role, index.column()))
+        if fn is None or not index.isValid():
             return None
         
         row = index.row()
-        col = index.column()
-        
         if row < 0 or row >= len(self._filtered_indices):
             return None
-        
-        # 원본 데이터 인덱스
-        original_idx = self._filtered_indices[row]
-        log_data = self._all_logs[original_idx]
-        timestamp, level, display, tag, message = log_data
-        
-        # 매칭된 필터 (색상용)
-        matched_filter = self._matched_filters[row] if row < len(self._matched_filters) else None
-        
-        if role == Qt.ItemDataRole.DisplayRole:
-            # 실제 표시 데이터
-            if col == self.COL_TIME:
-                return timestamp
-            elif col == self.COL_LEVEL:
-                return level
-            elif col == self.COL_PID:
-                match = self._pid_pattern.search(message)
-                return match.group(1) if match else "-"
-            elif col == self.COL_TID:
-                match = self._tid_pattern.search(message)
-                return match.group(1) if match else "-"
-            elif col == self.COL_DISPLAY:
-                return display
-            elif col == self.COL_TAG:
-                return tag
-            elif col == self.COL_MESSAGE:
-                return message
-        
-        elif role == Qt.ItemDataRole.FontRole:
-            # 폰트 설정
-            if col == self.COL_LEVEL:
-                return self._bold_font
-            return self._default_font
-        
-        elif role == Qt.ItemDataRole.ForegroundRole:
-            # 전경색 (텍스트 색상)
-            if col == self.COL_LEVEL:
-                level_upper = level.upper() if level else '-'
-                level_key = level_upper[0] if level_upper else '-'
-                colors = self._level_colors.get(level_key, self._level_colors['-'])
-                return colors[0]
-        
-        elif role == Qt.ItemDataRole.BackgroundRole:
-            # 배경색
-            # 필터 매칭된 경우 필터 색상 적용
-            if matched_filter and matched_filter.get('color'):
-                try:
-                    bg_color = QColor(matched_filter['color'])
-                    bg_color.setAlpha(70)
-                    return bg_color
-                except:
-                    pass
-            
-            # 레벨 배경색 (Error, Warning)
-            if col == self.COL_LEVEL:
-                level_upper = level.upper() if level else '-'
-                level_key = level_upper[0] if level_upper else '-'
-                colors = self._level_colors.get(level_key, self._level_colors['-'])
-                return colors[1]
-        
-        elif role == Qt.ItemDataRole.TextAlignmentRole:
-            # 텍스트 정렬
-            if col == self.COL_LEVEL:
-                return Qt.AlignmentFlag.AlignCenter
-            return Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter
-        
-        return None
+        return fn(row)
+    
+    # ========== data() 디스패치 핸들러 ==========
+    
+    def _build_dispatch(self) -> Dict[Tuple[Any, int], Callable[[int], Any]]:
+        """(role, col) -> 핸들러 테이블 생성"""
+        display = Qt.ItemDataRole.DisplayRole
+        dispatch: Dict[Tuple[Any, int], Callable[[int], Any]] = {
+            (display, self.COL_TIME): self._d_time,
+            (display, self.COL_LEVEL): self._d_level,
+            (display, self.COL_PID): self._d_pid,
+            (display, self.COL_TID): self._d_tid,
+            (display, self.COL_DISPLAY): self._d_display,
+            (display, self.COL_TAG): self._d_tag,
+            (display, self.COL_MESSAGE): self._d_message,
+            (Qt.ItemDataRole.ForegroundRole, self.COL_LEVEL): self._d_level_foreground,
+        }
+        for col in range(self.COLUMN_COUNT):
+            is_level = col == self.COL_LEVEL
+            dispatch[(Qt.ItemDataRole.FontRole, col)] = self._d_bold_font if is_level else self._d_default_font
+            dispatch[(Qt.ItemDataRole.TextAlignmentRole, col)] = (
+                self._d_align_center if is_level else self._d_align_left
+            )
+            dispatch[(Qt.ItemDataRole.BackgroundRole, col)] = (
+                self._d_level_background if is_level else self._d_filter_background
+            )
+        return dispatch
+    
+    def _d_time(self, row: int) -> str:
+        return self._all_logs[self._filtered_indices[row]][0]
+    
+    def _d_level(self, row: int) -> str:
+        return self._all_logs[self._filtered_indices[row]][1]
+    
+    def _d_display(self, row: int) -> str:
+        return self._all_logs[self._filtered_indices[row]][2]
+    
+    def _d_tag(self, row: int) -> str:
+        return self._all_logs[self._filtered_indices[row]][3]
+    
+    def _d_message(self, row: int) -> str:
+        return self._all_logs[self._filtered_indices[row]][4]
+    
+    def _d_pid(self, row: int) -> str:
+        match = self._pid_pattern.search(self._all_logs[self._filtered_indices[row]][4])
+        return match.group(1) if match else "-"
+    
+    def _d_tid(self, row: int) -> str:
+        match = self._tid_pattern.search(self._all_logs[self._filtered_indices[row]][4])
+        return match.group(1) if match else "-"
+    
+    def _d_default_font(self, row: int) -> QFont:
+        return self._default_font
+    
+    def _d_bold_font(self, row: int) -> QFont:
+        return self._bold_font
+    
+    def _d_align_center(self, row: int) -> Qt.AlignmentFlag:
+        return Qt.AlignmentFlag.AlignCenter
+    
+    def _d_align_left(self, row: int) -> Qt.AlignmentFlag:
+        return Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter
+    
+    def _level_code_at(self, row: int) -> int:
+        """레벨 첫 글자 코드 (테이블 범위 밖이면 '-')"""
+        level = self._all_logs[self._filtered_indices[row]][1]
+        code = ord(level[0]) if level else 45
+        return code if code < 256 else 45
+    
+    def _d_level_foreground(self, row: int) -> QColor:
+        return self._level_fg_table[self._level_code_at(row)]
+    
+    def _d_filter_background(self, row: int) -> Optional[QColor]:
+        """매칭된 필터 배경색 (set_filters에서 미리 만든 QColor 반환, 색상 없는 필터는 None)"""
+        matched_filter = self._matched_filters[row]
+        return matched_filter and matched_filter['_bg_qcolor']
+    
+    def _d_level_background(self, row: int) -> Optional[QColor]:
+        # 필터 색상 우선, 없으면 레벨 배경색 (Error, Warning)
+        bg_color = self._d_filter_background(row)
+        if bg_color is not None:
+            return bg_color
+        return self._level_bg_table[self._level_code_at(row)]
     
     def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
         """헤더 데이터 반환"""
@@ -257,18 +590,34 @@ class LogTableModel(QAbstractTableModel):
     
     # ========== 데이터 관리 메서드 ==========
     
-    def add_logs(self, logs: List[Tuple[str, str, str, str, str]]) -> None:
+    def add_logs(self, logs: List[Tuple[str, str, str, str, str]]) -> int:
         """
         로그 배치 추가 (고성능)
         
         Args:
             logs: 로그 튜플 리스트 [(timestamp, level, display, tag, message), ...]
+        
+        Returns:
+            화면에 추가된 행 수 (필터 통과한 로그 수)
         """
         if not logs:
-            return
+            return 0
         
         start_idx = len(self._all_logs)
+        
+        if not self._show_filters and not self._ignore_filters:
+            # 활성 필터 없음 (기본 상태): 평가 없이 그대로 추가
+            first_new_row = len(self._filtered_indices)
+            self.beginInsertRows(QModelIndex(), first_new_row, first_new_row + len(logs) - 1)
+            self._all_logs.extend(logs)
+            self._filtered_indices.extend(range(start_idx, start_idx + len(logs)))
+            self._matched_filters.extend([None] * len(logs))
+            self.endInsertRows()
+            return len(logs)
+        
         self._all_logs.extend(logs)
+        if self._needs_lower_cache:
+            self._ensure_lower_cache()
         
         # 새 로그에 대해 필터링 적용
         new_filtered = []
@@ -276,7 +625,7 @@ class LogTableModel(QAbstractTableModel):
         
         for i, log_data in enumerate(logs):
             original_idx = start_idx + i
-            matched_filter = self._evaluate_log(log_data)
+            matched_filter = self._evaluate_log(log_data, original_idx)
             
             if matched_filter is not False:
                 new_filtered.append(original_idx)
@@ -291,10 +640,8 @@ class LogTableModel(QAbstractTableModel):
             self._filtered_indices.extend(new_filtered)
             self._matched_filters.extend(new_matched)
             self.endInsertRows()
-    
-    def add_log(self, log_data: Tuple[str, str, str, str, str]) -> None:
-        """단일 로그 추가"""
-        self.add_logs([log_data])
+        
+        return len(new_filtered)
     
     def set_filters(self, filters: List[Dict]) -> None:
         """
@@ -304,26 +651,203 @@ class LogTableModel(QAbstractTableModel):
             filters: 필터 딕셔너리 리스트
         """
         self._filters = filters
+        self._show_filters = [f for f in filters if f.get('enabled', True) and f.get('type', 'Show') == 'Show']
+        self._ignore_filters = [f for f in filters if f.get('enabled', True) and f.get('type', 'Show') == 'Ignore']
+        needs_lower_cache = False
+        for f in filters:
+            f['_bg_qcolor'] = self._make_bg_color(f.get('color'))
+            fields = f.get('fields', {})
+            # 소문자 태그는 필터 설정 시 한 번만 인코딩
+            if fields.get('tag') and not fields.get('tag_case_sensitive', False):
+                f['_tag_bytes_lower'] = fields['tag'].lower().encode('utf-8')
+                needs_lower_cache = True
+            keyword = fields.get('keyword')
+            if keyword:
+                # 필터마다 정규식은 하나뿐이므로 필터 dict에 직접 컴파일해 둠
+                # (대소문자 무시 일반 키워드도 re.escape 후 IGNORECASE로 컴파일 -> lower() 할당 없음)
+                is_regex = fields.get('keyword_regex', False)
+                case_sensitive = fields.get('keyword_case_sensitive', False)
+                if is_regex or not case_sensitive:
+                    flags = 0 if case_sensitive else re.IGNORECASE
+                    try:
+                        f['_compiled_kw'] = re.compile(keyword if is_regex else re.escape(keyword), flags)
+                    except re.error as e:
+                        logger.warning(f"[LogTableModel] 잘못된 정규식 필터 '{keyword}': {e}")
+                        f['_compiled_kw'] = None
+        scanner = build_keyword_scanner(self._ignore_filters + self._show_filters)
+        self._kw_scan, self._kw_ids = scanner if scanner else (None, {})
+        self._needs_lower_cache = needs_lower_cache
+        if needs_lower_cache:
+            self._ensure_lower_cache()
         self._reapply_filters()
     
+    def _ensure_lower_cache(self) -> None:
+        """소문자 태그 bytes 캐시를 _all_logs 길이까지 채움 (로그당 한 번만 lower/encode)"""
+        start = len(self._tag_bytes_lower)
+        if start >= len(self._all_logs):
+            return
+        memo = self._tag_lower_memo
+        
+        def lower_bytes(tag: str) -> bytes:
+            value = memo.get(tag)
+            if value is None:
+                value = memo[tag] = tag.lower().encode('utf-8')
+            return value
+        
+        self._tag_bytes_lower.extend(map(lower_bytes, map(itemgetter(3), self._all_logs[start:])))
+    
+    @staticmethod
+    def _make_bg_color(color: Optional[str]) -> Optional[QColor]:
+        """필터 색상 문자열 -> 배경용 QColor (alpha 70)"""
+        if not color:
+            return None
+        try:
+            bg_color = QColor(color)
+            bg_color.setAlpha(70)
+            return bg_color
+        except:
+            return None
+    
     def _reapply_filters(self) -> None:
-        """모든 로그에 필터 재적용"""
-        self.beginResetModel()
+        """
+        모든 로그에 필터 재적용
         
-        self._filtered_indices.clear()
-        self._matched_filters.clear()
+        이전 결과와 비교해 바뀐 구간만 remove/insert/dataChanged로 알림.
+        (beginResetModel을 피해서 선택/스크롤 위치 유지)
+        변경 구간이 너무 많으면 layoutChanged 한 번으로 교체 (_relayout).
+        """
+        if not self._show_filters and not self._ignore_filters:
+            # 활성 필터 없음: 전체 로그가 하나의 구간
+            new_indices: Sequence[int] = range(len(self._all_logs))
+            new_matched: List[Optional[Dict]] = [None] * len(self._all_logs)
+        else:
+            extend_log_columns(self._columns, self._all_logs)
+            new_indices, new_matched = filter_rows_by_columns(
+                self._all_logs, self._show_filters, self._ignore_filters, self._columns
+            )
+        
+        old_indices = list(self._filtered_indices)
+        removed_rows, added_rows = self._diff_sorted(old_indices, new_indices)
+        removed_runs = self._to_runs(removed_rows)
+        added_runs = self._to_runs(added_rows)
+        
+        if not old_indices:
+            self.beginResetModel()
+            self._filtered_indices = compact_indices(list(new_indices))
+            self._matched_filters = new_matched
+            self.endResetModel()
+            return
         
-        for idx, log_data in enumerate(self._all_logs):
-            matched_filter = self._evaluate_log(log_data)
-            if matched_filter is not False:
-                self._filtered_indices.append(idx)
-                self._matched_filters.append(matched_filter)
+        if len(removed_runs) + len(added_runs) > self.MAX_INCREMENTAL_RUNS:
+            self._relayout(compact_indices(list(new_indices)), new_matched)
+            return
         
-        self.endResetModel()
+        # 1) 제거: 뒤쪽 구간부터 지워야 앞쪽 행 번호가 유지됨
+        indices = old_indices
+        matched = list(self._matched_filters)
+        self._filtered_indices = indices
+        self._matched_filters = matched
+        for first, last in reversed(removed_runs):
+            self.beginRemoveRows(QModelIndex(), first, last)
+            del indices[first:last + 1]
+            del matched[first:last + 1]
+            self.endRemoveRows()
+        
+        # 2) 삽입: 앞쪽부터 넣으면 새 결과의 행 번호가 그대로 삽입 위치
+        for first, last in added_runs:
+            self.beginInsertRows(QModelIndex(), first, last)
+            indices[first:first] = new_indices[first:last + 1]
+            matched[first:first] = new_matched[first:last + 1]
+            self.endInsertRows()
+        
+        # 3) 유지된 행 중 필터 색상이 바뀐 행만 dataChanged
+        changed_rows = [
+            row for row, (old_m, new_m) in enumerate(zip(matched, new_matched))
+            if (old_m.get('color') if old_m else None) != (new_m.get('color') if new_m else None)
+        ]
+        self._matched_filters = new_matched
+        self._filtered_indices = compact_indices(indices)
+        last_col = self.COLUMN_COUNT - 1
+        for first, last in self._to_runs(changed_rows):
+            self.dataChanged.emit(
+                self.index(first, 0), self.index(last, last_col),
+                [Qt.ItemDataRole.BackgroundRole]
+            )
+    
+    @staticmethod
+    def _diff_sorted(old: Sequence[int], new: Sequence[int]) -> Tuple[List[int], List[int]]:
+        """
+        정렬된 두 인덱스 목록 비교
+        
+        Returns:
+            (old에서 빠진 행 번호 목록, new에서 새로 생긴 행 번호 목록)
+        """
+        removed: List[int] = []
+        added: List[int] = []
+        i = j = 0
+        old_len, new_len = len(old), len(new)
+        while i < old_len and j < new_len:
+            a, b = old[i], new[j]
+            if a == b:
+                i += 1
+                j += 1
+            elif a < b:
+                removed.append(i)
+                i += 1
+            else:
+                added.append(j)
+                j += 1
+        removed.extend(range(i, old_len))
+        added.extend(range(j, new_len))
+        return removed, added
+    
+    @staticmethod
+    def _to_runs(rows: List[int]) -> List[Tuple[int, int]]:
+        """정렬된 행 번호 -> 연속 구간 [(first, last), ...]"""
+        runs: List[Tuple[int, int]] = []
+        if not rows:
+            return runs
+        first = prev = rows[0]
+        for row in rows[1:]:
+            if row != prev + 1:
+                runs.append((first, prev))
+                first = row
+            prev = row
+        runs.append((first, prev))
+        return runs
+    
+    def _relayout(self, new_indices: Sequence[int], new_matched: List[Optional[Dict]]) -> None:
+        """
+        필터 결과 전체 교체 (layoutChanged + VerticalSortHint)
+        
+        beginResetModel과 달리 영속 인덱스(선택/현재 행)를 같은 로그의 새 행으로 옮겨 줌.
+        행 순서는 항상 _all_logs 순서이므로 새 행 위치는 bisect로 찾음.
+        """
+        hint = QAbstractItemModel.LayoutChangeHint.VerticalSortHint
+        self.layoutAboutToBeChanged.emit([], hint)
+        
+        old_indices = self._filtered_indices
+        self._filtered_indices = new_indices
+        self._matched_filters = new_matched
+        
+        persistent = self.persistentIndexList()
+        if persistent:
+            new_count = len(new_indices)
+            moved = []
+            for index in persistent:
+                log_idx = old_indices[index.row()]
+                row = bisect_left(new_indices, log_idx)
+                if row < new_count and new_indices[row] == log_idx:
+                    moved.append(self.index(row, index.column()))
+                else:
+                    moved.append(QModelIndex())
+            self.changePersistentIndexList(persistent, moved)
+        
+        self.layoutChanged.emit([], hint)
     
-    def _evaluate_log(self, log_data: Tuple[str, str, str, str, str]) -> Optional[Dict]:
+    def _evaluate_log(self, log_data: Tuple[str, str, str, str, str], idx: int) -> Optional[Dict]:
         """
-        로그가 필터를 통과하는지 평가
+        로그가 필터를 통과하는지 평가 (idx: _all_logs 인덱스)
         
         Returns:
             - False: 필터에 의해 제외됨
@@ -333,26 +857,31 @@ class LogTableModel(QAbstractTableModel):
         if not self._filters:
             return None
         
-        # 활성화된 필터 분류
-        show_filters = [f for f in self._filters if f.get('enabled', True) and f.get('type', 'Show') == 'Show']
-        ignore_filters = [f for f in self._filters if f.get('enabled', True) and f.get('type', 'Show') == 'Ignore']
+        kw_hits = self._kw_scan(log_data[4]) if self._kw_scan else None
         
         # Ignore 필터 체크 (하나라도 매치하면 제외)
-        for f in ignore_filters:
-            if self._match_filter(f, log_data):
+        for f in self._ignore_filters:
+            if self._match_filter(f, log_data, idx, kw_hits):
                 return False
         
         # Show 필터 체크
+        show_filters = self._show_filters
         if show_filters:
             for f in show_filters:
-                if self._match_filter(f, log_data):
+                if self._match_filter(f, log_data, idx, kw_hits):
                     return f
             return False  # Show 필터가 있는데 매치 안 됨
         
         return None  # 필터 없이 통과
     
-    def _match_filter(self, filter_data: Dict, log_data: Tuple[str, str, str, str, str]) -> bool:
-        """단일 필터 매칭 평가"""
+    def _match_filter(
+        self,
+        filter_data: Dict,
+        log_data: Tuple[str, str, str, str, str],
+        idx: int,
+        kw_hits: Optional[set] = None,
+    ) -> bool:
+        """단일 필터 매칭 평가 (kw_hits: Hyperscan으로 미리 스캔한 키워드 id 집합)"""
         timestamp, level, display, tag, message = log_data
         fields = filter_data.get('fields', {})
         
@@ -383,75 +912,40 @@ class LogTableModel(QAbstractTableModel):
                 if tag_value not in tag:
                     return False
             else:
-                if tag_value.lower() not in tag.lower():
+                if self._tag_bytes_lower[idx].find(filter_data['_tag_bytes_lower']) == -1:
                     return False
         
         # Keyword (Message)
         if fields.get('keyword'):
-            keyword = fields['keyword']
-            is_regex = fields.get('keyword_regex', False)
-            case_sensitive = fields.get('keyword_case_sensitive', False)
-            
-            if is_regex:
-                flags = 0 if case_sensitive else re.IGNORECASE
-                regex = self._get_compiled_regex(keyword, flags)
-                if regex:
-                    if not regex.search(message):
-                        return False
-                else:
+            kw_id = self._kw_ids.get(id(filter_data)) if kw_hits is not None else None
+            if kw_id is not None:
+                if kw_id not in kw_hits:
+                    return False
+            elif not fields.get('keyword_regex', False) and fields.get('keyword_case_sensitive', False):
+                if fields['keyword'] not in message:
                     return False
             else:
-                if case_sensitive:
-                    if keyword not in message:
-                        return False
-                else:
-                    if keyword.lower() not in message.lower():
-                        return False
+                # 정규식 / 대소문자 무시 키워드 모두 set_filters에서 컴파일한 패턴 사용
+                regex = filter_data.get('_compiled_kw')
+                if regex is None or not regex.search(message):
+                    return False
         
         return True
     
-    def _get_compiled_regex(self, pattern: str, flags: int = 0) -> Optional[re.Pattern]:
-        """컴파일된 정규식 가져오기 (캐싱)"""
-        cache_key = (pattern, flags)
-        if cache_key not in self._regex_cache:
-            try:
-                self._regex_cache[cache_key] = re.compile(pattern, flags)
-            except:
-                return None
-        return self._regex_cache[cache_key]
-    
     def clear(self) -> None:
         """모든 데이터 초기화"""
         self.beginResetModel()
         self._all_logs.clear()
-        self._filtered_indices.clear()
+        self._filtered_indices = RowRanges()
         self._matched_filters.clear()
-        self._regex_cache.clear()
+        self._tag_bytes_lower.clear()
+        self._columns = {}
         self.endResetModel()
     
     def get_all_logs(self) -> List[Tuple[str, str, str, str, str]]:
         """모든 로그 데이터 반환"""
         return self._all_logs
 
-    def get_filters(self) -> List[Dict]:
-        """현재 필터 목록 (워커에서 필터 계산 시 사용)"""
-        return self._filters
-
-    def set_prepared_data(
-        self,
-        all_logs: List[Tuple[str, str, str, str, str]],
-        filtered_indices: List[int],
-        matched_filters: List[Optional[Dict]],
-    ) -> None:
-        """
-        워커에서 미리 계산한 데이터로 한 번에 설정. 메인 스레드에서만 호출.
-        """
-        self.beginResetModel()
-        self._all_logs = all_logs
-        self._filtered_indices = filtered_indices
-        self._matched_filters = matched_filters
-        self.endResetModel()
-
     def get_filtered_count(self) -> int:
         """필터링된 로그 개수"""
         return len(self._filtered_indices)
@@ -6,33 +6,43 @@ QTableView + QAbstractTableModel 기반 가상화 테이블
 - 100만 개 로그도 빠르게 표시
 - UI 블로킹 없음
 """
-import re
+import json
 import time
-import os
-import threading
 from PyQt6.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QTableWidget, QTableWidgetItem,
+    QWidget, QVBoxLayout, QHBoxLayout,
     QTableView, QHeaderView, QAbstractItemView,
     QGroupBox, QPushButton, QCheckBox, QFileDialog, QMessageBox, QMenu,
-    QRadioButton, QLineEdit, QComboBox, QLabel, QGridLayout, QDialog
+    QGridLayout, QDialog
 )
 from PyQt6.QtCore import QTimer, Qt, pyqtSignal
-from PyQt6.QtGui import QFont, QColor, QDragEnterEvent, QDropEvent, QAction
+from PyQt6.QtGui import QFont, QDragEnterEvent, QDropEvent, QAction
+
+# orjson (선택적): 필터 파일 직렬화/역직렬화 가속 (없으면 표준 json)
+ORJSON_AVAILABLE = False
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
 
 # Core 모듈 import
 from core.parser import LogParser
 from core.buffer import LogBuffer
 from core.detector import ErrorDetector
+from core.ringbuf import SPSCRingBuffer
 
 # 로컬 모듈 import
-from .threads import LogcatThread, FileLoadThread, PrepareModelThread
+from .threads import LogcatThread, FileLoadThread, SaveLogsThread
 from .filter_dialog import FilterDialog
 from .log_model import LogTableModel
+from .filter_model import FilterTableModel
 
 
 class LogTable(QWidget):
     # 상태바 업데이트 시그널
     status_message = pyqtSignal(str)  # 상태 메시지 전달
+    # 에러 감지 결과 (파일 로드 스레드에서도 emit되므로 큐 연결로 GUI 스레드에서 처리)
+    error_detected = pyqtSignal(dict)
     
     def __init__(self):
         super().__init__()
@@ -80,8 +90,12 @@ class LogTable(QWidget):
         filter_group.setMaximumHeight(140)
         filter_layout = QVBoxLayout()
         
-        self.filter_table = QTableWidget(0, 7)
-        self.filter_table.setHorizontalHeaderLabels(["Enable", "Level", "PID", "TID", "Display", "Tag", "Message"])
+        self.filter_model = FilterTableModel(self)
+        self.filter_table = QTableView()
+        self.filter_table.setModel(self.filter_model)
+        self.filter_table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        self.filter_table.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
+        self.filter_table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
         self.filter_table.setMaximumHeight(100)
         self.filter_table.setColumnWidth(0, 50)
         self.filter_table.setColumnWidth(1, 50)
@@ -93,7 +107,13 @@ class LogTable(QWidget):
         
         self.filter_table.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
         self.filter_table.customContextMenuRequested.connect(self._show_filter_context_menu)
-        self.filter_table.itemDoubleClicked.connect(self._on_filter_double_clicked)
+        self.filter_table.doubleClicked.connect(self._on_filter_double_clicked)
+        
+        # 체크/추가/수정/삭제 시 모델 신호로 바로 동기화 (행 위젯 순회 없음, Enable 상태는 필터 모델이 보관)
+        self.filter_model.dataChanged.connect(self._on_filter_model_changed)
+        self.filter_model.rowsInserted.connect(self._on_filter_model_changed)
+        self.filter_model.rowsRemoved.connect(self._on_filter_model_changed)
+        self.filter_model.modelReset.connect(self._on_filter_model_changed)
         
         filter_layout.addWidget(self.filter_table)
         filter_group.setLayout(filter_layout)
@@ -126,7 +146,8 @@ class LogTable(QWidget):
         self.table.setColumnWidth(5, 150)   # Tag
         header.setStretchLastSection(True)   # Message 컬럼 자동 확장
         
-        # 행 높이 설정 (전역)
+        # 행 높이 설정 (전역) - 고정 높이로 두어 행마다 sizeHint 계산 없음
+        self.table.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
         self.table.verticalHeader().setDefaultSectionSize(28)
         
         # 스크롤 성능 최적화
@@ -138,30 +159,41 @@ class LogTable(QWidget):
         
         layout.addWidget(self.table)
     
+    @property
+    def active_filters(self):
+        """필터 목록 (필터 테이블 모델이 소유)"""
+        return self.filter_model.filters()
+    
     def _setup_data(self):
-        # 필터 관련
-        self.active_filters = []
-        
         # 스레드 관련
         self.logcat_thread = None
         self.file_load_thread = None
+        self._save_thread = None
+        self._save_file_path = None
         
         # 배치 처리 (실시간 logcat용)
-        self.pending_logs = []
-        self.batch_size = 100  # 배치 크기 증가 (모델 사용으로 더 효율적)
+        # logcat 스레드가 라인을 파싱해 링 버퍼에 넣고 (생산자), 타이머가 배치로 꺼내 모델에 추가 (소비자)
+        self.log_ring = SPSCRingBuffer(capacity=65536)
+        self.batch_size = 10000  # 타이머 한 번에 링 버퍼에서 꺼낼 최대 로그 수
         self.update_timer = QTimer(self)
         self.update_timer.timeout.connect(self._process_pending_logs)
         self.update_timer.setInterval(50)
         self.log_collection_start_time = None
+        self._last_progress_emit = 0.0  # 파일 로드 진행률 상태바 갱신 시각 (10Hz 제한)
         
-        # 파일 로드 중 임시 저장 (로드 완료 후 한 번에 추가)
-        self.pending_file_logs = []
+        # 자동 스크롤 병합 (배치마다 scrollToBottom 호출하지 않고 100ms에 한 번)
+        self._pending_scroll = False
+        self._scroll_timer = QTimer(self)
+        self._scroll_timer.setSingleShot(True)
+        self._scroll_timer.setInterval(100)
+        self._scroll_timer.timeout.connect(self._do_scroll_to_bottom)
         
         # Core 모듈 초기화
         self.log_parser = LogParser(format_type='threadtime')
         self.log_buffer = LogBuffer(max_size=1000)
         self.error_detector = ErrorDetector()
-        self.error_detector.on_error_detected = self._on_error_detected
+        self.error_detected.connect(self._on_error_detected, Qt.ConnectionType.QueuedConnection)
+        self.error_detector.on_error_detected = self.error_detected.emit
     
     def dragEnterEvent(self, event: QDragEnterEvent):
         if event.mimeData().hasUrls():
@@ -174,95 +206,61 @@ class LogTable(QWidget):
                 self.load_logcat_file(file_path)
                 break
     
-    def _parse_log_line(self, line):
-        """
-        로그 라인 파싱 (core.parser 사용)
-        기존 튜플 형식 유지: (timestamp, level, display, tag, message)
-        """
-        # Core parser 사용
-        parsed_dict = self.log_parser.parse(line)
-        if not parsed_dict:
-            return None
-        
-        # 딕셔너리를 튜플로 변환 (기존 코드 호환성)
-        timestamp = parsed_dict.get('timestamp', '')
-        level = parsed_dict.get('level', '-')
-        display = parsed_dict.get('display', 'Main')
-        tag = parsed_dict.get('tag', 'Unknown')
-        message = parsed_dict.get('message', '')
-        
-        # 버퍼에 추가 (딕셔너리 형식)
-        self.log_buffer.add(parsed_dict)
-        
-        # 에러 감지
-        self.error_detector.detect(parsed_dict)
-        
-        # 튜플 반환 (기존 UI 코드 호환성)
-        return (timestamp, level, display, tag, message)
-    
     def _on_error_detected(self, error_info):
-        """에러 감지 콜백 (core.detector에서 호출)"""
+        """에러 감지 콜백 (core.detector -> error_detected 시그널, 항상 GUI 스레드)"""
         # 필요시 에러 알림 또는 자동 분석 트리거
         pass
     
-    def _on_log_received(self, line):
-        """로그 라인 수신 (실시간 logcat)"""
-        log_data = self._parse_log_line(line)
-        if log_data:
-            self.pending_logs.append(log_data)
-            
-            if len(self.pending_logs) >= self.batch_size:
-                self._process_pending_logs()
-            elif not self.update_timer.isActive():
-                self.update_timer.start()
-    
     def _process_pending_logs(self):
-        """대기 중인 로그 배치 처리 (모델에 추가)"""
-        if not self.pending_logs:
-            return
-        
-        # 초기 수집 시 작은 배치
+        """링 버퍼에 쌓인 로그를 배치로 꺼내 모델에 추가 (update_timer 주기 호출)"""
+        # 초기 수집 시 작은 배치 (첫 화면을 빨리 표시)
         if self.log_collection_start_time:
             elapsed = time.time() - self.log_collection_start_time
             if elapsed < 3.0:
-                current_batch_size = min(50, self.batch_size // 2)
+                current_batch_size = min(500, self.batch_size // 2)
             else:
                 current_batch_size = self.batch_size
         else:
             current_batch_size = self.batch_size
         
-        logs_to_process = self.pending_logs[:current_batch_size]
-        self.pending_logs = self.pending_logs[current_batch_size:]
+        # 인덱스만 전진 (pending[:n] / pending[n:] 복사 없음)
+        logs_to_process = self.log_ring.drain_up_to(current_batch_size)
+        if not logs_to_process:
+            # 수집 중에는 타이머를 계속 돌림 (logcat 스레드는 시그널 없이 링 버퍼에만 넣음)
+            if not (self.logcat_thread and self.logcat_thread.isRunning()):
+                self.update_timer.stop()
+            return
         
         # 모델에 로그 추가 (필터링은 모델 내부에서 처리)
         should_scroll = self.auto_scroll_cb.isChecked()
         
-        self.log_model.add_logs(logs_to_process)
+        added = self.log_model.add_logs(logs_to_process)
         
-        # 자동 스크롤
-        if should_scroll and self.log_model.rowCount() > 0:
-            self.table.scrollToBottom()
-        
-        # 남은 로그 처리
-        if self.pending_logs:
-            if not self.update_timer.isActive():
-                self.update_timer.start()
-        else:
-            self.update_timer.stop()
+        # 자동 스크롤 (타이머로 병합)
+        if should_scroll and added:
+            self._pending_scroll = True
+            if not self._scroll_timer.isActive():
+                self._scroll_timer.start()
+    
+    def _do_scroll_to_bottom(self):
+        """병합된 자동 스크롤 실행 (_scroll_timer 만료 시)"""
+        if not self._pending_scroll:
+            return
+        self._pending_scroll = False
+        self._scroll_to_bottom_fast()
+    
+    def _scroll_to_bottom_fast(self):
+        """스크롤바를 최대값으로 이동 (고정 행 높이라 scrollToBottom의 인덱스 경로 불필요)"""
+        scroll_bar = self.table.verticalScrollBar()
+        scroll_bar.setValue(scroll_bar.maximum())
     
     def _sync_filters_to_model(self):
         """필터 설정을 모델에 동기화"""
-        enabled_filters = []
-        for row in range(self.filter_table.rowCount()):
-            checkbox = self.filter_table.cellWidget(row, 0)
-            if checkbox and checkbox.isChecked():
-                filter_index = checkbox.property('filter_index')
-                if filter_index is not None and 0 <= filter_index < len(self.active_filters):
-                    filter_data = self.active_filters[filter_index].copy()
-                    filter_data['enabled'] = True
-                    enabled_filters.append(filter_data)
-        
-        self.log_model.set_filters(enabled_filters)
+        self.log_model.set_filters(self.filter_model.enabled_filters())
+    
+    def _on_filter_model_changed(self, *args):
+        """필터 목록/체크 상태 변경 시그널 -> 로그 모델에 반영"""
+        self._sync_filters_to_model()
     
     def _show_filter_context_menu(self, position):
         """필터 컨텍스트 메뉴"""
@@ -272,7 +270,7 @@ class LogTable(QWidget):
         add_action.triggered.connect(self._add_filter_rule)
         menu.addAction(add_action)
         
-        current_row = self.filter_table.currentRow()
+        current_row = self.filter_table.currentIndex().row()
         if current_row >= 0:
             edit_action = QAction("Edit Filter...", self)
             edit_action.triggered.connect(self._edit_selected_filter)
@@ -300,9 +298,9 @@ class LogTable(QWidget):
         
         menu.exec(self.filter_table.mapToGlobal(position))
     
-    def _on_filter_double_clicked(self, item):
+    def _on_filter_double_clicked(self, index):
         """필터 더블클릭"""
-        row = item.row()
+        row = index.row()
         if row >= 0 and row < len(self.active_filters):
             self._edit_filter(row)
     
@@ -315,7 +313,7 @@ class LogTable(QWidget):
     
     def _edit_selected_filter(self):
         """선택된 필터 편집"""
-        row = self.filter_table.currentRow()
+        row = self.filter_table.currentIndex().row()
         if row >= 0:
             self._edit_filter(row)
     
@@ -328,53 +326,17 @@ class LogTable(QWidget):
         dialog = FilterDialog(self, filter_data)
         if dialog.exec() == QDialog.DialogCode.Accepted:
             new_filter_data = dialog.get_filter_data()
-            self.active_filters[row] = new_filter_data
-            self._update_filter_table_row(row, new_filter_data)
+            self.filter_model.update_filter(row, new_filter_data)
     
     def _delete_selected_filter(self):
         """선택된 필터 삭제"""
-        row = self.filter_table.currentRow()
+        row = self.filter_table.currentIndex().row()
         if row >= 0:
-            del self.active_filters[row]
-            self.filter_table.removeRow(row)
-            # 인덱스 재설정
-            for r in range(self.filter_table.rowCount()):
-                checkbox = self.filter_table.cellWidget(r, 0)
-                if checkbox:
-                    checkbox.setProperty('filter_index', r)
+            self.filter_model.remove_filter(row)
     
     def _add_filter_to_table(self, filter_data):
         """필터를 테이블에 추가"""
-        self.active_filters.append(filter_data)
-        row = self.filter_table.rowCount()
-        self.filter_table.insertRow(row)
-        self._update_filter_table_row(row, filter_data)
-    
-    def _update_filter_table_row(self, row, filter_data):
-        """필터 테이블 행 업데이트"""
-        # Enable checkbox
-        checkbox = QCheckBox()
-        checkbox.setChecked(True)
-        checkbox.setProperty('filter_index', row)
-        self.filter_table.setCellWidget(row, 0, checkbox)
-        
-        # Fields
-        fields = filter_data.get('fields', {})
-        self.filter_table.setItem(row, 1, QTableWidgetItem(fields.get('level', '') or ''))
-        self.filter_table.setItem(row, 2, QTableWidgetItem(fields.get('pid', '') or ''))
-        self.filter_table.setItem(row, 3, QTableWidgetItem(fields.get('tid', '') or ''))
-        self.filter_table.setItem(row, 4, QTableWidgetItem("Main"))  # Display
-        self.filter_table.setItem(row, 5, QTableWidgetItem(fields.get('tag', '') or ''))
-        self.filter_table.setItem(row, 6, QTableWidgetItem(fields.get('keyword', '') or ''))
-        
-        # Background color (투명도 적용)
-        if filter_data.get('color'):
-            filter_bg_color = QColor(filter_data['color'])
-            filter_bg_color.setAlpha(70)  # 투명도 적용
-            for col in range(7):
-                item = self.filter_table.item(row, col)
-                if item:
-                    item.setBackground(filter_bg_color)
+        self.filter_model.add_filter(filter_data)
     
     def _save_filters(self):
         """필터 저장"""
@@ -382,10 +344,13 @@ class LogTable(QWidget):
             self, "Save Filters", "", "Filter Files (*.dlf);;All Files (*)"
         )
         if file_path:
-            import json
             try:
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    json.dump(self.active_filters, f, indent=2, ensure_ascii=False)
+                if ORJSON_AVAILABLE:
+                    with open(file_path, 'wb') as f:
+                        f.write(orjson.dumps(self.active_filters, option=orjson.OPT_INDENT_2))
+                else:
+                    with open(file_path, 'w', encoding='utf-8') as f:
+                        json.dump(self.active_filters, f, indent=2, ensure_ascii=False)
                 QMessageBox.information(self, "Success", "Filters saved successfully.")
             except Exception as e:
                 QMessageBox.critical(self, "Error", f"Failed to save filters: {str(e)}")
@@ -396,22 +361,21 @@ class LogTable(QWidget):
             self, "Load Filters", "", "Filter Files (*.dlf);;All Files (*)"
         )
         if file_path:
-            import json
             try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    filters = json.load(f)
-                self.active_filters = filters
-                self.filter_table.setRowCount(0)
-                for filter_data in filters:
-                    self._add_filter_to_table(filter_data)
+                if ORJSON_AVAILABLE:
+                    with open(file_path, 'rb') as f:
+                        filters = orjson.loads(f.read())
+                else:
+                    with open(file_path, 'r', encoding='utf-8') as f:
+                        filters = json.load(f)
+                self.filter_model.set_filters(filters)
                 QMessageBox.information(self, "Success", "Filters loaded successfully.")
             except Exception as e:
                 QMessageBox.critical(self, "Error", f"Failed to load filters: {str(e)}")
     
     def _clear_all_filters(self):
         """모든 필터 삭제"""
-        self.active_filters.clear()
-        self.filter_table.setRowCount(0)
+        self.filter_model.clear()
     
     def _start_logcat(self):
         """로그캣 시작"""
@@ -429,13 +393,15 @@ class LogTable(QWidget):
             self,
             logcat_filter='*:V',
             buffer='main',
-            format_type='threadtime'
+            format_type='threadtime',
+            log_ring=self.log_ring,
+            parser=self.log_parser,
+            log_buffer=self.log_buffer,
+            error_detector=self.error_detector,
         )
-        self.logcat_thread.log_received.connect(self._on_log_received)
         self.logcat_thread.error_occurred.connect(self._on_logcat_error)
         self.logcat_thread.finished.connect(lambda: self.start_btn.setEnabled(True))
         self.logcat_thread.start()
-        
         self.update_timer.start()
     
     def _stop_logcat(self):
@@ -443,16 +409,19 @@ class LogTable(QWidget):
         self.update_timer.stop()
         self.log_collection_start_time = None
         
-        if self.pending_logs:
-            self._process_pending_logs()
-        
         self.start_btn.setEnabled(True)
         self.stop_btn.setEnabled(False)
         self.pause_btn.setEnabled(False)
         
         if self.logcat_thread and self.logcat_thread.isRunning():
             self.logcat_thread.stop()
-            self.logcat_thread.wait()
+            # 링 버퍼가 가득 차 스레드가 빈 공간을 기다리는 중일 수 있으므로 비우면서 대기
+            while not self.logcat_thread.wait(50):
+                self._process_pending_logs()
+        
+        # 스레드 종료 후 링 버퍼에 남은 로그 처리
+        while len(self.log_ring):
+            self._process_pending_logs()
         
         self.pause_btn.setText("⏸ Pause")
         
@@ -487,14 +456,17 @@ class LogTable(QWidget):
             QMessageBox.warning(self, "Warning", "파일 로드가 이미 진행 중입니다.")
             return
         
-        # 임시 저장 리스트 초기화
-        self.pending_file_logs.clear()
+        # 파일 로그로 교체 (배치마다 모델에 바로 추가)
+        self.log_model.clear()
         
         # 상태바에 로드 시작 메시지 표시
         self.status_message.emit("파일 로드 중...")
         
         # 파일 로드 스레드 시작
-        self.file_load_thread = FileLoadThread(file_path, self.log_parser)
+        self.file_load_thread = FileLoadThread(
+            file_path, self.log_parser,
+            log_buffer=self.log_buffer, error_detector=self.error_detector,
+        )
         self.file_load_thread.log_batch_parsed.connect(self._on_file_log_batch_parsed)
         self.file_load_thread.progress_updated.connect(self._on_file_load_progress)
         self.file_load_thread.load_complete.connect(self._on_file_load_complete)
@@ -502,52 +474,29 @@ class LogTable(QWidget):
         self.file_load_thread.start()
     
     def _on_file_log_batch_parsed(self, log_batch):
-        """파일에서 파싱된 로그 배치 수신 (임시 저장 + 버퍼/에러감지만, 모델 추가는 준비 스레드 완료 후)"""
+        """파일에서 파싱된 로그 배치 수신 (모델에 바로 추가, 버퍼/에러 감지는 로드 스레드에서 처리됨)"""
         if not log_batch:
             return
         
-        self.pending_file_logs.extend(log_batch)
-        # 배치 단위로 버퍼/에러 감지 (완료 시 185만 루프 제거)
-        for log_tuple in log_batch:
-            timestamp, level, display, tag, message = log_tuple
-            parsed_dict = {
-                'timestamp': timestamp, 'level': level, 'pid': '-', 'tid': '-',
-                'tag': tag, 'message': message, 'display': display,
-            }
-            self.log_buffer.add(parsed_dict)
-            self.error_detector.detect(parsed_dict)
+        # 배치마다 모델에 삽입 (필터링은 모델 내부에서 증분 처리, 전체 복사본 없음)
+        self.log_model.add_logs(log_batch)
     
     def _on_file_load_progress(self, progress, current_line, total_lines):
-        """파일 로드 진행 상황 업데이트 (상태바에 표시)"""
-        print(f"[LogTable] 파일 로드 진행 상황 업데이트 - 진행률: {progress}%, 현재 줄: {current_line:,} / 전체 줄: {total_lines:,}")
+        """파일 로드 진행 상황 업데이트 (상태바에 표시, 최대 10Hz)"""
+        now = time.monotonic()
+        if now - self._last_progress_emit < 0.1 and progress < 100:
+            return
+        self._last_progress_emit = now
         self.status_message.emit(f"파일 로드 중... {progress}% ({current_line:,} / {total_lines:,} 줄)")
     
     def _on_file_load_complete(self, total_lines):
-        """파일 로드 완료 - 워커에서 필터 계산 후 메인에서 set_prepared_data만 호출 (UI 블로킹 방지)"""
-        if not self.pending_file_logs:
-            self.status_message.emit("로드 완료: 0개 로그")
-            return
-        
-        self.status_message.emit(f"필터 적용 중... ({len(self.pending_file_logs):,}개)")
-        logs_copy = list(self.pending_file_logs)
-        filters = self.log_model.get_filters()
-        self._prepare_model_thread = PrepareModelThread(logs_copy, filters)
-        self._prepare_model_thread.prepared_data.connect(self._on_prepared_data)
-        self._prepare_model_thread.start()
-
-    def _on_prepared_data(self, all_logs, filtered_indices, matched_filters):
-        """워커에서 필터 계산 완료 → 메인에서 모델만 갱신 (짧은 블로킹)"""
-        self.log_model.set_prepared_data(all_logs, filtered_indices, matched_filters)
-        self.pending_file_logs.clear()
-        self._sync_filters_to_model()
+        """파일 로드 완료 (로그는 배치마다 이미 모델에 추가됨)"""
         total_count = self.log_model.get_total_count()
         filtered_count = self.log_model.get_filtered_count()
         self.status_message.emit(f"로드 완료: {total_count:,}개 로그 (표시: {filtered_count:,}개)")
     
     def _on_file_load_error(self, error_msg):
         """파일 로드 에러"""
-        # 임시 리스트 초기화
-        self.pending_file_logs.clear()
         self.status_message.emit(f"로드 실패: {error_msg}")
         QMessageBox.critical(self, "Error", f"파일 로드 실패: {error_msg}")
     
@@ -556,31 +505,40 @@ class LogTable(QWidget):
         self._sync_filters_to_model()
     
     def save_logs_to_file(self, file_path):
-        """로그를 파일로 저장"""
-        try:
-            all_logs = self.log_model.get_all_logs()
-            pid_pattern = re.compile(r'pid[=:](\d+)', re.IGNORECASE)
-            tid_pattern = re.compile(r'tid[=:](\d+)', re.IGNORECASE)
-            
-            with open(file_path, 'w', encoding='utf-8') as f:
-                for log_data in all_logs:
-                    time_val, level, display, tag, message = log_data
-                    pid_match = pid_pattern.search(message)
-                    tid_match = tid_pattern.search(message)
-                    pid = pid_match.group(1) if pid_match else "-"
-                    tid = tid_match.group(1) if tid_match else "-"
-                    log_line = f"{time_val}  {level}  {pid}  {tid}  {tag}: {message}\n"
-                    f.write(log_line)
-            
-            QMessageBox.information(self, "Success", f"Saved {len(all_logs)} log entries to {file_path}")
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Failed to save logs: {str(e)}")
+        """로그를 파일로 저장 (백그라운드 스레드)"""
+        if self._save_thread and self._save_thread.isRunning():
+            QMessageBox.information(self, "Save", "이미 저장 중입니다.")
+            return
+        
+        # 저장 중에도 수집이 계속될 수 있으므로 현재 시점 스냅샷 저장
+        logs = list(self.log_model.get_all_logs())
+        self._save_file_path = file_path
+        self._save_thread = SaveLogsThread(file_path, logs)
+        self._save_thread.progress_updated.connect(
+            lambda progress: self.status_message.emit(f"로그 저장 중... {progress}%")
+        )
+        self._save_thread.save_complete.connect(self._on_save_complete)
+        self._save_thread.save_error.connect(self._on_save_error)
+        self.status_message.emit("로그 저장 중...")
+        self._save_thread.start()
+    
+    def _on_save_complete(self, count):
+        """로그 저장 완료"""
+        self.status_message.emit(f"저장 완료: {count:,}개 로그")
+        QMessageBox.information(self, "Success", f"Saved {count} log entries to {self._save_file_path}")
+    
+    def _on_save_error(self, error_msg):
+        """로그 저장 실패"""
+        self.status_message.emit("저장 실패")
+        QMessageBox.critical(self, "Error", f"Failed to save logs: {error_msg}")
     
     def clear_all_logs(self):
         """모든 로그 초기화"""
-        self.pending_logs.clear()
+        self.log_ring.clear()
         self.log_buffer.clear()
-        self.update_timer.stop()
+        # update_timer는 수집 중이면 계속 돌아야 하므로 멈추지 않음 (비어 있고 수집 중이 아니면 스스로 멈춤)
+        self._scroll_timer.stop()
+        self._pending_scroll = False
         self.log_model.clear()
         self.status_message.emit("준비")
     
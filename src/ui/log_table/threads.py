@@ -1,38 +1,119 @@
 """
 로그 테이블 관련 백그라운드 스레드 클래스들
 """
+import logging
+import mmap
 import os
-import random
+import re
 import threading
 import time
+from typing import Optional
 from PyQt6.QtCore import QThread, pyqtSignal
 from core.collector import ADBLogCollector
-from core.parser import LogParser
-from .log_model import compute_filtered_indices_and_matches
+from core.buffer import LogBuffer
+from core.detector import ErrorDetector
+from core.parser import LogParser, log_tuple_to_dict, to_log_tuples
+from core.ringbuf import SPSCRingBuffer
+
+logger = logging.getLogger(__name__)
+
+# 저장 시 PID/TID를 한 번의 스캔으로 추출 (group 1: pid, group 2: tid)
+_PID_TID_RE = re.compile(r'pid[=:](\d+)|tid[=:](\d+)', re.IGNORECASE)
 
 
 class LogcatThread(QThread):
-    """백그라운드에서 logcat을 수집하는 스레드 (core.collector 래퍼)"""
-    log_received = pyqtSignal(str)  # 로그 라인을 전달하는 시그널
+    """
+    백그라운드에서 logcat을 수집하는 스레드 (core.collector 래퍼)
+    
+    collector.collect()는 readline에서 블록되므로 별도 리더 스레드에서 실행하고,
+    이 스레드는 리더가 모은 라인을 batch_interval마다 (또는 batch_size개가 모이면 즉시)
+    파싱해 log_ring에 튜플로 넣음 (링 버퍼의 생산자, 소비자는 LogTable의 update_timer).
+    새 라인이 오지 않아도 남은 라인은 batch_interval 안에 링 버퍼로 들어감.
+    """
     error_occurred = pyqtSignal(str)  # 에러 메시지를 전달하는 시그널
     
-    def __init__(self, parent=None, logcat_filter='*:V', buffer='main', format_type='threadtime'):
+    def __init__(self, parent=None, logcat_filter='*:V', buffer='main', format_type='threadtime',
+                 batch_size: int = 1000, batch_interval: float = 0.05, *,
+                 log_ring: SPSCRingBuffer, parser: Optional[LogParser] = None,
+                 log_buffer: Optional[LogBuffer] = None, error_detector: Optional[ErrorDetector] = None):
+        """
+        Args:
+            log_ring: 파싱된 튜플을 넣을 링 버퍼 (이 스레드가 유일한 생산자)
+            parser: 로그 파서 (없으면 format_type으로 생성)
+            log_buffer: 파싱된 dict를 워커에서 바로 넣을 버퍼 (선택)
+            error_detector: 파싱된 dict를 워커에서 바로 검사할 에러 감지기 (선택)
+        """
         super().__init__(parent)
+        self.log_ring = log_ring
+        self.parser = parser or LogParser(format_type=format_type)
+        self.log_buffer = log_buffer
+        self.error_detector = error_detector
+        self.batch_size = batch_size
+        self.batch_interval = batch_interval
+        self._batch = []
+        self._batch_cond = threading.Condition()
+        self._reader_done = False
         self.collector = ADBLogCollector(logcat_filter=logcat_filter, buffer=buffer, format_type=format_type)
         self.collector.on_log_received = self._on_log_received
         self.collector.on_error = self._on_error
     
     def _on_log_received(self, line: str):
-        """콜백: 로그 수신"""
-        self.log_received.emit(line)
+        """콜백: 로그 수신 (리더 스레드, 배치에 모으기만 하고 batch_size에 도달하면 전달 스레드를 깨움)"""
+        with self._batch_cond:
+            self._batch.append(line)
+            if len(self._batch) >= self.batch_size:
+                self._batch_cond.notify()
+    
+    def _take_batch(self) -> list:
+        """모인 라인을 꺼냄 (batch_size개가 모이거나 batch_interval이 지날 때까지 대기)"""
+        with self._batch_cond:
+            if len(self._batch) < self.batch_size and not self._reader_done:
+                self._batch_cond.wait(self.batch_interval)
+            batch = self._batch
+            self._batch = []
+        return batch
+    
+    def _push_batch(self, lines: list):
+        """라인 배치를 파싱해 링 버퍼에 넣음 (가득 차 있으면 GUI 타이머가 비울 때까지 대기)"""
+        if not lines:
+            return
+        parsed_dicts = self.parser.parse_batch(lines)
+        if self.log_buffer is not None:
+            self.log_buffer.add_batch(parsed_dicts)
+        if self.error_detector is not None:
+            self.error_detector.detect_batch(parsed_dicts)
+        logs = to_log_tuples(parsed_dicts)
+        while True:
+            pushed = self.log_ring.push_many(logs)
+            if pushed == len(logs):
+                return
+            # 리더 스레드는 그동안 계속 라인을 모음
+            logs = logs[pushed:]
+            time.sleep(self.batch_interval)
     
     def _on_error(self, error: str):
         """콜백: 에러 발생"""
         self.error_occurred.emit(error)
     
+    def _read(self):
+        """리더 스레드: collect()가 끝나면 (중지/에러) 전달 스레드를 바로 깨움"""
+        try:
+            self.collector.collect()
+        finally:
+            with self._batch_cond:
+                self._reader_done = True
+                self._batch_cond.notify()
+    
     def run(self):
-        """logcat 실행"""
-        self.collector.collect()
+        """logcat 실행 (리더 스레드 시작 후 종료될 때까지 주기적으로 배치 전달)"""
+        self._reader_done = False
+        reader = threading.Thread(target=self._read, name='logcat-reader', daemon=True)
+        reader.start()
+        while not self._reader_done:
+            self._push_batch(self._take_batch())
+        reader.join()
+        # 종료 시 남은 배치 전달
+        self._push_batch(self._take_batch())
     
     def stop(self):
         """logcat 중지"""
@@ -57,104 +138,42 @@ class LogcatThread(QThread):
         return self.collector.is_paused
 
 
-class FilterApplyThread(QThread):
-    """백그라운드에서 필터 적용 및 UI 업데이트 준비"""
-    batch_ready = pyqtSignal(list, int, int)  # 배치 데이터, 시작 인덱스, 총 개수
-    filter_complete = pyqtSignal(int)  # 필터 완료 (총 개수)
+class SaveLogsThread(QThread):
+    """백그라운드에서 로그를 파일로 저장하는 스레드"""
+    progress_updated = pyqtSignal(int)  # 진행률
+    save_complete = pyqtSignal(int)  # 저장 완료 (저장한 로그 수)
+    save_error = pyqtSignal(str)  # 에러 메시지
     
-    def __init__(self, all_logs, active_filters, filter_table, evaluate_filter_func):
+    def __init__(self, file_path: str, logs: list, chunk_size: int = 50000):
         super().__init__()
-        self.all_logs = all_logs
-        self.active_filters = active_filters
-        self.filter_table = filter_table
-        self.evaluate_filter = evaluate_filter_func
-        self.should_cancel = False
-        self.batch_size = 10000  # 배치 크기
+        self.file_path = file_path
+        self.logs = logs
+        self.chunk_size = chunk_size
     
     def run(self):
-        """필터 적용 및 배치 준비"""
+        """청크 단위로 문자열을 join 해서 한 번에 write (라인별 write 없음)"""
         try:
-            # 활성화된 필터 수집
-            enabled_filters = []
-            for row in range(self.filter_table.rowCount()):
-                checkbox = self.filter_table.cellWidget(row, 0)
-                if checkbox and checkbox.isChecked():
-                    filter_index = checkbox.property('filter_index')
-                    if filter_index is not None and 0 <= filter_index < len(self.active_filters):
-                        enabled_filters.append(self.active_filters[filter_index])
-            
-            show_filters = [f for f in enabled_filters if f.get('type', 'Show') == 'Show']
-            ignore_filters = [f for f in enabled_filters if f.get('type', 'Show') == 'Ignore']
-            
-            # 필터 비활성화 모드
-            FILTER_DISABLED = True
-            
-            # 필터링된 로그 수집
-            filtered_logs = []
-            for log_data in self.all_logs:
-                if self.should_cancel:
-                    return
-                
-                if FILTER_DISABLED:
-                    filtered_logs.append((log_data, None))
-                else:
-                    # Ignore 필터 체크
-                    if ignore_filters:
-                        should_ignore = False
-                        for f in ignore_filters:
-                            if self.evaluate_filter(f, log_data):
-                                should_ignore = True
-                                break
-                        if should_ignore:
-                            continue
-                    
-                    # Show 필터 체크
-                    matched_filter = None
-                    if show_filters:
-                        for f in show_filters:
-                            if self.evaluate_filter(f, log_data):
-                                matched_filter = f
+            total = len(self.logs)
+            finditer = _PID_TID_RE.finditer
+            with open(self.file_path, 'w', encoding='utf-8') as f:
+                for start in range(0, total, self.chunk_size):
+                    lines = []
+                    append = lines.append
+                    for time_val, level, display, tag, message in self.logs[start:start + self.chunk_size]:
+                        pid = tid = None
+                        for match in finditer(message):
+                            if pid is None and match.group(1):
+                                pid = match.group(1)
+                            elif tid is None and match.group(2):
+                                tid = match.group(2)
+                            if pid is not None and tid is not None:
                                 break
-                        if matched_filter is None:
-                            continue
-                    elif not enabled_filters:
-                        matched_filter = None
-                    
-                    filtered_logs.append((log_data, matched_filter))
-                
-                # 배치 단위로 시그널 전송
-                if len(filtered_logs) >= self.batch_size:
-                    self.batch_ready.emit(filtered_logs.copy(), len(filtered_logs) - self.batch_size, len(self.all_logs))
-                    filtered_logs.clear()
-            
-            # 마지막 배치 전송
-            if filtered_logs:
-                self.batch_ready.emit(filtered_logs, len(self.all_logs) - len(filtered_logs), len(self.all_logs))
-            
-            # 완료 시그널
-            total_filtered = len(self.all_logs) if FILTER_DISABLED else len([l for l in self.all_logs if True])  # 실제로는 필터링된 개수
-            self.filter_complete.emit(total_filtered)
+                        append(f"{time_val}  {level}  {pid or '-'}  {tid or '-'}  {tag}: {message}\n")
+                    f.write(''.join(lines))
+                    self.progress_updated.emit(min(100, (start + self.chunk_size) * 100 // total))
+            self.save_complete.emit(total)
         except Exception as e:
-            import logging
-            logging.getLogger(__name__).error(f"[FilterThread] 오류: {str(e)}", exc_info=True)
-    
-    def cancel(self):
-        """취소"""
-        self.should_cancel = True
-
-
-class PrepareModelThread(QThread):
-    """워커에서 필터 적용 계산 후, 메인에서 set_prepared_data만 호출하도록 결과 전달"""
-    prepared_data = pyqtSignal(list, list, list)  # all_logs, filtered_indices, matched_filters
-
-    def __init__(self, logs: list, filters: list):
-        super().__init__()
-        self.logs = logs
-        self.filters = filters
-
-    def run(self):
-        filtered_indices, matched_filters = compute_filtered_indices_and_matches(self.logs, self.filters)
-        self.prepared_data.emit(self.logs, filtered_indices, matched_filters)
+            self.save_error.emit(str(e))
 
 
 class FileLoadThread(QThread):
@@ -164,96 +183,228 @@ class FileLoadThread(QThread):
     load_complete = pyqtSignal(int)  # 로드 완료 (전체 줄 수)
     load_error = pyqtSignal(str)  # 에러 메시지
     
-    def __init__(self, file_path: str, parser: LogParser):
+    # Python fallback에서 한 번에 읽는 크기 (평균 180B/줄 기준 약 1만 줄)
+    MMAP_CHUNK_BYTES = 2 * 1024 * 1024
+    # 파일이 크면 청크를 키워 배치(모델 삽입/시그널) 횟수를 이 정도로 제한
+    MMAP_MAX_CHUNK_BYTES = 16 * 1024 * 1024
+    MMAP_TARGET_BATCHES = 100
+    # logcat 한 줄 평균 길이 추정치 (파일 크기 -> 줄 수 추정)
+    AVG_LINE_BYTES = 180
+    # Rust 파서 콜백 단위: chunk_bytes(페이지 배수) 또는 이 줄 수 중 먼저 도달하는 쪽
+    RUST_MAX_CHUNK_LINES = 200000
+    # 이 크기 이하면 파일을 한 번에 읽어 Rust 버퍼 파서로 넘김 (청크 I/O/줄 수 사전 계산 생략)
+    WHOLE_READ_MAX_BYTES = 512 * 1024 * 1024
+    
+    def __init__(self, file_path: str, parser: LogParser,
+                 log_buffer: Optional[LogBuffer] = None, error_detector: Optional[ErrorDetector] = None):
+        """
+        Args:
+            file_path: 로그 파일 경로
+            parser: 로그 파서
+            log_buffer: 파싱된 dict를 워커에서 바로 넣을 버퍼 (선택)
+            error_detector: 파싱된 dict를 워커에서 바로 검사할 에러 감지기 (선택)
+        """
         super().__init__()
         self.file_path = file_path
         self.parser = parser
+        self.log_buffer = log_buffer
+        self.error_detector = error_detector
         self.batch_size = 50000  # 배치 단위로 처리 (큰 파일 성능 최적화)
         self.should_cancel = False
+        
+        # Rust 콜백 상태 (_load_with_rust에서 초기화)
+        self._parsed_count = 0
+        self._pending = []
+        self._last_progress = (0, 0, 0)
+        self._debug_enabled = False
+        
+        # 파일 크기로 줄 수/청크 크기를 미리 정함 (읽는 도중 배치 크기 조정 없음)
+        try:
+            file_size = os.path.getsize(file_path)
+        except OSError:
+            file_size = 0
+        self.file_size = file_size
+        self.estimated_lines = file_size // self.AVG_LINE_BYTES
+        chunk_bytes = min(
+            max(self.MMAP_CHUNK_BYTES, file_size // self.MMAP_TARGET_BATCHES),
+            self.MMAP_MAX_CHUNK_BYTES,
+        )
+        # 페이지 크기 배수로 올림
+        self.chunk_bytes = -(-chunk_bytes // mmap.PAGESIZE) * mmap.PAGESIZE
+        
+        # Rust 파서 기능은 생성 시 한 번만 확인 (없으면 None -> mmap fallback)
+        rust_parser = getattr(parser, 'rust_parser', None) if getattr(parser, 'use_rust', False) else None
+        has_file_streaming = getattr(rust_parser, 'has_file_streaming', None)
+        # 래퍼 메서드가 있어도 이전 빌드라 Rust 함수가 없으면 mmap 경로로 (로드 실패/무응답 방지)
+        self._parse_file_streaming = (
+            rust_parser.parse_file_streaming
+            if has_file_streaming is not None and has_file_streaming()
+            else None
+        )
+        has_bytes_streaming = getattr(rust_parser, 'has_bytes_streaming', None)
+        self._parse_bytes_streaming = (
+            rust_parser.parse_bytes_streaming
+            if self._parse_file_streaming is not None and has_bytes_streaming and has_bytes_streaming()
+            else None
+        )
     
     def run(self):
         """파일 로드 실행 - Rust 파일 I/O + 파싱 사용 (최고 성능)"""
         try:
-            import logging
-            logger = logging.getLogger(__name__)
-            
-            # Rust 파일 파서 사용 가능 여부 확인
-            has_use_rust = hasattr(self.parser, 'use_rust')
-            use_rust_value = getattr(self.parser, 'use_rust', False) if has_use_rust else False
-            has_rust_parser = hasattr(self.parser, 'rust_parser')
-            rust_parser_value = getattr(self.parser, 'rust_parser', None) if has_rust_parser else None
-            has_parse_file_chunk = hasattr(rust_parser_value, 'parse_file_chunk') if rust_parser_value is not None else False
-            
-            use_rust_file_parsing = (
-                has_use_rust
-                and use_rust_value
-                and has_rust_parser
-                and rust_parser_value is not None
-                and has_parse_file_chunk
+            if self._parse_file_streaming is not None:
+                self._load_with_rust()
+            else:
+                # Rust 스트리밍 파서를 못 쓰면 mmap + 청크 단위 배치 파싱
+                logger.info(f"[FileLoad] Python mmap 로드 사용 - 청크 크기: {self.chunk_bytes // 1024}KB")
+                self._load_with_mmap()
+        except Exception as e:
+            logger.error(f"[FileLoad] 파일 로드 오류: {str(e)}", exc_info=True)
+            self.load_error.emit(str(e))
+    
+    def _load_with_rust(self):
+        """Rust 스트리밍 파서로 로드 (O(n) - 가장 효율적, 파일 한 번만 읽음)"""
+        logger.info(f"[FileLoad] 🚀 Rust 스트리밍 파서 사용 - 배치 크기: {self.batch_size}")
+        
+        self._parsed_count = 0
+        # Rust 청크가 작거나 파싱 실패 줄이 많으면 시그널이 잦아지므로
+        # batch_size가 찰 때까지 모았다가 한 번에 전송
+        self._pending = []
+        self._last_progress = (0, 0, 0)
+        # 청크마다 디버그 문자열을 포맷하지 않도록 레벨은 한 번만 확인
+        self._debug_enabled = logger.isEnabledFor(logging.DEBUG)
+        
+        if self._parse_bytes_streaming is not None and self.file_size <= self.WHOLE_READ_MAX_BYTES:
+            # 메모리에 들어가는 크기면 한 번의 read로 읽고 버퍼째 Rust에 전달
+            logger.info(f"[FileLoad] 파일 전체 읽기 후 Rust 버퍼 파싱 ({self.file_size // 1024}KB)")
+            with open(self.file_path, 'rb') as f:
+                data = f.read()
+            self._parse_bytes_streaming(
+                data, self.RUST_MAX_CHUNK_LINES, self._on_chunk_parsed,
+                chunk_bytes=self.chunk_bytes, progress_bytes=True
+            )
+            del data
+        else:
+            # Rust 스트리밍 파서 호출 (파일을 한 번만 읽음)
+            self._parse_file_streaming(
+                self.file_path, self.RUST_MAX_CHUNK_LINES, self._on_chunk_parsed,
+                as_tuples=True, chunk_bytes=self.chunk_bytes, progress_bytes=True
             )
+        
+        if self.should_cancel:
+            return
+        self._flush_pending()
+        
+        # 완료
+        self.load_complete.emit(self._parsed_count)
+    
+    def _on_chunk_parsed(self, parsed_logs, position, total):
+        """Rust에서 청크마다 호출되는 콜백 (튜플 리스트, 이전 빌드면 dict 리스트)"""
+        if self._debug_enabled:
+            logger.debug(f"[FileLoad] Rust 스트리밍 파서 청크 파싱 - 위치: {position} / {total}")
+        if self.should_cancel:
+            return False  # 중단
+        
+        if parsed_logs and isinstance(parsed_logs[0], dict):
+            # as_tuples 미지원 빌드: dict -> 튜플
+            valid_dicts = [d for d in parsed_logs if d]
+            self._feed_dicts(valid_dicts)
+            batch = to_log_tuples(valid_dicts)
+        else:
+            # Rust가 만든 튜플 그대로 전달 (level/display/tag는 Rust에서 intern됨)
+            batch = parsed_logs
+            self._feed_tuples(batch)
+        pending = self._pending
+        pending.extend(batch)
+        
+        # 진행 상황은 전송 시점에 함께 갱신
+        # (position/total은 바이트 기준, 이전 빌드면 줄 기준 -> 비율만 사용하고 전체 줄 수는 추정)
+        rows = self._parsed_count + len(pending)
+        if total > 0 and position > 0:
+            position = min(position, total)
+            progress = position * 100 // total
+            estimated_total = rows * total // position
+        else:
+            progress, estimated_total = 0, self.estimated_lines
+        self._last_progress = (progress, rows, estimated_total)
+        if len(pending) >= self.batch_size:
+            self._flush_pending()
+        return True  # 계속 진행
+    
+    def _flush_pending(self):
+        """모아둔 튜플과 마지막 진행률을 한 번에 전송"""
+        if self._pending:
+            batch, self._pending = self._pending, []
+            self.log_batch_parsed.emit(batch)
+            self._parsed_count += len(batch)
+        self.progress_updated.emit(*self._last_progress)
+    
+    def _feed_dicts(self, parsed_dicts):
+        """버퍼/에러 감지에 파싱 결과 dict 배치 전달 (워커에서 처리, GUI 스레드 작업 없음)"""
+        if self.log_buffer is not None:
+            self.log_buffer.add_batch(parsed_dicts)
+        if self.error_detector is not None:
+            self.error_detector.detect_batch(parsed_dicts)
+    
+    def _feed_tuples(self, log_tuples):
+        """버퍼/에러 감지에 튜플 배치 전달 (필요한 행만 dict로 변환)"""
+        if self.log_buffer is not None:
+            self.log_buffer.add_tuples(log_tuples)
+        if self.error_detector is not None:
+            self.error_detector.detect_batch([
+                log_tuple_to_dict(t) for t in log_tuples if t[1].upper() in ('E', 'F', 'A')
+            ])
+    
+    def _load_with_mmap(self):
+        """
+        Python fallback 로드: 파일을 mmap으로 매핑하고 청크 단위로 줄 분리 후 배치 파싱
+        
+        줄 경계 탐색(mm.find)과 분리(splitlines)는 C 레벨에서 처리되고,
+        디코딩도 줄마다가 아니라 청크마다 한 번만 수행.
+        """
+        with open(self.file_path, 'rb') as f:
+            size = os.fstat(f.fileno()).st_size
+            if size == 0:
+                self.load_complete.emit(0)
+                return
             
-            # 디버깅: 각 조건 확인
-            logger.debug(f"[FileLoad] Rust 파서 감지:")
-            logger.debug(f"  - hasattr(parser, 'use_rust'): {has_use_rust}")
-            logger.debug(f"  - parser.use_rust: {use_rust_value}")
-            logger.debug(f"  - hasattr(parser, 'rust_parser'): {has_rust_parser}")
-            logger.debug(f"  - parser.rust_parser is not None: {rust_parser_value is not None}")
-            logger.debug(f"  - hasattr(rust_parser, 'parse_file_chunk'): {has_parse_file_chunk}")
-            logger.debug(f"  - 최종 결과: use_rust_file_parsing = {use_rust_file_parsing}")
+            # 첫 청크를 읽기 전에도 예상 줄 수를 표시
+            self.progress_updated.emit(0, 0, self.estimated_lines)
             
-            if use_rust_file_parsing:
-                # Rust 스트리밍 파서 사용 가능 여부 확인
-                has_streaming = hasattr(rust_parser_value, 'parse_file_streaming')
-                logger.info(f"[FileLoad] has_streaming = {has_streaming}")
-                logger.info(f"[FileLoad] rust_parser 함수 목록: {dir(rust_parser_value)}")
-                
-                if has_streaming:
-                    # Rust 스트리밍 파서 사용 (O(n) - 가장 효율적, 파일 한 번만 읽음)
-                    logger.info(f"[FileLoad] 🚀 Rust 스트리밍 파서 사용 - 배치 크기: {self.batch_size}")
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                pos = 0
+                line_count = 0
+                parsed_count = 0
+                while pos < size:
+                    if self.should_cancel:
+                        return
                     
-                    parsed_count = [0]  # 클로저에서 수정하기 위해 리스트로
+                    # 청크 끝을 다음 줄바꿈까지 늘려 줄이 잘리지 않게 함
+                    end = pos + self.chunk_bytes
+                    if end >= size:
+                        end = size
+                    else:
+                        newline = mm.find(b'\n', end)
+                        end = size if newline == -1 else newline + 1
                     
-                    def on_chunk_parsed(parsed_dicts, current_line, total_lines):
-                        """Rust에서 청크마다 호출되는 콜백"""
-                        print(f"[PID {os.getpid()}] [Thread {threading.get_ident()}] [FileLoad] Rust 스트리밍 파서 청크 파싱 - 현재 줄: {current_line}, 전체 줄: {total_lines}")
-                        if self.should_cancel:
-                            return False  # 중단
-                        
-                        batch = []
-                        for parsed_dict in parsed_dicts:
-                            if parsed_dict:
-                                timestamp = parsed_dict.get('timestamp', '')
-                                level = parsed_dict.get('level', '-')
-                                display = parsed_dict.get('display', 'Main')
-                                tag = parsed_dict.get('tag', 'Unknown')
-                                message = parsed_dict.get('message', '')
-                                log_tuple = (timestamp, level, display, tag, message)
-                                batch.append(log_tuple)
-                        
-                        if batch:
-                            self.log_batch_parsed.emit(batch)
-                            parsed_count[0] += len(batch)
-                        
-                        # 진행 상황 업데이트
-                        progress = int((current_line / total_lines) * 100) if total_lines > 0 else 0
-                        self.progress_updated.emit(progress, current_line, total_lines)
-
-                        time.sleep(0.02)
-                        return True  # 계속 진행
+                    lines = mm[pos:end].decode('utf-8', errors='replace').splitlines()
+                    pos = end
+                    line_count += len(lines)
                     
-                    # Rust 스트리밍 파서 호출 (파일을 한 번만 읽음)
-                    self.parser.rust_parser.parse_file_streaming(
-                        self.file_path, self.batch_size, on_chunk_parsed
-                    )
+                    parsed_dicts = self.parser.parse_batch(lines)
+                    self._feed_dicts(parsed_dicts)
                     
-                    # 완료
-                    if not self.should_cancel:
-                        self.load_complete.emit(parsed_count[0])
-   
-        except Exception as e:
-            import logging
-            logging.getLogger(__name__).error(f"[FileLoad] 파일 로드 오류: {str(e)}", exc_info=True)
-            self.load_error.emit(str(e))
+                    batch = to_log_tuples(parsed_dicts)
+                    if batch:
+                        self.log_batch_parsed.emit(batch)
+                        parsed_count += len(batch)
+                    
+                    # 전체 줄 수는 읽은 비율로 추정
+                    progress = pos * 100 // size
+                    estimated_total = line_count * size // pos
+                    self.progress_updated.emit(progress, line_count, estimated_total)
+        
+        if not self.should_cancel:
+            self.load_complete.emit(parsed_count)
     
     def cancel(self):
         """로드 취소"""
@@ -2,23 +2,147 @@ import sys
 import subprocess
 import os
 import re
+import shutil
 import logging
-from PyQt6.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
+import threading
+import time
+import traceback
+from collections import deque
+from functools import lru_cache
+from itertools import islice
+from typing import List, Optional, Tuple
+from PyQt6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
                              QLineEdit, QPushButton, QComboBox, QLabel, 
                              QStatusBar, QTabWidget, QMenuBar, QMessageBox,
                              QFileDialog, QDockWidget, QToolBar)
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QSignalBlocker, QTimer
 
 logger = logging.getLogger(__name__)
 
 from ui.log_table import LogTable
-from ui.dashboard.container import DashboardContainer
 from ui.analysis_panel import AnalysisPanel
-from agent.analyzer import LogAnalyzer
-from utils.opencode_installer import OpenCodeInstaller
-from PyQt6.QtCore import QThread, pyqtSignal
+from agent.analyzer import LogAnalyzer, MAX_LOG_LINES
+from utils.opencode_installer import OpenCodeInstaller, invalidate_probe_cache
+from PyQt6.QtCore import QObject, QRunnable, QThread, QThreadPool, pyqtSignal, pyqtSlot
 
-# OpenCodeInstallThread는 opencode_page.py에서 import
+# `adb devices -l` 한 줄: 디바이스 ID, 상태(device만), model: 토큰(없을 수 있음)
+_DEVICES_L_RE = re.compile(r'^(\S+)\s+device\b(?:.*?\bmodel:(\S+))?')
+
+def _adb_candidates() -> list:
+    """PATH에 adb가 없을 때 확인할 adb.exe 후보 경로 (SDK 환경 변수 -> Android Studio 기본 경로)"""
+    candidates = []
+    android_home = os.environ.get('ANDROID_HOME') or os.environ.get('ANDROID_SDK_ROOT')
+    if android_home:
+        candidates.append(os.path.join(android_home, 'platform-tools', 'adb.exe'))
+    local_appdata = os.environ.get('LOCALAPPDATA')
+    if local_appdata:
+        candidates.append(os.path.join(local_appdata, 'Android', 'Sdk', 'platform-tools', 'adb.exe'))
+    user_profile = os.environ.get('USERPROFILE')
+    if user_profile:
+        candidates.append(os.path.join(user_profile, 'AppData', 'Local', 'Android', 'Sdk', 'platform-tools', 'adb.exe'))
+    return candidates
+
+
+# 환경 변수는 import 시 한 번만 조회
+_ADB_CANDIDATES = _adb_candidates()
+
+# 찾은 adb 경로 캐시 (Rescan ADB로 초기화)
+_adb_path_cache: Optional[str] = None
+
+
+def _find_adb_path() -> str:
+    """adb.exe 경로 찾기 (찾은 경로는 캐시)"""
+    global _adb_path_cache
+    if _adb_path_cache:
+        return _adb_path_cache
+    
+    # PATH에서 찾기 (프로세스 실행 없이 경로 검색만)
+    path = shutil.which('adb')
+    if path:
+        _adb_path_cache = path
+        return path
+    
+    for path in _ADB_CANDIDATES:
+        if os.path.exists(path):
+            _adb_path_cache = path
+            return path
+    
+    return 'adb'  # 기본값 (캐시하지 않음 - 나중에 설치되면 다시 탐색)
+
+
+def _clear_adb_path_cache():
+    """캐시된 adb 경로 폐기"""
+    global _adb_path_cache
+    _adb_path_cache = None
+
+
+# 응답 대기 중 쌓인 채팅 메시지를 한 요청으로 묶을 최대 개수
+MAX_CHAT_MSGS_PER_BATCH = 8
+
+# 분석 요청 최소 간격 (초) - 연속 클릭으로 들어온 요청은 무시
+ANALYSIS_SUBMIT_DEBOUNCE = 0.25
+
+# 일시적 오류로 분석이 실패하면 같은 요청을 자동 재시도 (시도별 대기 시간, 초)
+# OpenCode 실행 타임아웃(TimeoutExpired)은 이미 300초를 기다린 뒤라 재시도하지 않고 바로 오류 표시
+ANALYSIS_RETRY_DELAYS = (0.5, 1.0, 2.0)
+TRANSIENT_ERROR_TYPES = frozenset({'ConnectionError', 'ConnectionResetError', 'ConnectionAbortedError',
+                                   'TimeoutError', 'BrokenPipeError'})
+
+# 분석 단계별 소요 시간 표본 수 (종료 시 p50/p95/p99 로그)
+ANALYSIS_TIMING_SAMPLES = 1000
+
+# Node.js / OpenCode 설치 확인 결과 재사용 시간 (초)
+PROBE_CACHE_TTL = 30.0
+
+
+def _probe_bucket() -> int:
+    """현재 TTL 구간 번호 (구간이 바뀌면 캐시 미스)"""
+    return int(time.monotonic() // PROBE_CACHE_TTL)
+
+
+@lru_cache(maxsize=1)
+def _cached_node_check(bucket: int) -> Tuple[bool, Optional[str]]:
+    """TTL 구간별 Node.js 설치 확인 결과"""
+    return OpenCodeInstaller().check_nodejs()
+
+
+@lru_cache(maxsize=1)
+def _cached_opencode_check(analyzer: LogAnalyzer, bucket: int) -> bool:
+    """TTL 구간별 OpenCode CLI 설치 확인 결과"""
+    return analyzer.check_installation()
+
+
+def _invalidate_probe_cache():
+    """설치/설정 변경 후 캐시된 확인 결과 폐기 (installer 쪽 캐시/상태 파일 포함)"""
+    _cached_node_check.cache_clear()
+    _cached_opencode_check.cache_clear()
+    invalidate_probe_cache()
+
+
+# ComboBox 표시 문자열의 괄호 안 디바이스 ID
+_DEVICE_ID_RE = re.compile(r'\(([^)]+)\)')
+
+
+def _error_info(e: Exception) -> dict:
+    """워커 예외 -> 오류 시그널로 보낼 딕셔너리 (종류로 재시도 여부 판단, traceback은 로그용)"""
+    return {
+        'type': type(e).__name__,
+        'message': str(e),
+        'traceback': traceback.format_exc(),
+        'time': time.time(),
+    }
+
+
+def _percentile(sorted_values: list, pct: float):
+    """정렬된 값 목록의 백분위수 (nearest-rank)"""
+    index = max(0, min(len(sorted_values) - 1, int(round(pct / 100 * len(sorted_values))) - 1))
+    return sorted_values[index]
+
+
+def _extract_device_id(device_text: str) -> str:
+    """디바이스 ID 추출 (예: "Pixel 6 Pro (emulator-5554)" -> "emulator-5554", 괄호 없으면 그대로)"""
+    match = _DEVICE_ID_RE.search(device_text)
+    return match.group(1) if match else device_text
 
 class MainWindow(QMainWindow):
     def __init__(self):
@@ -29,12 +153,61 @@ class MainWindow(QMainWindow):
         # Current workspace info
         self.current_project = None
         self.current_branch = None
+        self._project_basename = None  # current_project의 마지막 경로 요소 (_set_current_project에서 갱신)
+        
+        # 설정/워크스페이스 다이얼로그 (처음 열 때 생성 후 재사용)
+        self._prefs_dialog = None
+        self._workspace_dialog = None
+        
+        # OpenCode 설치 완료 후 이어서 시작할 분석 요청 (이슈 설명)
+        self._pending_analysis: Optional[str] = None
         
-        # AI Analyzer 초기화
+        # 응답 대기 중에 보낸 채팅 메시지 (응답이 오면 한 번에 묶어 전송)
+        self._chat_pending: List[str] = []
+        self._chat_in_flight = False
+        
+        # 진행 중인 작업 (재요청/창 닫기 시 중단 요청용)
+        self._analysis_task: Optional["AnalysisTask"] = None
+        self._chat_task: Optional["ChatTask"] = None
+        self._analysis_inflight_key: Optional[bytes] = None  # 진행 중인 분석의 요청 키
+        self._last_analysis_submit = 0.0
+        self._analysis_serialize_ns = 0  # 현재 요청의 로그 변환 시간
+        self._analysis_timings = deque(maxlen=ANALYSIS_TIMING_SAMPLES)  # 완료된 분석의 단계별 시간 (ns)
+        
+        # 분석/채팅/설치 워커 결과는 메인 스레드의 디스패처를 거쳐 큐 연결로 전달
+        queued = Qt.ConnectionType.QueuedConnection
+        self._dispatcher = ResultDispatcher(self)
+        self._dispatcher.analysis_progress.connect(self._on_analysis_progress, queued)
+        self._dispatcher.analysis_complete.connect(self._on_analysis_complete, queued)
+        self._dispatcher.analysis_error.connect(self._on_analysis_error, queued)
+        self._dispatcher.chat_complete.connect(self._on_chat_complete, queued)
+        self._dispatcher.chat_error.connect(self._on_chat_error, queued)
+        self._dispatcher.chat_complete.connect(self._on_chat_task_done, queued)
+        self._dispatcher.chat_error.connect(self._on_chat_task_done, queued)
+        self._dispatcher.install_progress.connect(self._on_install_progress, queued)
+        self._dispatcher.install_complete.connect(self._on_install_complete, queued)
+        self._dispatcher.install_error.connect(self._on_install_error, queued)
+        self._opencode_installing = False  # OpenCode 설치 작업 진행 중 (중복 설치 방지)
+        
+        # LogTable 상태 메시지 앞에 붙는 "프로젝트 | 디바이스" 문자열 (변경 시에만 재계산)
+        self._status_prefix = "No project loaded | Device: No device"
+        self._current_device_text = "No device"  # _on_device_changed에서만 갱신
+        
+        self._refresh_thread: Optional[QThread] = None
+        self._connect_thread: Optional[QThread] = None
+        
+        # 반복되는 오류 알림용 메시지 박스 (처음 사용할 때 생성 후 재사용)
+        self._err_box: Optional[QMessageBox] = None
+        
+        # AI Analyzer 초기화 (앱 전체에서 하나만 사용, 실행 명령 탐색은 백그라운드에서 미리)
         self.analyzer = LogAnalyzer()
+        self.analyzer.warm_up()
         
-        # OpenCode 설치 확인 (백그라운드에서)
-        self._check_opencode_setup()
+        # OpenCode 설치/상태 확인은 AI Analysis 패널이 처음 보일 때 실행
+        self._opencode_status_checked = False
+        self._status_check_thread: Optional[OpenCodeStatusCheckThread] = None
+        self._status_check_running = False
+        self._status_recheck_pending = False  # 확인 중에 다시 요청되면 끝난 뒤 한 번 더 확인
         
         # Create menu bar
         self._create_menu_bar()
@@ -64,28 +237,30 @@ class MainWindow(QMainWindow):
         self.tabs = QTabWidget()
         
         self.log_table = LogTable()
-        self.dashboard = DashboardContainer()
         self.analysis_panel = AnalysisPanel()
         
-        # OpenCode 전용 페이지 생성
-        from ui.opencode_page import OpenCodePage
-        self.opencode_page = OpenCodePage()
+        # Dashboard / OpenCode 페이지는 탭을 처음 열 때 생성 (시작 시 import·ADB 조회 비용 제거)
+        self.dashboard = None
+        self.opencode_page = None
+        self._device_id = None  # 대시보드 생성 전에 선택된 디바이스 ID
         
         # 분석 패널 시그널 연결
         self.analysis_panel.analysis_requested.connect(self._on_analysis_requested)
         self.analysis_panel.chat_message_sent.connect(self._on_chat_message_sent)
         self.analysis_panel.opencode_install_requested.connect(self._on_opencode_install_requested)
-        self.analysis_panel.open_settings_requested.connect(lambda: self.tabs.setCurrentWidget(self.opencode_page))
+        self.analysis_panel.open_settings_requested.connect(lambda: self.tabs.setCurrentIndex(self._opencode_tab_index))
         
         # LogTable 상태 메시지를 메인 윈도우 상태바에 연결
         self.log_table.status_message.connect(self._on_log_table_status)
         
-        # OpenCode 상태 확인 및 UI 업데이트
-        self._check_opencode_status()
-        
         self.tabs.addTab(self.log_table, "📋 Log View")
-        self.tabs.addTab(self.dashboard, "📊 Dashboard")
-        self.tabs.addTab(self.opencode_page, "🤖 OpenCode")
+        dashboard_tab_index = self.tabs.addTab(QWidget(), "📊 Dashboard")
+        self._opencode_tab_index = self.tabs.addTab(QWidget(), "🤖 OpenCode")
+        self._tab_factories = {
+            dashboard_tab_index: self._create_dashboard,
+            self._opencode_tab_index: self._create_opencode_page,
+        }
+        self.tabs.currentChanged.connect(self._ensure_tab)
         
         # 디바이스 변경 시 대시보드에 알림
         self.device_combo.currentTextChanged.connect(self._on_device_changed)
@@ -118,6 +293,8 @@ class MainWindow(QMainWindow):
         workspace_menu.addSeparator()
         workspace_menu.addAction("Load Project", self._load_project)
         workspace_menu.addAction("Close Project", self._close_project)
+        workspace_menu.addSeparator()
+        workspace_menu.addAction("Rescan ADB", self._rescan_adb)
         
         # Settings 메뉴
         settings_menu = menubar.addMenu("Settings")
@@ -152,14 +329,21 @@ class MainWindow(QMainWindow):
         self.log_table.clear_all_logs()
     
     def _open_workspace_manager(self):
-        from ui.components.workspace_dialog import WorkspaceDialog
-        dialog = WorkspaceDialog(self)
+        if self._workspace_dialog is None:
+            from ui.components.workspace_dialog import WorkspaceDialog
+            self._workspace_dialog = WorkspaceDialog(self)
+        dialog = self._workspace_dialog
         if dialog.exec():
             # Workspace 설정 완료
-            self.current_project = dialog.get_selected_project()
-            self.current_branch = dialog.get_selected_branch()
+            self._set_current_project(dialog.get_selected_project(), dialog.get_selected_branch())
             self._update_status_bar()
     
+    def _set_current_project(self, project, branch):
+        """현재 프로젝트/브랜치 설정 (표시용 이름도 함께 계산)"""
+        self.current_project = project
+        self.current_branch = branch
+        self._project_basename = project.rsplit('/', 1)[-1] if project else None
+    
     def _load_project(self):
         if not self.current_project:
             self._open_workspace_manager()
@@ -168,19 +352,52 @@ class MainWindow(QMainWindow):
         QMessageBox.information(self, "Project Loading", f"Loading {self.current_project} ({self.current_branch})...\nThis will clone the repository and index it for OpenCode.")
     
     def _close_project(self):
-        self.current_project = None
-        self.current_branch = None
+        self._set_current_project(None, None)
         self._update_status_bar()
         QMessageBox.information(self, "Project Closed", "Current project has been closed.")
     
     def _open_preferences(self):
         """설정 다이얼로그 열기"""
-        from ui.components.preferences_dialog import PreferencesDialog
-        dialog = PreferencesDialog(self)
-        if dialog.exec():
+        if self._prefs_dialog is None:
+            from ui.components.preferences_dialog import PreferencesDialog
+            self._prefs_dialog = PreferencesDialog(self)
+        if self._prefs_dialog.exec():
             # 설정이 변경되었으면 OpenCode 상태 다시 확인
+            _invalidate_probe_cache()
             self._check_opencode_status()
     
+    def _ensure_tab(self, index: int):
+        """자리표시 탭이 처음 선택되면 실제 위젯을 생성해 교체"""
+        factory = self._tab_factories.pop(index, None)
+        if factory is None:
+            return
+        widget = factory()
+        label = self.tabs.tabText(index)
+        placeholder = self.tabs.widget(index)
+        # 교체 중 currentChanged 재진입 방지
+        with QSignalBlocker(self.tabs):
+            self.tabs.removeTab(index)
+            self.tabs.insertTab(index, widget, label)
+            self.tabs.setCurrentIndex(index)
+        placeholder.deleteLater()
+    
+    def _create_dashboard(self):
+        from ui.dashboard.container import DashboardContainer
+        self.dashboard = DashboardContainer()
+        self.dashboard.set_device_id(self._device_id)
+        return self.dashboard
+    
+    def _create_opencode_page(self):
+        from ui.opencode_page import OpenCodePage
+        self.opencode_page = OpenCodePage(analyzer=self.analyzer)
+        return self.opencode_page
+    
+    def _set_dashboard_device(self, device_id):
+        """대시보드 디바이스 ID 설정 (대시보드가 아직 없으면 생성 시 전달)"""
+        self._device_id = device_id
+        if self.dashboard is not None:
+            self.dashboard.set_device_id(device_id)
+    
     def _create_ai_analysis_dock(self):
         """AI Analysis를 사이드 패널(Dock Widget)로 생성"""
         # Dock Widget 생성
@@ -194,8 +411,8 @@ class MainWindow(QMainWindow):
         self.ai_analysis_dock.setMinimumWidth(300)  # 최소 너비
         self.ai_analysis_dock.setMaximumWidth(800)  # 최대 너비
         
-        # 기본적으로 숨김 상태로 시작 (필요시 주석 해제하여 기본 표시)
-        # self.ai_analysis_dock.setVisible(True)
+        # 기본적으로 숨김 상태로 시작 (툴바 토글 버튼 초기 상태와 일치)
+        self.ai_analysis_dock.setVisible(False)
         
         # 토글 가능하도록 설정
         self.ai_analysis_dock.setFeatures(
@@ -204,7 +421,15 @@ class MainWindow(QMainWindow):
             QDockWidget.DockWidgetFeature.DockWidgetClosable
         )
         
-        # 도킹 위치 변경 시 크기 조정
+        # 처음 보일 때 OpenCode 설치/상태 확인
+        self.ai_analysis_dock.visibilityChanged.connect(self._on_ai_dock_visibility_changed)
+        
+        # 도킹 위치 변경 시 크기 조정 (드래그 중 연속 발생하므로 마지막 위치만 50ms 후 반영)
+        self._pending_dock_area = Qt.DockWidgetArea.RightDockWidgetArea
+        self._dock_reapply_timer = QTimer(self)
+        self._dock_reapply_timer.setSingleShot(True)
+        self._dock_reapply_timer.setInterval(50)
+        self._dock_reapply_timer.timeout.connect(self._apply_dock_constraints)
         self.ai_analysis_dock.dockLocationChanged.connect(self._on_dock_location_changed)
         
         # 툴바에 토글 버튼 추가
@@ -216,7 +441,13 @@ class MainWindow(QMainWindow):
         self.addToolBar(Qt.ToolBarArea.RightToolBarArea, toolbar)
     
     def _on_dock_location_changed(self, area):
-        """도킹 위치가 변경될 때 크기 조정"""
+        """도킹 위치가 변경될 때 크기 조정 예약"""
+        self._pending_dock_area = area
+        self._dock_reapply_timer.start()
+    
+    def _apply_dock_constraints(self):
+        """마지막 도킹 위치 기준으로 크기 제한 적용"""
+        area = self._pending_dock_area
         if area == Qt.DockWidgetArea.TopDockWidgetArea or area == Qt.DockWidgetArea.BottomDockWidgetArea:
             # 상단/하단 도킹 시 가로 너비를 창 너비에 맞춤
             self.ai_analysis_dock.setMinimumWidth(0)  # 최소 너비 제한 해제
@@ -232,16 +463,48 @@ class MainWindow(QMainWindow):
             self.ai_analysis_dock.setMinimumHeight(0)
             self.ai_analysis_dock.setMaximumHeight(16777215)
     
+    def _get_err_box(self) -> QMessageBox:
+        """오류 알림용 공유 QMessageBox"""
+        if self._err_box is None:
+            self._err_box = QMessageBox(self)
+            self._err_box.setStandardButtons(QMessageBox.StandardButton.Ok)
+        return self._err_box
+    
+    def _show_error(self, title: str, text: str, icon: QMessageBox.Icon = QMessageBox.Icon.Warning):
+        """
+        공유 메시지 박스로 오류 표시 (모달)
+        
+        공유 박스가 이미 떠 있으면 (exec 중 다른 오류 도착) 내용을 덮어쓰지 않고
+        별도 박스를 open()으로 띄움 (닫히면 삭제).
+        """
+        box = self._get_err_box()
+        if box.isVisible():
+            extra = QMessageBox(icon, title, text, QMessageBox.StandardButton.Ok, self)
+            extra.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
+            extra.open()
+            return
+        box.setIcon(icon)
+        box.setWindowTitle(title)
+        box.setText(text)
+        box.exec()
+    
     def _toggle_ai_analysis(self, checked):
         """AI Analysis 사이드 패널 토글"""
         self.ai_analysis_dock.setVisible(checked)
     
+    def _on_ai_dock_visibility_changed(self, visible: bool):
+        """AI Analysis 패널이 처음 보일 때 OpenCode 설치/상태 확인 (시작 시 subprocess 실행 방지)"""
+        if visible and not self._opencode_status_checked:
+            self._opencode_status_checked = True
+            self._check_opencode_setup()
+            self._check_opencode_status()
+    
     def _check_opencode_setup(self):
         """OpenCode 설치 확인 및 안내 (백그라운드)"""
         # 백그라운드에서 확인 (UI 블로킹 방지)
         def check_in_background():
             installer = OpenCodeInstaller()
-            node_installed, _ = installer.check_nodejs()
+            node_installed, _ = _cached_node_check(_probe_bucket())
             opencode_available = installer.check_opencode()
             
             if not node_installed:
@@ -259,15 +522,40 @@ class MainWindow(QMainWindow):
         thread = threading.Thread(target=check_in_background, daemon=True)
         thread.start()
     
+    def _node_state(self) -> Tuple[bool, Optional[str]]:
+        """Node.js 설치 여부/버전 (PROBE_CACHE_TTL 동안 재사용)"""
+        return _cached_node_check(_probe_bucket())
+    
+    def _opencode_installed(self) -> bool:
+        """OpenCode CLI 설치 여부 (PROBE_CACHE_TTL 동안 재사용)"""
+        return _cached_opencode_check(self.analyzer, _probe_bucket())
+    
     def _check_opencode_status(self):
         """OpenCode 상태 확인 및 UI 업데이트"""
+        if self._status_check_running:
+            # 동시에 여러 확인 스레드가 돌며 결과가 뒤섞이지 않도록 하나만 실행
+            self._status_recheck_pending = True
+            return
         logger.info("[OpenCode] 상태 확인 시작")
+        if self._status_check_thread is not None:
+            self._status_check_thread.wait()  # finished 직후 남은 종료 처리 대기 (즉시 반환)
         # QThread를 사용하여 상태 확인
-        self.status_check_thread = OpenCodeStatusCheckThread(self.analyzer)
-        self.status_check_thread.status_checked.connect(self._on_status_checked)
+        self._status_check_thread = OpenCodeStatusCheckThread(self.analyzer)
+        self._status_check_thread.status_checked.connect(self._on_status_checked)
+        self._status_check_thread.finished.connect(self._on_status_check_finished)
         logger.info("[OpenCode] 스레드 시작")
-        self.status_check_thread.start()
+        self._status_check_running = True
+        self._status_check_thread.start()
+    
+    @pyqtSlot()
+    def _on_status_check_finished(self):
+        """확인 스레드 종료 - 확인 중 들어온 요청이 있으면 다시 확인"""
+        self._status_check_running = False
+        if self._status_recheck_pending:
+            self._status_recheck_pending = False
+            self._check_opencode_status()
     
+    @pyqtSlot(str, str)
     def _on_status_checked(self, status: str, message: str):
         """상태 확인 완료 처리 (메인 스레드에서 호출)"""
         logger.info(f"[OpenCode] 상태 확인 완료: status={status}, message={message}")
@@ -277,7 +565,7 @@ class MainWindow(QMainWindow):
     def _on_opencode_install_requested(self):
         """OpenCode 설치 요청 처리"""
         installer = OpenCodeInstaller()
-        node_installed, _ = installer.check_nodejs()
+        node_installed, _ = self._node_state()
         
         if not node_installed:
             QMessageBox.warning(
@@ -297,35 +585,50 @@ class MainWindow(QMainWindow):
         )
         
         if reply == QMessageBox.StandardButton.Yes:
-            # 설치 스레드 시작
-            self.install_thread = OpenCodeInstallThread(installer)
-            self.install_thread.install_progress.connect(self._on_install_progress)
-            self.install_thread.install_complete.connect(self._on_install_complete)
-            self.install_thread.install_error.connect(self._on_install_error)
-            self.install_thread.start()
-            
-            self.analysis_panel.set_opencode_status("installing", "OpenCode 설치 중...")
+            self._start_opencode_install(installer)
+    
+    def _start_opencode_install(self, installer: OpenCodeInstaller):
+        """설치 작업을 공용 스레드 풀에 제출 (진행 상황은 분석 패널 상태로 표시, 설치 중이면 무시)"""
+        if self._opencode_installing:
+            return
+        self._opencode_installing = True
+        QThreadPool.globalInstance().start(OpenCodeInstallTask(installer, self._dispatcher))
+        
+        self.analysis_panel.set_opencode_status("installing", "OpenCode 설치 중...")
     
+    @pyqtSlot(str)
     def _on_install_progress(self, message: str):
         """설치 진행 상황 업데이트"""
         logger.info(f"[OpenCode] 설치 진행: {message}")
         self.analysis_panel.set_opencode_status("installing", message)
     
+    @pyqtSlot(bool, str)
     def _on_install_complete(self, success: bool, message: str):
         """설치 완료 처리"""
         logger.info(f"[OpenCode] 설치 완료: success={success}, message={message}")
+        self._opencode_installing = False
+        _invalidate_probe_cache()
+        pending_analysis, self._pending_analysis = self._pending_analysis, None
         if success:
             self.analysis_panel.set_opencode_status("installed", message)
-            QMessageBox.information(self, "설치 완료", "OpenCode가 성공적으로 설치되었습니다.")
+            if pending_analysis:
+                # 분석 요청 중 설치한 경우 알림 없이 바로 분석 시작
+                self._start_analysis(pending_analysis)
+            else:
+                QMessageBox.information(self, "설치 완료", "OpenCode가 성공적으로 설치되었습니다.")
         else:
             self.analysis_panel.set_opencode_status("not_installed", message)
-            QMessageBox.warning(self, "설치 실패", f"OpenCode 설치에 실패했습니다:\n\n{message}")
+            self._show_error("설치 실패", f"OpenCode 설치에 실패했습니다:\n\n{message}")
     
+    @pyqtSlot(str)
     def _on_install_error(self, error: str):
         """설치 오류 처리"""
         logger.error(f"[OpenCode] 설치 오류: {error}")
+        self._opencode_installing = False
+        self._pending_analysis = None
+        _invalidate_probe_cache()
         self.analysis_panel.set_opencode_status("not_installed", error)
-        QMessageBox.critical(self, "설치 오류", f"오류가 발생했습니다:\n\n{error}")
+        self._show_error("설치 오류", f"오류가 발생했습니다:\n\n{error}", QMessageBox.Icon.Critical)
     
     def _on_analysis_requested(self, _):
         """분석 요청 처리"""
@@ -336,7 +639,7 @@ class MainWindow(QMainWindow):
         
         # OpenCode 설치 확인 및 자동 설치 시도
         installer = OpenCodeInstaller()
-        node_installed, node_version = installer.check_nodejs()
+        node_installed, node_version = self._node_state()
         
         if not node_installed:
             QMessageBox.warning(
@@ -346,7 +649,7 @@ class MainWindow(QMainWindow):
             )
             return
         
-        if not self.analyzer.check_installation():
+        if not self._opencode_installed():
             # OpenCode 자동 설치 시도
             reply = QMessageBox.question(
                 self,
@@ -358,41 +661,99 @@ class MainWindow(QMainWindow):
             )
             
             if reply == QMessageBox.StandardButton.Yes:
-                # 설치 진행 다이얼로그 표시
-                QMessageBox.information(
-                    self,
-                    "OpenCode 설치 중",
-                    "OpenCode를 설치하고 있습니다.\n"
-                    "잠시만 기다려주세요..."
-                )
-                
-                success, message = installer.ensure_opencode_available()
-                if not success:
-                    QMessageBox.warning(
-                        self,
-                        "설치 실패",
-                        f"OpenCode 설치에 실패했습니다:\n\n{message}\n\n"
-                        "수동으로 설치해주세요:\n"
-                        "npm install -g @opencode-ai/cli"
-                    )
-                    return
-            else:
-                return
+                # 백그라운드 설치 후 _on_install_complete에서 분석 시작
+                self._pending_analysis = issue_description
+                self._start_opencode_install(installer)
+            return
         
+        self._start_analysis(issue_description)
+    
+    def _start_analysis(self, issue_description: str):
+        """분석 작업 시작"""
         # 작업 공간 설정 (프로젝트가 로드된 경우)
         if self.current_project:
             # workspace 폴더 경로 구성 (실제 구현 시 경로 조정 필요)
-            workspace_path = f"workspace/{self.current_project.split('/')[-1]}"
+            workspace_path = f"workspace/{self._project_basename}"
             self.analyzer.set_workspace(workspace_path)
         
-        # 분석 시작 (비동기)
-        self.analysis_thread = AnalysisThread(self.analyzer, issue_description, self.log_table.get_recent_logs())
-        self.analysis_thread.analysis_complete.connect(self._on_analysis_complete)
-        self.analysis_thread.analysis_error.connect(self._on_analysis_error)
-        self.analysis_thread.start()
+        # 로그는 프롬프트용 문자열로 한 번만 변환해 넘김 (워커는 변경 불가능한 스냅샷만 보유)
+        t0 = time.perf_counter_ns()
+        log_payload = self.analyzer.format_logs_for_analysis(self.log_table.get_recent_logs(MAX_LOG_LINES))
+        serialize_ns = time.perf_counter_ns() - t0
+        
+        # 같은 요청이 이미 진행 중이거나 직전에 요청했으면 무시 (연속 클릭)
+        key = self.analyzer.analysis_key(issue_description, log_payload)
+        now = time.monotonic()
+        if key == self._analysis_inflight_key or now - self._last_analysis_submit < ANALYSIS_SUBMIT_DEBOUNCE:
+            logger.debug("[Analysis] 중복 요청 무시")
+            return
+        self._last_analysis_submit = now
+        self._analysis_serialize_ns = serialize_ns
+        
+        # 이전 분석이 아직 진행 중이면 중단 (결과는 버림)
+        if self._analysis_task is not None:
+            self._analysis_task.request_interruption()
+        
+        self._submit_analysis(issue_description, log_payload, key)
+    
+    def _submit_analysis(self, issue_description: str, log_payload: str, key: bytes, attempt: int = 0):
+        """분석 작업을 공용 스레드 풀에 제출 (attempt: 자동 재시도 횟수)"""
+        task = AnalysisTask(self.analyzer, issue_description, log_payload, self._dispatcher, attempt)
+        self._analysis_task = task
+        self._analysis_inflight_key = key
+        QThreadPool.globalInstance().start(task)
+    
+    def _retry_analysis(self, task: "AnalysisTask", key: bytes):
+        """일시적 오류 후 같은 요청 재시도 (그 사이 다른 분석이 시작됐으면 취소)"""
+        if self._analysis_task is not None or self._analysis_inflight_key != key:
+            return
+        self._submit_analysis(task.issue_description, task.log_payload, key, task.attempt + 1)
+    
+    def _is_current_analysis(self, payload: dict) -> bool:
+        """
+        현재 분석 작업이 보낸 시그널인지 (payload['_task'])
+        
+        워커는 중단 요청을 emit 직전에만 확인하므로, 중단 직전에 emit되어 큐에 남아 있던
+        이전 작업의 결과가 새 작업이 시작된 뒤 도착할 수 있음
+        """
+        if payload.get('_task') is not self._analysis_task:
+            logger.debug("[Analysis] 이전 작업의 결과 무시")
+            return False
+        return True
+    
+    @pyqtSlot(dict)
+    def _on_analysis_progress(self, partial: dict):
+        """분석 중간 결과 표시 (완료 전까지 도착한 출력)"""
+        if not self._is_current_analysis(partial):
+            return
+        self.analysis_panel.set_analysis_result(partial.get('analysis', ''))
+    
+    def _schedule_retry(self, task: Optional["AnalysisTask"], error_type: Optional[str], error_message: str) -> bool:
+        """
+        일시적 오류면 대기 후 같은 요청 재시도 예약
+        
+        Returns:
+            재시도를 예약했으면 True (호출한 쪽은 오류를 표시하지 않음)
+        """
+        if task is None or error_type not in TRANSIENT_ERROR_TYPES or task.attempt >= len(ANALYSIS_RETRY_DELAYS):
+            return False
+        delay = ANALYSIS_RETRY_DELAYS[task.attempt]
+        logger.warning(f"[Analysis] 일시적 오류 ({error_type}: {error_message}), {delay}초 후 재시도")
+        # 재시도 대기 중에는 in-flight 키를 유지해 같은 요청 중복 제출 방지
+        key = self._analysis_inflight_key
+        QTimer.singleShot(int(delay * 1000), lambda: self._retry_analysis(task, key))
+        return True
     
+    @pyqtSlot(dict)
     def _on_analysis_complete(self, result: dict):
-        """분석 완료 처리"""
+        """분석 완료 처리 (클라이언트가 타임아웃 등 일시적 오류로 실패를 돌려주면 자동 재시도)"""
+        if not self._is_current_analysis(result):
+            return
+        task, self._analysis_task = self._analysis_task, None
+        self._record_analysis_timings(result.get('_timings'))
+        if not result.get('success') and self._schedule_retry(task, result.get('error_type'), result.get('error', '')):
+            return
+        self._analysis_inflight_key = None
         logger.info(f"[Analysis] 완료: success={result.get('success')}")
         if result.get('success'):
             analysis_text = result.get('analysis', '분석 결과가 없습니다.')
@@ -405,9 +766,20 @@ class MainWindow(QMainWindow):
                 f"OpenCode CLI 설치 및 설정을 확인해주세요."
             )
     
-    def _on_analysis_error(self, error_message: str):
-        """분석 오류 처리"""
-        logger.error(f"[Analysis] 오류: {error_message}")
+    @pyqtSlot(dict)
+    def _on_analysis_error(self, error: dict):
+        """분석 오류 처리 (일시적 오류는 대기 후 자동 재시도)"""
+        if not self._is_current_analysis(error):
+            return
+        task, self._analysis_task = self._analysis_task, None
+        error_message = error.get('message', '')
+        logger.debug(f"[Analysis] traceback:\n{error.get('traceback', '')}")
+        
+        if self._schedule_retry(task, error.get('type'), error_message):
+            return
+        
+        self._analysis_inflight_key = None
+        logger.error(f"[Analysis] 오류: {error.get('type')}: {error_message}")
         self.analysis_panel.set_analysis_result(
             f"### 분석 오류\n\n**오류 메시지**: {error_message}\n\n"
             f"OpenCode CLI 실행 중 문제가 발생했습니다."
@@ -417,19 +789,41 @@ class MainWindow(QMainWindow):
     def _on_chat_message_sent(self, message):
         """채팅 메시지 전송 처리"""
         # OpenCode 설치 확인
-        if not self.analyzer.check_installation():
+        if not self._opencode_installed():
             self.analysis_panel.append_chat_response(
                 "OpenCode CLI가 설치되어 있지 않습니다. "
                 "npm install -g @opencode-ai/cli 명령으로 설치해주세요."
             )
             return
         
-        # 비동기 채팅 스레드 시작
-        self.chat_thread = ChatThread(self.analyzer, message)
-        self.chat_thread.chat_complete.connect(self._on_chat_complete)
-        self.chat_thread.chat_error.connect(self._on_chat_error)
-        self.chat_thread.start()
+        # 응답 대기 중 같은 메시지를 연달아 보낸 경우 한 번만 전송
+        if self._chat_pending and self._chat_pending[-1] == message:
+            return
+        self._chat_pending.append(message)
+        self._dispatch_chat()
+    
+    def _dispatch_chat(self):
+        """대기 중인 채팅 메시지를 한 번의 요청으로 묶어 전송 (요청은 한 번에 하나만)"""
+        if self._chat_in_flight or not self._chat_pending:
+            return
+        batch = self._chat_pending[:MAX_CHAT_MSGS_PER_BATCH]
+        del self._chat_pending[:MAX_CHAT_MSGS_PER_BATCH]
+        message = batch[0] if len(batch) == 1 else "\n---\n".join(batch)
+        
+        # 비동기 채팅 시작 (공용 스레드 풀)
+        self._chat_in_flight = True
+        task = ChatTask(self.analyzer, message, self._dispatcher)
+        self._chat_task = task
+        QThreadPool.globalInstance().start(task)
+    
+    @pyqtSlot()  # chat_complete(dict)/chat_error(str) 모두 연결 (인자는 사용 안 함)
+    def _on_chat_task_done(self):
+        """채팅 요청 종료 - 그동안 쌓인 메시지 전송"""
+        self._chat_in_flight = False
+        self._chat_task = None
+        self._dispatch_chat()
     
+    @pyqtSlot(dict)
     def _on_chat_complete(self, result: dict):
         """채팅 응답 완료 처리"""
         if result.get('success'):
@@ -439,30 +833,76 @@ class MainWindow(QMainWindow):
             error = result.get('error', '알 수 없는 오류')
             self.analysis_panel.append_chat_response(f"오류: {error}")
     
-    def _on_chat_error(self, error_message: str):
+    @pyqtSlot(dict)
+    def _on_chat_error(self, error: dict):
         """채팅 오류 처리"""
-        self.analysis_panel.append_chat_response(f"오류: {error_message}")
+        logger.debug(f"[Chat] traceback:\n{error.get('traceback', '')}")
+        self.analysis_panel.append_chat_response(f"오류: {error.get('message', '')}")
+    
+    def _record_analysis_timings(self, timings: Optional[dict]):
+        """완료된 분석의 단계별 시간 기록 (로그 변환 / analyzer 내부 / 워커 전체 / 결과 전달)"""
+        if not timings:
+            return
+        timings['deliver_ns'] = time.perf_counter_ns() - timings.pop('emitted_at_ns', time.perf_counter_ns())
+        timings['serialize_ns'] = self._analysis_serialize_ns
+        self._analysis_timings.append(timings)
+        logger.debug(f"[Analysis] timings: {timings}")
+    
+    def _log_analysis_timing_stats(self):
+        """단계별 소요 시간 p50/p95/p99 로그 (종료 시)"""
+        if not self._analysis_timings:
+            return
+        for phase in ('serialize_ns', 'format_ns', 'opencode_ns', 'analyze_ns', 'deliver_ns'):
+            values = sorted(t[phase] for t in self._analysis_timings if phase in t)
+            if values:
+                p50, p95, p99 = (_percentile(values, p) / 1e6 for p in (50, 95, 99))
+                logger.info(f"[Analysis] {phase[:-3]}: n={len(values)} "
+                            f"p50={p50:.1f}ms p95={p95:.1f}ms p99={p99:.1f}ms")
+    
+    def closeEvent(self, event):
+        """창 닫기 - 진행 중인 분석/채팅/설치 중단 요청 후 결과 전달 차단"""
+        for task in (self._analysis_task, self._chat_task):
+            if task is not None:
+                task.request_interruption()
+        # 설치 스크립트가 창을 닫은 뒤에도 남아 실행되지 않도록
+        if self.opencode_page is not None:
+            self.opencode_page.cancel_installs()
+        # 부모 없는 adb 스레드가 실행 중에 파괴되지 않도록 종료 대기 (adb 호출은 3~5초 타임아웃)
+        for thread in (self._refresh_thread, self._connect_thread):
+            if thread is not None:
+                thread.wait()
+        # 중단 직전에 워커가 emit한 결과가 닫힌 위젯의 슬롯으로 가지 않도록
+        self._dispatcher.blockSignals(True)
+        self._log_analysis_timing_stats()
+        super().closeEvent(event)
     
     def _on_device_changed(self, device_text):
         """디바이스 변경 시 대시보드에 디바이스 ID 전달"""
         if device_text and device_text != "No devices found":
-            # 디바이스 ID 추출
-            device_id = device_text
-            if '(' in device_text and ')' in device_text:
-                match = re.search(r'\(([^)]+)\)', device_text)
-                if match:
-                    device_id = match.group(1)
-            self.dashboard.set_device_id(device_id)
+            self._current_device_text = device_text
+            self._set_dashboard_device(_extract_device_id(device_text))
         else:
-            self.dashboard.set_device_id(None)
+            self._current_device_text = "No device"
+            self._set_dashboard_device(None)
+        self._refresh_status_prefix()
+    
+    def _refresh_status_prefix(self) -> str:
+        """프로젝트/디바이스 변경 시 상태바 접두 문자열 재계산, 디바이스 정보 반환"""
+        device_info = self._current_device_text
+        
+        if self.current_project:
+            project_info = f"Project: {self._project_basename} ({self.current_branch})"
+            self._status_prefix = f"{project_info} | Device: {device_info}"
+        else:
+            self._status_prefix = f"No project loaded | Device: {device_info}"
+        return device_info
     
     def _update_status_bar(self):
         # 현재 선택된 디바이스 정보 가져오기
-        device_text = self.device_combo.currentText()
-        device_info = device_text if device_text and device_text != "No devices found" else "No device"
+        device_info = self._refresh_status_prefix()
         
         if self.current_project:
-            project_display = f"{self.current_project.split('/')[-1]} ({self.current_branch})"
+            project_display = f"{self._project_basename} ({self.current_branch})"
             self.project_label.setText(project_display)
             self.project_label.setStyleSheet("color: green; font-weight: bold;")
             self.statusBar().showMessage(f"Project: {self.current_project} | Branch: {self.current_branch} | Device: {device_info}")
@@ -472,115 +912,57 @@ class MainWindow(QMainWindow):
             self.statusBar().showMessage(f"No project loaded | Device: {device_info}")
     
     def _on_log_table_status(self, message: str):
-        print(f"[MainWindow] LogTable 상태 메시지 수신: {message}")
         """LogTable에서 상태 메시지 수신하여 상태바에 표시"""
+        logger.debug("[MainWindow] LogTable 상태 메시지 수신: %s", message)
         # 기존 상태바 메시지에 LogTable 상태 추가
-        device_text = self.device_combo.currentText()
-        device_info = device_text if device_text and device_text != "No devices found" else "No device"
-        
-        if self.current_project:
-            project_info = f"Project: {self.current_project.split('/')[-1]} ({self.current_branch})"
-            self.statusBar().showMessage(f"{project_info} | Device: {device_info} | {message}")
-        else:
-            self.statusBar().showMessage(f"No project loaded | Device: {device_info} | {message}")
+        self.statusBar().showMessage(f"{self._status_prefix} | {message}")
     
-    def _find_adb_path(self):
-        """adb.exe 경로 찾기"""
-        # PATH에서 찾기
-        adb_path = 'adb'
-        try:
-            result = subprocess.run(['adb', 'version'], capture_output=True, text=True, encoding='utf-8', errors='replace', timeout=2)
-            if result.returncode == 0:
-                return adb_path
-        except:
-            pass
-        
-        # Windows 환경 변수에서 찾기
-        android_home = os.environ.get('ANDROID_HOME') or os.environ.get('ANDROID_SDK_ROOT')
-        if android_home:
-            adb_path = os.path.join(android_home, 'platform-tools', 'adb.exe')
-            if os.path.exists(adb_path):
-                return adb_path
-        
-        # 일반적인 Android Studio 경로
-        common_paths = [
-            os.path.join(os.environ.get('LOCALAPPDATA', ''), 'Android', 'Sdk', 'platform-tools', 'adb.exe'),
-            os.path.join(os.environ.get('USERPROFILE', ''), 'AppData', 'Local', 'Android', 'Sdk', 'platform-tools', 'adb.exe'),
-        ]
-        for path in common_paths:
-            if os.path.exists(path):
-                return path
-        
-        return 'adb'  # 기본값
+    def _rescan_adb(self):
+        """캐시된 adb 경로를 버리고 디바이스 목록 다시 조회"""
+        _clear_adb_path_cache()
+        self._refresh_devices()
     
     def _refresh_devices(self):
-        """adb devices로 연결된 디바이스 목록 새로고침"""
-        adb_path = self._find_adb_path()
+        """adb devices로 연결된 디바이스 목록 새로고침 (백그라운드 스레드)"""
+        if self._refresh_thread is not None and self._refresh_thread.isRunning():
+            return
+        
+        self.refresh_devices_btn.setEnabled(False)
+        self._refresh_thread = DeviceRefreshThread()
+        self._refresh_thread.devices_ready.connect(self._on_devices_ready)
+        self._refresh_thread.error.connect(self._on_devices_error)
+        self._refresh_thread.finished.connect(lambda: self.refresh_devices_btn.setEnabled(True))
+        self._refresh_thread.start()
+    
+    @pyqtSlot(list)
+    def _on_devices_ready(self, devices: list):
+        """디바이스 목록으로 ComboBox 갱신 (메인 스레드)"""
         current_selection = self.device_combo.currentText()
         
-        try:
-            result = subprocess.run(
-                [adb_path, 'devices'],
-                capture_output=True,
-                text=True,
-                timeout=5,
-                encoding='utf-8',
-                errors='ignore'
-            )
-            
-            if result.returncode != 0:
-                QMessageBox.warning(self, "ADB Error", f"Failed to run 'adb devices':\n{result.stderr}")
-                return
-            
-            # 디바이스 목록 파싱
-            devices = []
-            lines = result.stdout.strip().split('\n')
-            for line in lines[1:]:  # 첫 번째 줄은 "List of devices attached" 스킵
-                line = line.strip()
-                if not line or 'offline' in line.lower():
-                    continue
-                
-                # 형식: "device_id    device" 또는 "device_id    unauthorized"
-                parts = line.split()
-                if len(parts) >= 2 and parts[1] == 'device':
-                    device_id = parts[0]
-                    # 디바이스 이름 추출 시도 (adb -s device_id shell getprop ro.product.model)
-                    try:
-                        name_result = subprocess.run(
-                            [adb_path, '-s', device_id, 'shell', 'getprop', 'ro.product.model'],
-                            capture_output=True,
-                            text=True,
-                            timeout=2,
-                            encoding='utf-8',
-                            errors='ignore'
-                        )
-                        if name_result.returncode == 0 and name_result.stdout.strip():
-                            device_name = name_result.stdout.strip()
-                            devices.append(f"{device_name} ({device_id})")
-                        else:
-                            devices.append(device_id)
-                    except:
-                        devices.append(device_id)
-            
-            # ComboBox 업데이트
+        # clear/addItems 중 currentTextChanged가 여러 번 발생하지 않도록 시그널 차단
+        with QSignalBlocker(self.device_combo):
             self.device_combo.clear()
             if devices:
                 self.device_combo.addItems(devices)
-                # 이전 선택 유지
+                self.device_combo.setEnabled(True)
+                self.conn_btn.setEnabled(True)
+                # 이전 선택 유지 (목록에 없으면 첫 번째 항목)
                 if current_selection in devices:
                     self.device_combo.setCurrentText(current_selection)
-                elif current_selection:
-                    # 이전 선택이 목록에 없으면 첫 번째 항목 선택
+                else:
                     self.device_combo.setCurrentIndex(0)
             else:
                 self.device_combo.addItem("No devices found")
                 self.device_combo.setEnabled(False)
                 self.conn_btn.setEnabled(False)
-            
-        except subprocess.TimeoutExpired:
-            QMessageBox.warning(self, "Timeout", "ADB command timed out. Please check your ADB connection.")
-        except Exception as e:
-            QMessageBox.warning(self, "Error", f"Failed to refresh devices: {str(e)}")
+        
+        # 차단된 변경 알림 대신 최종 선택으로 한 번만 반영
+        self._on_device_changed(self.device_combo.currentText())
+    
+    @pyqtSlot(str, str)
+    def _on_devices_error(self, title: str, message: str):
+        """디바이스 목록 조회 실패"""
+        self._show_error(title, message)
     
     def _connect_device(self):
         """선택된 디바이스에 연결"""
@@ -589,36 +971,32 @@ class MainWindow(QMainWindow):
             QMessageBox.warning(self, "No Device", "Please select a device first.")
             return
         
-        # 디바이스 ID 추출 (예: "Pixel 6 Pro (emulator-5554)" -> "emulator-5554")
-        device_id = device_text
-        if '(' in device_text and ')' in device_text:
-            match = re.search(r'\(([^)]+)\)', device_text)
-            if match:
-                device_id = match.group(1)
+        device_id = _extract_device_id(device_text)
         
-        # 연결 상태 확인
-        adb_path = self._find_adb_path()
-        try:
-            result = subprocess.run(
-                [adb_path, '-s', device_id, 'shell', 'echo', 'connected'],
-                capture_output=True,
-                text=True,
-                timeout=3,
-                encoding='utf-8',
-                errors='ignore'
-            )
-            
-            if result.returncode == 0:
-                # 대시보드에 디바이스 ID 전달
-                self.dashboard.set_device_id(device_id)
-                QMessageBox.information(self, "Connected", f"Successfully connected to:\n{device_text}")
-                self._update_status_bar()
-            else:
-                QMessageBox.warning(self, "Connection Failed", f"Failed to connect to:\n{device_text}")
-                # 연결 실패 시 대시보드에서 디바이스 ID 제거
-                self.dashboard.set_device_id(None)
-        except Exception as e:
-            QMessageBox.warning(self, "Error", f"Connection error: {str(e)}")
+        if self._connect_thread is not None and self._connect_thread.isRunning():
+            return
+        
+        # 연결 상태 확인 (백그라운드 스레드)
+        self._connect_thread = AdbConnectThread(device_id, device_text)
+        self._connect_thread.connected.connect(self._on_device_connected)
+        self._connect_thread.start()
+    
+    @pyqtSlot(bool, str)
+    def _on_device_connected(self, success: bool, error: str):
+        """연결 확인 결과 처리 (메인 스레드)"""
+        device_id = self._connect_thread.device_id
+        device_text = self._connect_thread.device_text
+        if error:
+            self._show_error("Error", f"Connection error: {error}")
+        elif success:
+            # 대시보드에 디바이스 ID 전달
+            self._set_dashboard_device(device_id)
+            QMessageBox.information(self, "Connected", f"Successfully connected to:\n{device_text}")
+            self._update_status_bar()
+        else:
+            self._show_error("Connection Failed", f"Failed to connect to:\n{device_text}")
+            # 연결 실패 시 대시보드에서 디바이스 ID 제거
+            self._set_dashboard_device(None)
     
     def _create_top_bar(self):
         layout = QHBoxLayout()
@@ -653,6 +1031,71 @@ class MainWindow(QMainWindow):
         return layout
 
 
+class DeviceRefreshThread(QThread):
+    """adb devices -l로 디바이스 목록/모델명을 조회하는 백그라운드 스레드"""
+    devices_ready = pyqtSignal(list)  # ComboBox 표시 문자열 목록
+    error = pyqtSignal(str, str)  # title, message
+    
+    def run(self):
+        """디바이스 목록 조회"""
+        adb_path = _find_adb_path()
+        try:
+            result = subprocess.run(
+                [adb_path, 'devices', '-l'],
+                capture_output=True,
+                text=True,
+                timeout=5,
+                encoding='utf-8',
+                errors='ignore'
+            )
+            
+            if result.returncode != 0:
+                self.error.emit("ADB Error", f"Failed to run 'adb devices':\n{result.stderr}")
+                return
+            
+            # 디바이스 목록 파싱 - "device_id  device ... model:Pixel_6 ..." (offline/unauthorized 제외)
+            # -l 출력에 모델명이 포함되어 디바이스별 getprop 호출 불필요
+            devices = []
+            lines = result.stdout.splitlines()
+            for line in islice(lines, 1, None):  # 첫 번째 줄은 "List of devices attached" 스킵
+                match = _DEVICES_L_RE.match(line)
+                if not match:
+                    continue
+                device_id, model = match.groups()
+                devices.append(f"{model} ({device_id})" if model else device_id)
+            
+            self.devices_ready.emit(devices)
+        except subprocess.TimeoutExpired:
+            self.error.emit("Timeout", "ADB command timed out. Please check your ADB connection.")
+        except Exception as e:
+            self.error.emit("Error", f"Failed to refresh devices: {str(e)}")
+
+
+class AdbConnectThread(QThread):
+    """adb get-state로 디바이스 연결 상태를 확인하는 백그라운드 스레드"""
+    connected = pyqtSignal(bool, str)  # 연결 여부, 오류 메시지 (예외 발생 시)
+    
+    def __init__(self, device_id: str, device_text: str):
+        super().__init__()
+        self.device_id = device_id
+        self.device_text = device_text
+    
+    def run(self):
+        """연결 상태 확인 (디바이스 셸 실행 없이 adb 서버에 상태만 조회)"""
+        try:
+            result = subprocess.run(
+                [_find_adb_path(), '-s', self.device_id, 'get-state'],
+                capture_output=True,
+                text=True,
+                timeout=3,
+                encoding='utf-8',
+                errors='ignore'
+            )
+            self.connected.emit(result.returncode == 0 and result.stdout.strip() == 'device', '')
+        except Exception as e:
+            self.connected.emit(False, str(e))
+
+
 class OpenCodeStatusCheckThread(QThread):
     """OpenCode 상태 확인을 수행하는 백그라운드 스레드"""
     status_checked = pyqtSignal(str, str)  # status, message
@@ -667,10 +1110,8 @@ class OpenCodeStatusCheckThread(QThread):
         """상태 확인 실행"""
         self.logger.info("[OpenCodeStatusCheckThread] run() 시작")
         try:
-            from utils.opencode_installer import OpenCodeInstaller
-            installer = OpenCodeInstaller()
             self.logger.info("[OpenCodeStatusCheckThread] Node.js 확인 중...")
-            node_installed, node_version = installer.check_nodejs()
+            node_installed, node_version = _cached_node_check(_probe_bucket())
             self.logger.info(f"[OpenCodeStatusCheckThread] Node.js 확인 결과: installed={node_installed}, version={node_version}")
             
             if not node_installed:
@@ -680,7 +1121,7 @@ class OpenCodeStatusCheckThread(QThread):
             
             # OpenCode 확인
             self.logger.info("[OpenCodeStatusCheckThread] OpenCode 설치 확인 중...")
-            opencode_installed = self.analyzer.check_installation()
+            opencode_installed = _cached_opencode_check(self.analyzer, _probe_bucket())
             self.logger.info(f"[OpenCodeStatusCheckThread] OpenCode 확인 결과: installed={opencode_installed}")
             
             if opencode_installed:
@@ -694,89 +1135,142 @@ class OpenCodeStatusCheckThread(QThread):
             self.status_checked.emit("not_installed", f"상태 확인 중 오류 발생: {str(e)}")
 
 
-class OpenCodeInstallThread(QThread):
-    """OpenCode 설치를 수행하는 백그라운드 스레드"""
-    install_progress = pyqtSignal(str)
-    install_complete = pyqtSignal(bool, str)
-    install_error = pyqtSignal(str)
+class OpenCodeInstallTask(QRunnable):
+    """OpenCode 설치 작업 (한 번 실행하고 끝나므로 전용 QThread 대신 QThreadPool 워커 스레드에서 실행)"""
     
-    def __init__(self, installer: OpenCodeInstaller):
+    def __init__(self, installer: OpenCodeInstaller, dispatcher: "ResultDispatcher"):
         super().__init__()
         self.installer = installer
-        import logging
-        self.logger = logging.getLogger(__name__)
+        self.dispatcher = dispatcher
     
     def run(self):
         """OpenCode 설치 실행"""
         try:
-            self.install_progress.emit("Node.js 확인 중...")
-            self.logger.info("[OpenCodeInstallThread] Node.js 확인 중...")
+            self.dispatcher.install_progress.emit("Node.js 확인 중...")
+            logger.info("[OpenCodeInstallTask] Node.js 확인 중...")
             node_installed, node_version = self.installer.check_nodejs()
             if not node_installed:
-                self.install_complete.emit(False, "Node.js가 설치되어 있지 않습니다.")
+                self.dispatcher.install_complete.emit(False, "Node.js가 설치되어 있지 않습니다.")
                 return
             
-            self.install_progress.emit("npm 확인 중...")
-            self.logger.info("[OpenCodeInstallThread] npm 확인 중...")
+            self.dispatcher.install_progress.emit("npm 확인 중...")
+            logger.info("[OpenCodeInstallTask] npm 확인 중...")
             npm_installed, _ = self.installer.check_npm()
             if not npm_installed:
-                self.install_complete.emit(False, "npm이 설치되어 있지 않습니다.")
+                self.dispatcher.install_complete.emit(False, "npm이 설치되어 있지 않습니다.")
                 return
             
-            self.install_progress.emit("OpenCode 설치 중...")
-            self.logger.info("[OpenCodeInstallThread] OpenCode 설치 중...")
+            self.dispatcher.install_progress.emit("OpenCode 설치 중...")
+            logger.info("[OpenCodeInstallTask] OpenCode 설치 중...")
             success, message = self.installer.ensure_opencode_available()
-            self.logger.info(f"[OpenCodeInstallThread] 설치 완료: success={success}, message={message}")
-            self.install_complete.emit(success, message)
+            logger.info(f"[OpenCodeInstallTask] 설치 완료: success={success}, message={message}")
+            self.dispatcher.install_complete.emit(success, message)
         except Exception as e:
-            self.logger.error(f"[OpenCodeInstallThread] 오류 발생: {str(e)}", exc_info=True)
-            self.install_error.emit(str(e))
+            logger.error(f"[OpenCodeInstallTask] 오류 발생: {str(e)}", exc_info=True)
+            self.dispatcher.install_error.emit(str(e))
 
 
-class AnalysisThread(QThread):
-    """분석 작업을 수행하는 백그라운드 스레드"""
-    analysis_complete = pyqtSignal(dict)
-    analysis_error = pyqtSignal(str)
+class ResultDispatcher(QObject):
+    """
+    분석/채팅/설치 작업 결과 전달용 시그널 모음 (MainWindow가 하나 생성)
     
-    def __init__(self, analyzer: LogAnalyzer, issue_description: str, log_context: list):
+    메인 스레드 객체이므로 워커에서 emit해도 QueuedConnection으로 GUI 스레드 이벤트 루프에서 슬롯 실행.
+    """
+    analysis_progress = pyqtSignal(dict)  # {'analysis': 지금까지의 출력, '_task': 보낸 AnalysisTask}
+    analysis_complete = pyqtSignal(dict)  # analyze() 결과 + '_task'
+    analysis_error = pyqtSignal(dict)  # _error_info() 결과 + '_task'
+    chat_complete = pyqtSignal(dict)
+    chat_error = pyqtSignal(dict)  # _error_info() 결과
+    install_progress = pyqtSignal(str)
+    install_complete = pyqtSignal(bool, str)
+    install_error = pyqtSignal(str)
+
+
+class InterruptibleTask(QRunnable):
+    """
+    중단 요청을 받을 수 있는 작업 (QThread.requestInterruption과 같은 협조적 방식)
+    
+    메인 스레드에서 request_interruption()을 호출하면 워커가 안전한 지점
+    (출력 줄 사이, 실행 중 폴링)에서 확인하고 중단하며, 중단된 작업은 결과를 emit하지 않음.
+    """
+    
+    def __init__(self):
+        super().__init__()
+        self._interrupt_lock = threading.Lock()
+        self._interrupted = False
+    
+    def request_interruption(self):
+        """중단 요청 (메인 스레드)"""
+        with self._interrupt_lock:
+            self._interrupted = True
+    
+    def is_interruption_requested(self) -> bool:
+        """중단 요청 여부 (워커 스레드)"""
+        with self._interrupt_lock:
+            return self._interrupted
+
+
+class AnalysisTask(InterruptibleTask):
+    """분석 작업 (QThreadPool 워커 스레드에서 실행)"""
+    
+    def __init__(self, analyzer: LogAnalyzer, issue_description: str, log_payload: str,
+                 dispatcher: ResultDispatcher, attempt: int = 0):
         super().__init__()
         self.analyzer = analyzer
         self.issue_description = issue_description
-        self.log_context = log_context
+        self.log_payload = log_payload
+        self.dispatcher = dispatcher
+        self.attempt = attempt  # 자동 재시도 횟수 (처음 요청은 0)
     
     def run(self):
         """분석 실행"""
         try:
+            t0 = time.perf_counter_ns()
             result = self.analyzer.analyze(
                 issue_description=self.issue_description,
-                selected_logs=self.log_context
+                log_context=self.log_payload,
+                progress_cb=self._on_progress,
+                should_cancel=self.is_interruption_requested
             )
-            self.analysis_complete.emit(result)
+            timings = result.setdefault('_timings', {})
+            timings['analyze_ns'] = time.perf_counter_ns() - t0
+            timings['emitted_at_ns'] = time.perf_counter_ns()  # 결과 전달(큐) 지연 측정용
+            if not self.is_interruption_requested():
+                result['_task'] = self  # 받는 쪽에서 현재 작업의 결과인지 확인
+                self.dispatcher.analysis_complete.emit(result)
         except Exception as e:
-            self.analysis_error.emit(str(e))
+            if not self.is_interruption_requested():
+                error = _error_info(e)
+                error['_task'] = self
+                self.dispatcher.analysis_error.emit(error)
+    
+    def _on_progress(self, partial_text: str):
+        """분석 중간 출력 전달 (워커 스레드)"""
+        if not self.is_interruption_requested():
+            self.dispatcher.analysis_progress.emit({'analysis': partial_text, '_task': self})
 
 
-class ChatThread(QThread):
-    """채팅 작업을 수행하는 백그라운드 스레드"""
-    chat_complete = pyqtSignal(dict)
-    chat_error = pyqtSignal(str)
+class ChatTask(InterruptibleTask):
+    """채팅 작업 (QThreadPool 워커 스레드에서 실행)"""
     
-    def __init__(self, analyzer: LogAnalyzer, message: str):
+    def __init__(self, analyzer: LogAnalyzer, message: str, dispatcher: ResultDispatcher):
         super().__init__()
         self.analyzer = analyzer
         self.message = message
+        self.dispatcher = dispatcher
     
     def run(self):
         """채팅 실행"""
         try:
-            result = self.analyzer.chat(self.message)
-            self.chat_complete.emit(result)
+            result = self.analyzer.chat(self.message, should_cancel=self.is_interruption_requested)
+            if not self.is_interruption_requested():
+                self.dispatcher.chat_complete.emit(result)
         except Exception as e:
-            self.chat_error.emit(str(e))
+            if not self.is_interruption_requested():
+                self.dispatcher.chat_error.emit(_error_info(e))
 
 
 if __name__ == "__main__":
-    from PyQt6.QtWidgets import QApplication
     app = QApplication(sys.argv)
     # TODO: Setup dark theme (pyqtdarktheme.apply() when available)
     window = MainWindow()
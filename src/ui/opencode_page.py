@@ -1,26 +1,212 @@
 """OpenCode 전용 페이지"""
+import json
+import logging
+import os
+import re
+import subprocess
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
                              QPushButton, QTabWidget, QGroupBox, QLineEdit,
                              QTextEdit, QComboBox, QCheckBox, QMessageBox,
-                             QProgressBar, QListWidget, QListWidgetItem)
-from PyQt6.QtCore import Qt, pyqtSignal, QThread
+                             QProgressBar, QListWidget, QListView)
+from PyQt6.QtCore import (Qt, pyqtSignal, pyqtSlot, QAbstractListModel, QModelIndex,
+                          QObject, QProcess, QRunnable, QThread, QThreadPool, QTimer)
 from PyQt6.QtGui import QFont
 
+from ui.components.agent_settings_dialog import AgentSettingsDialog
+from utils.api_keys import save_api_keys
 from utils.opencode_installer import OpenCodeInstaller
+from utils.tool_probe import (NO_WINDOW, CommandCancelled, detect_bunx, invalidate_tool_probes,
+                              npm_global_packages, resolve_command, run_captured, run_tool, which)
 from agent.analyzer import LogAnalyzer
 
+logger = logging.getLogger(__name__)
+
+# orjson (선택적): oh-my-opencode.json 파싱 가속 (없으면 표준 json)
+ORJSON_AVAILABLE = False
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+
+# 상태 라벨 스타일 (setStyleSheet마다 CSS를 다시 파싱하므로 같은 문자열 재사용)
+_STYLE_OK = "color: #4ec9b0;"
+_STYLE_ERR = "color: #f48771;"
+_STYLE_MUTED = "color: #888888; padding: 8px;"
+
+# 새로고침 버튼 연타 시 실제 확인 실행 간격 (ms) - 확인마다 프로세스를 여러 개 띄우므로
+REFRESH_THROTTLE_MS = 1000
+
+# 설치 명령 출력 중 읽어 들이는 최대 크기 (바이트) - 실패 시 메시지/로그에 앞부분만 사용
+INSTALL_OUTPUT_LIMIT = 64 * 1024
+
+# 설치 버튼에서 재사용할 Node.js 확인 결과의 유효 시간 (초) - 지나면 백그라운드에서 다시 확인
+NODE_STATUS_MAX_AGE = 60.0
+
+_header_font: Optional[QFont] = None
+
+
+def _get_header_font() -> QFont:
+    """헤더 폰트 (QApplication 생성 이후 처음 호출될 때 한 번만 만듦)"""
+    global _header_font
+    if _header_font is None:
+        _header_font = QFont()
+        _header_font.setBold(True)
+        _header_font.setPointSize(16)
+    return _header_font
+
+
+def _set_status(label: QLabel, text: str, ok: bool):
+    """상태 라벨 갱신 (스타일이 같으면 setStyleSheet 생략)"""
+    label.setText(text)
+    style = _STYLE_OK if ok else _STYLE_ERR
+    if label.styleSheet() != style:
+        label.setStyleSheet(style)
+
+
+class _Throttler(QObject):
+    """
+    슬롯 호출 빈도 제한 (interval_ms에 한 번)
+
+    첫 호출은 바로 실행하고, 간격 안에 들어온 호출은 하나로 합쳐 간격이 끝날 때 한 번 실행.
+    """
+
+    def __init__(self, func: Callable[[], None], interval_ms: int, parent: QObject):
+        super().__init__(parent)
+        self._func = func
+        self._pending = False
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(interval_ms)
+        self._timer.timeout.connect(self._on_timeout)
+
+    @pyqtSlot()
+    def __call__(self):
+        if self._timer.isActive():
+            self._pending = True
+            return
+        self._func()
+        self._timer.start()
+
+    @pyqtSlot()
+    def _on_timeout(self):
+        if self._pending:
+            self._pending = False
+            self._func()
+            self._timer.start()
+
+
+class AgentListModel(QAbstractListModel):
+    """
+    Agent Team 목록 모델 (읽기 전용 문자열 리스트)
+
+    QListWidget과 달리 항목마다 QListWidgetItem을 만들지 않음.
+    안내 문구(불러오는 중/없음)는 선택할 수 없는 한 줄로 표시.
+    """
+
+    def __init__(self, parent: Optional[QObject] = None):
+        super().__init__(parent)
+        self._agents: List[str] = []
+        self._placeholder = ""
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        return len(self._agents) if self._agents else (1 if self._placeholder else 0)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if not index.isValid() or role != Qt.ItemDataRole.DisplayRole:
+            return None
+        if not self._agents:
+            return self._placeholder
+        row = index.row()
+        if 0 <= row < len(self._agents):
+            return self._agents[row]
+        return None
+
+    def flags(self, index: QModelIndex) -> Qt.ItemFlag:
+        if not index.isValid() or not self._agents:
+            return Qt.ItemFlag.NoItemFlags
+        return Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+
+    def set_agents(self, agents: List[str]) -> None:
+        """Agent 목록 전체 교체"""
+        self.beginResetModel()
+        self._agents = list(agents)
+        self._placeholder = ""
+        self.endResetModel()
+
+    def set_placeholder(self, text: str) -> None:
+        """목록을 비우고 안내 문구 한 줄 표시"""
+        self.beginResetModel()
+        self._agents = []
+        self._placeholder = text
+        self.endResetModel()
+
+    def agent_at(self, row: int) -> Optional[str]:
+        """특정 행의 Agent (안내 문구 / 범위 밖이면 None)"""
+        if 0 <= row < len(self._agents):
+            return self._agents[row]
+        return None
+
 
 class OpenCodePage(QWidget):
     """OpenCode 전용 관리 페이지"""
     
-    def __init__(self, parent=None):
+    def __init__(self, parent=None, analyzer: Optional[LogAnalyzer] = None):
         super().__init__(parent)
         self.installer = OpenCodeInstaller()
-        self.analyzer = LogAnalyzer()
+        # MainWindow의 analyzer를 받으면 공유 (없으면 새로 생성)
+        self.analyzer = analyzer if analyzer is not None else LogAnalyzer()
+        # 마지막 상태 확인의 Node.js 결과 (설치 버튼이 GUI 스레드에서 node를 다시 실행하지 않도록)
+        self._last_node_status: Optional[dict] = None
+        self._last_node_status_time = 0.0
+        self._pending_install: Optional[Callable[[], None]] = None  # 상태 확인 후 이어서 실행할 설치
+        self._last_ohmy_status: Optional[dict] = None  # Oh My OpenCode 탭 생성 전에 도착한 결과 보관용
+        # 라벨/버튼에 마지막으로 반영한 상태 확인 결과 (같은 결과면 위젯 갱신 생략)
+        # 설치 시작 등으로 위젯을 직접 바꾸면 None으로 되돌려 다음 결과를 반드시 반영
+        self._applied_statuses: Optional[dict] = None
+        self._create_threads()
         self._setup_ui()
         # 상태 확인을 백그라운드 스레드에서 실행 (UI 블로킹 방지)
         self._check_status_async()
     
+    def _create_threads(self):
+        """백그라운드 스레드를 한 번만 만들고 시그널도 한 번만 연결 (새로고침/설치마다 재사용)"""
+        self.status_check_thread = OpenCodePageStatusCheckThread(self.installer, self.analyzer)
+        self.status_check_thread.status_checked.connect(
+            self._on_status_checked, Qt.ConnectionType.QueuedConnection
+        )
+        
+        self.install_signals = OpenCodeInstallSignals(self)
+        self.install_signals.install_complete.connect(self._on_install_complete)
+        self._opencode_installing = False
+        
+        self.bunx_installer = BunxInstaller(self)
+        self.bunx_installer.install_complete.connect(self._on_bunx_install_complete)
+        
+        self.ohmy_install_thread = OhMyOpenCodeInstallThread()
+        self.ohmy_install_thread.install_complete.connect(self._on_ohmy_install_complete)
+        
+        self.agents_thread = AgentsListThread()
+        self.agents_thread.agents_loaded.connect(self._on_agents_loaded)
+        
+        self.api_key_save_thread = ApiKeySaveThread()
+        self.api_key_save_thread.saved.connect(self._on_api_keys_saved)
+    
+    def cancel_installs(self):
+        """진행 중인 bunx / Oh My OpenCode 설치 중단 (설치 프로세스 종료, 결과는 전달하지 않음)"""
+        self.bunx_installer.cancel()
+        if self.ohmy_install_thread.isRunning():
+            self.ohmy_install_thread.requestInterruption()
+            # run_captured가 0.1초 간격으로 중단 요청을 확인하고 프로세스를 종료하므로 금방 끝남
+            self.ohmy_install_thread.wait()
+    
     def _setup_ui(self):
         """UI 구성"""
         layout = QVBoxLayout(self)
@@ -29,10 +215,7 @@ class OpenCodePage(QWidget):
         
         # 헤더
         header = QLabel("🤖 OpenCode 관리")
-        header_font = QFont()
-        header_font.setBold(True)
-        header_font.setPointSize(16)
-        header.setFont(header_font)
+        header.setFont(_get_header_font())
         layout.addWidget(header)
         
         # 탭 위젯
@@ -42,19 +225,51 @@ class OpenCodePage(QWidget):
         status_tab = self._create_status_tab()
         tabs.addTab(status_tab, "상태 및 설치")
         
-        # 2. Oh My OpenCode 탭
-        ohmy_tab = self._create_ohmy_opencode_tab()
-        tabs.addTab(ohmy_tab, "Oh My OpenCode")
-        
-        # 3. 프로젝트 관리 탭
-        project_tab = self._create_project_tab()
-        tabs.addTab(project_tab, "프로젝트 관리")
-        
-        # 4. 설정 탭
-        settings_tab = self._create_settings_tab()
-        tabs.addTab(settings_tab, "설정")
+        # 2. Oh My OpenCode 탭, 3. 프로젝트 관리 탭, 4. 설정 탭은 나중에 생성 (빈 컨테이너만 먼저 추가)
+        self._lazy_tabs = {}  # 탭 인덱스 -> (컨테이너, 생성 함수)
+        for factory, label in ((self._create_ohmy_opencode_tab, "Oh My OpenCode"),
+                               (self._create_project_tab, "프로젝트 관리"),
+                               (self._create_settings_tab, "설정")):
+            container = QWidget()
+            container_layout = QVBoxLayout(container)
+            container_layout.setContentsMargins(0, 0, 0, 0)
+            index = tabs.addTab(container, label)
+            self._lazy_tabs[index] = (container, factory)
+        tabs.currentChanged.connect(self._on_tab_changed)
         
         layout.addWidget(tabs)
+        
+        # Oh My OpenCode 탭은 상태 확인 결과를 받아야 하므로 열기 전이라도 페이지가 먼저 그려진 뒤 바로 생성
+        self._ohmy_tab_index = 1
+        QTimer.singleShot(0, self._build_ohmy_tab)
+    
+    @pyqtSlot(int)
+    def _on_tab_changed(self, index: int):
+        """지연 생성 탭을 처음 열 때 실제 내용 생성"""
+        if index == self._ohmy_tab_index:
+            self._build_ohmy_tab()
+        else:
+            self._build_lazy_tab(index)
+    
+    def _build_lazy_tab(self, index: int) -> bool:
+        """
+        지연 생성 탭의 내용을 컨테이너에 채움
+        
+        Returns:
+            이번에 생성했으면 True (이미 생성됐으면 False)
+        """
+        entry = self._lazy_tabs.pop(index, None)
+        if entry is None:
+            return False
+        container, factory = entry
+        container.layout().addWidget(factory())
+        return True
+    
+    @pyqtSlot()
+    def _build_ohmy_tab(self):
+        """Oh My OpenCode 탭 생성 후 그 전에 도착한 상태 확인 결과 반영"""
+        if self._build_lazy_tab(self._ohmy_tab_index) and self._last_ohmy_status is not None:
+            self._apply_ohmy_status(self._last_ohmy_status)
     
     def _create_status_tab(self):
         """상태 및 설치 탭"""
@@ -93,7 +308,8 @@ class OpenCodePage(QWidget):
         
         # 새로고침 버튼
         refresh_btn = QPushButton("🔄 상태 새로고침")
-        refresh_btn.clicked.connect(self._check_status_async)
+        self._status_refresh_throttle = _Throttler(self._check_status_async, REFRESH_THROTTLE_MS, self)
+        refresh_btn.clicked.connect(self._status_refresh_throttle)
         status_layout.addWidget(refresh_btn)
         
         layout.addWidget(status_group)
@@ -108,7 +324,7 @@ class OpenCodePage(QWidget):
             "npx를 통해 자동으로 다운로드됩니다."
         )
         install_info.setWordWrap(True)
-        install_info.setStyleSheet("color: #888888; padding: 8px;")
+        install_info.setStyleSheet(_STYLE_MUTED)
         install_layout.addWidget(install_info)
         
         self.install_btn = QPushButton("📦 OpenCode 설치")
@@ -185,12 +401,14 @@ class OpenCodePage(QWidget):
             "각 팀원(Agent)은 특정 역할을 담당합니다."
         )
         agents_info.setWordWrap(True)
-        agents_info.setStyleSheet("color: #888888; padding: 8px;")
+        agents_info.setStyleSheet(_STYLE_MUTED)
         agents_layout.addWidget(agents_info)
         
-        self.agents_list = QListWidget()
-        self.agents_list.addItem("Agent Team 목록을 불러오는 중...")
-        self.agents_list.itemDoubleClicked.connect(self._on_agent_double_clicked)
+        self.agents_model = AgentListModel(self)
+        self.agents_model.set_placeholder("Agent Team 목록을 불러오는 중...")
+        self.agents_list = QListView()
+        self.agents_list.setModel(self.agents_model)
+        self.agents_list.doubleClicked.connect(self._on_agent_double_clicked)
         agents_layout.addWidget(self.agents_list)
         
         agents_buttons = QHBoxLayout()
@@ -199,7 +417,8 @@ class OpenCodePage(QWidget):
         agents_buttons.addWidget(settings_btn)
         
         refresh_agents_btn = QPushButton("🔄 새로고침")
-        refresh_agents_btn.clicked.connect(self._refresh_agents)
+        self._agents_refresh_throttle = _Throttler(self._refresh_agents, REFRESH_THROTTLE_MS, self)
+        refresh_agents_btn.clicked.connect(self._agents_refresh_throttle)
         agents_buttons.addWidget(refresh_agents_btn)
         
         agents_buttons.addStretch()
@@ -323,172 +542,124 @@ class OpenCodePage(QWidget):
         layout.addStretch()
         return tab
     
+    @pyqtSlot()
     def _check_status_async(self):
-        """상태 확인을 백그라운드 스레드에서 실행"""
-        self.status_check_thread = OpenCodePageStatusCheckThread(self.installer, self.analyzer)
-        self.status_check_thread.status_checked.connect(self._on_status_checked)
+        """상태 확인을 백그라운드 스레드에서 실행 (이미 확인 중이면 무시)"""
+        if self.status_check_thread.isRunning():
+            logger.debug("[OpenCodePage] 상태 확인이 이미 진행 중")
+            return
         self.status_check_thread.start()
     
-    def _on_status_checked(self, node_status, npm_status, opencode_status, ohmy_status):
+    @pyqtSlot(dict)
+    def _on_status_checked(self, statuses):
         """상태 확인 완료 처리 (메인 스레드에서 호출)"""
+        node_status = statuses['node']
+        npm_status = statuses['npm']
+        self._last_node_status = node_status
+        self._last_node_status_time = time.monotonic()
+        
+        # 라벨/버튼 여러 개를 바꾸는 동안 다시 그리기를 막고 마지막에 한 번만 갱신
+        # (이전 결과와 같으면 문자열 포맷/위젯 호출 없이 건너뜀)
+        if statuses != self._applied_statuses:
+            self.setUpdatesEnabled(False)
+            try:
+                self._apply_statuses(node_status, npm_status, statuses['opencode'], statuses['ohmy'])
+            finally:
+                self.setUpdatesEnabled(True)
+            self._applied_statuses = statuses
+        
+        # 설치 버튼이 상태 확인을 기다리고 있었으면 이어서 진행
+        pending, self._pending_install = self._pending_install, None
+        if pending is not None:
+            pending()
+    
+    def _apply_statuses(self, node_status, npm_status, opencode_status, ohmy_status):
+        """상태 확인 결과를 라벨/설치 버튼에 반영 (바뀐 스타일만 다시 적용)"""
         # Node.js 상태 업데이트
         if node_status['installed']:
-            self.node_status_label.setText(f"✓ 설치됨 (v{node_status['version']})")
-            self.node_status_label.setStyleSheet("color: #4ec9b0;")
+            _set_status(self.node_status_label, f"✓ 설치됨 (v{node_status['version']})", True)
         else:
-            self.node_status_label.setText("✗ 미설치")
-            self.node_status_label.setStyleSheet("color: #f48771;")
+            _set_status(self.node_status_label, "✗ 미설치", False)
         
         # npm 상태 업데이트
         if npm_status['installed']:
-            self.npm_status_label.setText(f"✓ 설치됨 (v{npm_status['version']})")
-            self.npm_status_label.setStyleSheet("color: #4ec9b0;")
+            _set_status(self.npm_status_label, f"✓ 설치됨 (v{npm_status['version']})", True)
         else:
-            self.npm_status_label.setText("✗ 미설치")
-            self.npm_status_label.setStyleSheet("color: #f48771;")
+            _set_status(self.npm_status_label, "✗ 미설치", False)
         
         # OpenCode 상태 업데이트
         if opencode_status['installed']:
-            self.opencode_status_label.setText("✓ 사용 가능 (npx)")
-            self.opencode_status_label.setStyleSheet("color: #4ec9b0;")
+            _set_status(self.opencode_status_label, "✓ 사용 가능 (npx)", True)
             self.install_btn.setEnabled(False)
             self.install_btn.setText("✓ 이미 설치됨")
         else:
-            self.opencode_status_label.setText("✗ 미설치")
-            self.opencode_status_label.setStyleSheet("color: #f48771;")
+            _set_status(self.opencode_status_label, "✗ 미설치", False)
             self.install_btn.setEnabled(True)
             self.install_btn.setText("📦 OpenCode 설치")
         
-        # Oh My OpenCode 상태 업데이트
+        # Oh My OpenCode 상태 업데이트 (탭이 아직 생성 전이면 생성 시 반영)
+        self._last_ohmy_status = ohmy_status
+        if self._ohmy_tab_index not in self._lazy_tabs:
+            self._apply_ohmy_status(ohmy_status)
+    
+    def _apply_ohmy_status(self, ohmy_status):
+        """Oh My OpenCode 상태를 라벨/설치 버튼에 반영"""
         if ohmy_status['installed']:
-            self.ohmy_status_label.setText(f"✓ 설치됨 ({ohmy_status.get('method', '')})")
-            self.ohmy_status_label.setStyleSheet("color: #4ec9b0;")
+            _set_status(self.ohmy_status_label, f"✓ 설치됨 ({ohmy_status.get('method', '')})", True)
             self.ohmy_install_btn.setEnabled(False)
             self.ohmy_install_btn.setText("✓ 이미 설치됨")
         else:
-            self.ohmy_status_label.setText("✗ 미설치")
-            self.ohmy_status_label.setStyleSheet("color: #f48771;")
+            _set_status(self.ohmy_status_label, "✗ 미설치", False)
             self.ohmy_install_btn.setEnabled(True)
             self.ohmy_install_btn.setText("📦 Oh My OpenCode 설치")
     
+    def _node_status_ready(self, install: Callable[[], None]) -> bool:
+        """
+        최근 Node.js 확인 결과가 있는지 확인
+        
+        없거나 NODE_STATUS_MAX_AGE가 지났으면 백그라운드 상태 확인을 시작하고,
+        완료 후 install을 다시 호출하도록 예약한 뒤 False 반환
+        """
+        if (self._last_node_status is not None
+                and time.monotonic() - self._last_node_status_time < NODE_STATUS_MAX_AGE):
+            return True
+        self._pending_install = install
+        self._check_status_async()
+        return False
+    
     def _check_status(self):
         """상태 확인 (동기 버전 - 수동 새로고침용)"""
         self._check_status_async()
     
     def _check_ohmy_opencode_status(self):
         """Oh My OpenCode 상태 확인"""
-        import subprocess
-        import logging
-        logger = logging.getLogger(__name__)
-        
-        # bunx가 있는지 먼저 확인 (여러 방법 시도)
-        bunx_available = False
-        try:
-            result = subprocess.run(
-                ['bunx', '--version'],
-                capture_output=True,
-                text=True,
-                encoding='utf-8',
-                errors='replace',
-                timeout=3,
-                shell=True
-            )
-            bunx_available = result.returncode == 0
-            if bunx_available:
-                logger.info(f"[bunx] 확인됨: {result.stdout.strip()}")
-        except Exception as e:
-            logger.debug(f"[bunx] PATH 확인 실패: {str(e)}")
-        
-        # npm 전역 패키지에서도 확인
-        if not bunx_available:
-            try:
-                result = subprocess.run(
-                    ['npm', 'list', '-g', 'bunx', '--depth=0'],
-                    capture_output=True,
-                    text=True,
-                    encoding='utf-8',
-                    errors='replace',
-                    timeout=3,
-                    shell=True
-                )
-                if result.returncode == 0 and 'bunx' in result.stdout:
-                    bunx_available = True
-                    logger.info("[bunx] npm 전역 패키지에서 확인됨")
-            except Exception as e:
-                logger.debug(f"[bunx] npm 확인 실패: {str(e)}")
-        
+        self._applied_statuses = None
         # bunx가 있으면 bunx로 확인, 없으면 npx로 확인
-        if bunx_available:
-            try:
-                result = subprocess.run(
-                    ['bunx', 'oh-my-opencode', '--version'],
-                    capture_output=True,
-                    text=True,
-                    encoding='utf-8',
-                    errors='replace',
-                    timeout=5,
-                    shell=True
-                )
-                
-                if result.returncode == 0:
-                    self.ohmy_status_label.setText(f"✓ 설치됨 (bunx)")
-                    self.ohmy_status_label.setStyleSheet("color: #4ec9b0;")
-                    self.ohmy_install_btn.setEnabled(False)
-                    self.ohmy_install_btn.setText("✓ 이미 설치됨")
-                    return
-            except:
-                pass
-        else:
-            # npx로 확인
-            try:
-                result = subprocess.run(
-                    ['npx', 'oh-my-opencode', '--version'],
-                    capture_output=True,
-                    text=True,
-                    encoding='utf-8',
-                    errors='replace',
-                    timeout=5,
-                    shell=True
-                )
-                
-                if result.returncode == 0:
-                    self.ohmy_status_label.setText(f"✓ 설치됨 (npx)")
-                    self.ohmy_status_label.setStyleSheet("color: #4ec9b0;")
-                    self.ohmy_install_btn.setEnabled(False)
-                    self.ohmy_install_btn.setText("✓ 이미 설치됨")
-                    return
-            except:
-                pass
+        runner = 'bunx' if detect_bunx()[0] else 'npx'
+        result = run_tool(runner, ['oh-my-opencode', '--version'], timeout=5)
+        if result is not None and result.returncode == 0:
+            _set_status(self.ohmy_status_label, f"✓ 설치됨 ({runner})", True)
+            self.ohmy_install_btn.setEnabled(False)
+            self.ohmy_install_btn.setText("✓ 이미 설치됨")
+            return
         
-        # npm 전역 설치 확인
-        try:
-            result = subprocess.run(
-                ['npm', 'list', '-g', 'oh-my-opencode'],
-                capture_output=True,
-                text=True,
-                encoding='utf-8',
-                errors='replace',
-                timeout=5,
-                shell=True
-            )
-            
-            if result.returncode == 0:
-                self.ohmy_status_label.setText("✓ 설치됨 (전역)")
-                self.ohmy_status_label.setStyleSheet("color: #4ec9b0;")
-                self.ohmy_install_btn.setEnabled(False)
-                self.ohmy_install_btn.setText("✓ 이미 설치됨")
-                return
-        except:
-            pass
-        
-        self.ohmy_status_label.setText("✗ 미설치")
-        self.ohmy_status_label.setStyleSheet("color: #f48771;")
+        # npm 전역 설치 확인 (bunx 탐지와 같은 npm list -g 결과 사용)
+        if 'oh-my-opencode' in npm_global_packages():
+            _set_status(self.ohmy_status_label, "✓ 설치됨 (전역)", True)
+            self.ohmy_install_btn.setEnabled(False)
+            self.ohmy_install_btn.setText("✓ 이미 설치됨")
+            return
+        
+        _set_status(self.ohmy_status_label, "✗ 미설치", False)
         self.ohmy_install_btn.setEnabled(True)
         self.ohmy_install_btn.setText("📦 Oh My OpenCode 설치")
     
+    @pyqtSlot()
     def _install_opencode(self):
         """OpenCode 설치"""
-        if not self.installer.check_nodejs()[0]:
+        if self._opencode_installing or not self._node_status_ready(self._install_opencode):
+            return
+        if not self._last_node_status['installed']:
             QMessageBox.warning(
                 self,
                 "Node.js 미설치",
@@ -496,25 +667,25 @@ class OpenCodePage(QWidget):
             )
             return
         
-        reply = QMessageBox.question(
-            self,
-            "OpenCode 설치",
-            "OpenCode CLI를 설치하시겠습니까?",
-            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
-        )
-        
-        if reply == QMessageBox.StandardButton.Yes:
-            self.install_btn.setEnabled(False)
-            self.install_progress.setVisible(True)
-            
-            # 설치 스레드 시작
-            self.install_thread = OpenCodeInstallThread(self.installer)
-            self.install_thread.install_complete.connect(self._on_install_complete)
-            self.install_thread.start()
+        self._confirm("OpenCode 설치", "OpenCode CLI를 설치하시겠습니까?", self._start_opencode_install)
+    
+    def _start_opencode_install(self):
+        """OpenCode 설치 작업 시작 (확인 대화상자에서 예 선택 시, 설치 중이면 무시)"""
+        if self._opencode_installing:
+            return
+        self._opencode_installing = True
+        self._applied_statuses = None
+        self.install_btn.setEnabled(False)
+        self.install_progress.setVisible(True)
+        QThreadPool.globalInstance().start(OpenCodeInstallTask(self.installer, self.install_signals))
     
+    @pyqtSlot()
     def _install_ohmy_opencode(self):
         """Oh My OpenCode 설치"""
-        if not self.installer.check_nodejs()[0]:
+        # bunx 설치 완료 시그널에서 바로 호출되므로 bunx 설치 진행 여부는 확인하지 않음
+        if self.ohmy_install_thread.isRunning() or not self._node_status_ready(self._install_ohmy_opencode):
+            return
+        if not self._last_node_status['installed']:
             QMessageBox.warning(
                 self,
                 "Node.js 미설치",
@@ -522,95 +693,59 @@ class OpenCodePage(QWidget):
             )
             return
         
-        # bunx가 있는지 확인 (여러 방법 시도)
-        import subprocess
-        import os
-        bunx_available = False
-        
-        # 방법 1: PATH에서 직접 확인
-        try:
-            result = subprocess.run(
-                ['bunx', '--version'],
-                capture_output=True,
-                text=True,
-                encoding='utf-8',
-                errors='replace',
-                timeout=3,
-                shell=True
-            )
-            bunx_available = result.returncode == 0
-            if bunx_available:
-                import logging
-                logger = logging.getLogger(__name__)
-                logger.info(f"[bunx] 확인됨: {result.stdout.strip()}")
-        except Exception as e:
-            import logging
-            logger = logging.getLogger(__name__)
-            logger.debug(f"[bunx] PATH 확인 실패: {str(e)}")
-        
-        # 방법 2: npm 전역 패키지에서 확인
-        if not bunx_available:
-            try:
-                result = subprocess.run(
-                    ['npm', 'list', '-g', 'bunx', '--depth=0'],
-                    capture_output=True,
-                    text=True,
-                    encoding='utf-8',
-                    errors='replace',
-                    timeout=3,
-                    shell=True
-                )
-                if result.returncode == 0 and 'bunx' in result.stdout:
-                    bunx_available = True
-                    import logging
-                    logger = logging.getLogger(__name__)
-                    logger.info("[bunx] npm 전역 패키지에서 확인됨")
-            except Exception as e:
-                import logging
-                logger = logging.getLogger(__name__)
-                logger.debug(f"[bunx] npm 확인 실패: {str(e)}")
-        
-        if not bunx_available:
+        # bunx가 있는지 확인 (PATH / npm 전역 패키지, 최근 결과 재사용)
+        if not detect_bunx()[0]:
             # bunx가 없으면 bunx 설치 먼저 진행
-            reply = QMessageBox.question(
-                self,
+            self._confirm(
                 "bunx 설치 필요",
                 "Oh My OpenCode를 설치하려면 bunx가 필요합니다.\n\n"
                 "bunx를 설치하시겠습니까?\n"
-                "(npm install -g bunx)",
-                QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
+                "(npm install -g bunx oh-my-opencode)",
+                self._start_bunx_install
             )
-            
-            if reply == QMessageBox.StandardButton.Yes:
-                self.ohmy_install_btn.setEnabled(False)
-                self.ohmy_install_progress.setVisible(True)
-                
-                # bunx 설치 스레드 시작 (npm을 통해)
-                self.bunx_install_thread = BunxInstallThread()
-                self.bunx_install_thread.install_complete.connect(self._on_bunx_install_complete)
-                self.bunx_install_thread.start()
             return
         
         # bunx가 있으면 바로 Oh My OpenCode 설치
-        reply = QMessageBox.question(
-            self,
+        self._confirm(
             "Oh My OpenCode 설치",
             "Oh My OpenCode를 설치하시겠습니까?\n\n"
             "bunx를 통해 자동으로 설치됩니다.",
-            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
+            self._start_ohmy_install
         )
-        
-        if reply == QMessageBox.StandardButton.Yes:
-            self.ohmy_install_btn.setEnabled(False)
-            self.ohmy_install_progress.setVisible(True)
-            
-            # 설치 스레드 시작
-            self.ohmy_install_thread = OhMyOpenCodeInstallThread()
-            self.ohmy_install_thread.install_complete.connect(self._on_ohmy_install_complete)
-            self.ohmy_install_thread.start()
     
+    def _start_bunx_install(self):
+        """bunx 설치 스레드 시작 (npm을 통해)"""
+        self._applied_statuses = None
+        self.ohmy_install_btn.setEnabled(False)
+        self.ohmy_install_progress.setVisible(True)
+        self.bunx_installer.start()
+    
+    def _start_ohmy_install(self):
+        """Oh My OpenCode 설치 스레드 시작"""
+        self._applied_statuses = None
+        self.ohmy_install_btn.setEnabled(False)
+        self.ohmy_install_progress.setVisible(True)
+        self.ohmy_install_thread.start()
+    
+    def _confirm(self, title: str, text: str, on_yes: Callable[[], None]):
+        """
+        예/아니오 확인 대화상자 (QMessageBox.question과 달리 중첩 이벤트 루프 없이 open()으로 표시)
+        
+        예를 누르면 대화상자가 닫힌 뒤 on_yes 호출
+        """
+        box = QMessageBox(QMessageBox.Icon.Question, title, text,
+                          QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No, self)
+        box.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
+        box.finished.connect(
+            lambda result: on_yes() if result == QMessageBox.StandardButton.Yes.value else None,
+            Qt.ConnectionType.QueuedConnection
+        )
+        box.open()
+    
+    @pyqtSlot(bool, str)
     def _on_install_complete(self, success: bool, message: str):
         """OpenCode 설치 완료"""
+        self._opencode_installing = False
         self.install_progress.setVisible(False)
         if success:
             QMessageBox.information(self, "설치 완료", "OpenCode가 성공적으로 설치되었습니다.")
@@ -618,8 +753,10 @@ class OpenCodePage(QWidget):
             QMessageBox.warning(self, "설치 실패", f"OpenCode 설치에 실패했습니다:\n\n{message}")
         self._check_status()
     
+    @pyqtSlot(bool, str)
     def _on_bunx_install_complete(self, success: bool, message: str):
         """bunx 설치 완료"""
+        invalidate_tool_probes()
         self.ohmy_install_progress.setVisible(False)
         if success:
             QMessageBox.information(
@@ -634,8 +771,10 @@ class OpenCodePage(QWidget):
             QMessageBox.warning(self, "bunx 설치 실패", f"bunx 설치에 실패했습니다:\n\n{message}")
             self.ohmy_install_btn.setEnabled(True)
     
+    @pyqtSlot(bool, str)
     def _on_ohmy_install_complete(self, success: bool, message: str):
         """Oh My OpenCode 설치 완료"""
+        invalidate_tool_probes()
         self.ohmy_install_progress.setVisible(False)
         if success:
             QMessageBox.information(self, "설치 완료", "Oh My OpenCode가 성공적으로 설치되었습니다.")
@@ -643,426 +782,316 @@ class OpenCodePage(QWidget):
             QMessageBox.warning(self, "설치 실패", f"Oh My OpenCode 설치에 실패했습니다:\n\n{message}")
         self._check_ohmy_opencode_status()
     
+    @pyqtSlot()
     def _refresh_agents(self):
-        """Agent Team 목록 새로고침"""
-        self.agents_list.clear()
-        self.agents_list.addItem("Agent Team 목록을 불러오는 중...")
+        """Agent Team 목록 새로고침 (이미 불러오는 중이면 무시)"""
+        if self.agents_thread.isRunning():
+            return
+        self.agents_model.set_placeholder("Agent Team 목록을 불러오는 중...")
         
         # 백그라운드 스레드에서 Agent 목록 가져오기
-        self.agents_thread = AgentsListThread()
-        self.agents_thread.agents_loaded.connect(self._on_agents_loaded)
         self.agents_thread.start()
     
+    @pyqtSlot(list)
     def _on_agents_loaded(self, agents):
         """Agent Team 목록 로드 완료"""
-        self.agents_list.clear()
-        
-        if not agents:
-            self.agents_list.addItem("Agent Team을 찾을 수 없습니다.")
-            return
-        
-        for agent in agents:
-            self.agents_list.addItem(agent)
+        # 모델 리셋 한 번으로 교체 (항목마다 QListWidgetItem을 만들지 않음)
+        if agents:
+            self.agents_model.set_agents(agents)
+        else:
+            self.agents_model.set_placeholder("Agent Team을 찾을 수 없습니다.")
     
-    def _on_agent_double_clicked(self, item):
+    @pyqtSlot(QModelIndex)
+    def _on_agent_double_clicked(self, index):
         """Agent 더블클릭 시 설정 다이얼로그 열기"""
-        agent_name = item.text()
-        self._open_agent_settings(agent_name)
+        agent_name = self.agents_model.agent_at(index.row())
+        if agent_name:
+            self._open_agent_settings(agent_name)
     
+    @pyqtSlot()
     def _on_agent_settings_clicked(self):
         """Agent 설정 버튼 클릭"""
-        current_item = self.agents_list.currentItem()
-        if current_item:
-            agent_name = current_item.text()
+        agent_name = self.agents_model.agent_at(self.agents_list.currentIndex().row())
+        if agent_name:
             self._open_agent_settings(agent_name)
         else:
-            from PyQt6.QtWidgets import QMessageBox
             QMessageBox.information(self, "Agent 선택", "설정할 팀원(Agent)을 선택해주세요.")
     
     def _open_agent_settings(self, agent_name):
         """Agent 설정 다이얼로그 열기"""
-        from ui.components.agent_settings_dialog import AgentSettingsDialog
         dialog = AgentSettingsDialog(self, agent_name)
         dialog.exec()
     
+    @pyqtSlot()
     def _add_project(self):
         """프로젝트 추가"""
         # TODO: 프로젝트 추가 다이얼로그
         QMessageBox.information(self, "프로젝트 추가", "프로젝트 추가 기능은 구현 중입니다.")
     
+    @pyqtSlot()
     def _remove_project(self):
         """프로젝트 제거"""
         # TODO: 선택된 프로젝트 제거
         QMessageBox.information(self, "프로젝트 제거", "프로젝트 제거 기능은 구현 중입니다.")
     
+    @pyqtSlot()
     def _index_project(self):
         """프로젝트 인덱싱"""
         # TODO: OpenCode 프로젝트 인덱싱
         QMessageBox.information(self, "프로젝트 인덱싱", "프로젝트 인덱싱 기능은 구현 중입니다.")
     
+    @pyqtSlot()
     def _save_api_keys(self):
-        """API 키 저장"""
-        import os
-        
-        anthropic_key = self.anthropic_key_input.text().strip()
-        openai_key = self.openai_key_input.text().strip()
-        
-        if anthropic_key:
-            os.environ['ANTHROPIC_API_KEY'] = anthropic_key
-        if openai_key:
-            os.environ['OPENAI_API_KEY'] = openai_key
-        
-        QMessageBox.information(self, "저장 완료", "API 키가 저장되었습니다.")
+        """API 키 저장 (keyring 접근은 백그라운드 스레드에서)"""
+        if self.api_key_save_thread.isRunning():
+            return
+        self.api_key_save_thread.set_keys({
+            'anthropic': self.anthropic_key_input.text().strip(),
+            'openai': self.openai_key_input.text().strip(),
+        })
+        self.api_key_save_thread.start()
+    
+    @pyqtSlot(bool)
+    def _on_api_keys_saved(self, persisted: bool):
+        """API 키 저장 완료"""
+        if persisted:
+            QMessageBox.information(self, "저장 완료", "API 키가 저장되었습니다.")
+        else:
+            QMessageBox.information(
+                self,
+                "저장 완료",
+                "API 키가 현재 세션에 저장되었습니다.\n\n"
+                "영구적으로 저장하려면 keyring 패키지를 설치하거나 환경 변수에 설정하세요."
+            )
+
+
+class ApiKeySaveThread(QThread):
+    """API 키 저장 스레드 (keyring 접근이 OS 자격 증명 저장소 IPC라 UI 스레드에서 분리)"""
+    saved = pyqtSignal(bool)  # keyring에 영구 저장했는지
+    
+    def __init__(self):
+        super().__init__()
+        self._keys = {}
+    
+    def set_keys(self, keys: dict):
+        """저장할 키 설정 (start() 전에 호출)"""
+        self._keys = keys
+    
+    def run(self):
+        """저장 실행"""
+        self.saved.emit(save_api_keys(self._keys))
 
 
 class OpenCodePageStatusCheckThread(QThread):
     """OpenCode 페이지 상태 확인을 수행하는 백그라운드 스레드"""
-    status_checked = pyqtSignal(dict, dict, dict, dict)  # node_status, npm_status, opencode_status, ohmy_status
+    status_checked = pyqtSignal(dict)  # {'node': ..., 'npm': ..., 'opencode': ..., 'ohmy': ...}
     
     def __init__(self, installer: OpenCodeInstaller, analyzer: LogAnalyzer):
         super().__init__()
         self.installer = installer
         self.analyzer = analyzer
-        import logging
-        self.logger = logging.getLogger(__name__)
+        self.logger = logger
     
     def run(self):
         """상태 확인 실행"""
         try:
             self.logger.info("[OpenCodePageStatusCheckThread] 상태 확인 시작")
             
-            # Node.js 확인
-            try:
-                node_installed, node_version = self.installer.check_nodejs()
-                node_status = {
-                    'installed': node_installed,
-                    'version': node_version or ''
-                }
-            except Exception as e:
-                self.logger.error(f"[OpenCodePageStatusCheckThread] Node.js 확인 오류: {str(e)}")
-                node_status = {'installed': False, 'version': ''}
-            
-            # npm 확인
-            try:
-                npm_installed, npm_version = self.installer.check_npm()
-                npm_status = {
-                    'installed': npm_installed,
-                    'version': npm_version or ''
-                }
-            except Exception as e:
-                self.logger.error(f"[OpenCodePageStatusCheckThread] npm 확인 오류: {str(e)}")
-                npm_status = {'installed': False, 'version': ''}
-            
-            # OpenCode 확인
-            try:
-                opencode_available = self.analyzer.check_installation()
-                opencode_status = {
-                    'installed': opencode_available
-                }
-            except Exception as e:
-                self.logger.error(f"[OpenCodePageStatusCheckThread] OpenCode 확인 오류: {str(e)}")
-                opencode_status = {'installed': False}
+            # 네 가지 확인은 서로 독립적인 프로세스 실행이므로 동시에 진행 (전체 시간 = 가장 느린 확인)
+            probes = [
+                ('node', "Node.js", self._check_nodejs),
+                ('npm', "npm", self._check_npm),
+                ('opencode', "OpenCode", self._check_opencode),
+                ('ohmy', "Oh My OpenCode", self._check_ohmy_opencode),
+            ]
+            with ThreadPoolExecutor(max_workers=len(probes)) as executor:
+                futures = [executor.submit(probe) for _, _, probe in probes]
             
-            # Oh My OpenCode 확인
-            try:
-                ohmy_status = self._check_ohmy_opencode()
-            except Exception as e:
-                self.logger.error(f"[OpenCodePageStatusCheckThread] Oh My OpenCode 확인 오류: {str(e)}")
-                ohmy_status = {'installed': False}
+            statuses = self.default_statuses()
+            for (key, name, _), future in zip(probes, futures):
+                try:
+                    statuses[key] = future.result()
+                except Exception as e:
+                    self.logger.error(f"[OpenCodePageStatusCheckThread] {name} 확인 오류: {str(e)}")
             
-            # 시그널 발생 (메인 스레드에서 UI 업데이트)
-            self.status_checked.emit(node_status, npm_status, opencode_status, ohmy_status)
+            # 시그널 발생 (메인 스레드에서 UI 업데이트, 결과는 dict 하나로 전달)
+            self.status_checked.emit(statuses)
             self.logger.info("[OpenCodePageStatusCheckThread] 상태 확인 완료")
         except Exception as e:
             self.logger.error(f"[OpenCodePageStatusCheckThread] 전체 오류: {str(e)}", exc_info=True)
             # 오류 발생 시에도 기본값으로 시그널 발생
-            self.status_checked.emit(
-                {'installed': False, 'version': ''},
-                {'installed': False, 'version': ''},
-                {'installed': False},
-                {'installed': False}
-            )
+            self.status_checked.emit(self.default_statuses())
+    
+    @staticmethod
+    def default_statuses() -> dict:
+        """확인 실패 시 사용할 기본 상태"""
+        return {
+            'node': {'installed': False, 'version': ''},
+            'npm': {'installed': False, 'version': ''},
+            'opencode': {'installed': False},
+            'ohmy': {'installed': False},
+        }
+    
+    def _check_nodejs(self):
+        """Node.js 상태 확인"""
+        node_installed, node_version = self.installer.check_nodejs()
+        return {'installed': node_installed, 'version': node_version or ''}
+    
+    def _check_npm(self):
+        """npm 상태 확인"""
+        npm_installed, npm_version = self.installer.check_npm()
+        return {'installed': npm_installed, 'version': npm_version or ''}
+    
+    def _check_opencode(self):
+        """OpenCode 상태 확인"""
+        return {'installed': self.analyzer.check_installation()}
     
     def _check_ohmy_opencode(self):
         """Oh My OpenCode 상태 확인"""
-        import subprocess
-        import logging
-        logger = logging.getLogger(__name__)
-        
-        # bunx가 있는지 먼저 확인 (여러 방법 시도)
-        bunx_available = False
-        try:
-            result = subprocess.run(
-                ['bunx', '--version'],
-                capture_output=True,
-                text=True,
-                encoding='utf-8',
-                errors='replace',
-                timeout=3,
-                shell=True
-            )
-            bunx_available = result.returncode == 0
-            if bunx_available:
-                logger.info(f"[bunx] 확인됨: {result.stdout.strip()}")
-        except (subprocess.TimeoutExpired, FileNotFoundError, Exception) as e:
-            logger.debug(f"[bunx] PATH 확인 실패: {str(e)}")
-        
-        # npm 전역 패키지에서도 확인
-        if not bunx_available:
-            try:
-                result = subprocess.run(
-                    ['npm', 'list', '-g', 'bunx', '--depth=0'],
-                    capture_output=True,
-                    text=True,
-                    encoding='utf-8',
-                    errors='replace',
-                    timeout=3,
-                    shell=True
-                )
-                if result.returncode == 0 and 'bunx' in result.stdout:
-                    bunx_available = True
-                    logger.info("[bunx] npm 전역 패키지에서 확인됨")
-            except (subprocess.TimeoutExpired, FileNotFoundError, Exception) as e:
-                logger.debug(f"[bunx] npm 확인 실패: {str(e)}")
-        
         # bunx가 있으면 bunx로 확인
-        if bunx_available:
-            try:
-                result = subprocess.run(
-                    ['bunx', 'oh-my-opencode', '--version'],
-                    capture_output=True,
-                    text=True,
-                    encoding='utf-8',
-                    errors='replace',
-                    timeout=3,  # 타임아웃 단축
-                    shell=True
-                )
-                
-                if result.returncode == 0:
-                    return {'installed': True, 'method': 'bunx'}
-            except (subprocess.TimeoutExpired, FileNotFoundError, Exception):
-                pass
+        if detect_bunx()[0]:
+            result = run_tool('bunx', ['oh-my-opencode', '--version'], timeout=3)  # 타임아웃 단축
+            if result is not None and result.returncode == 0:
+                return {'installed': True, 'method': 'bunx'}
         
-        # npm 전역 설치 확인 (빠른 확인)
-        try:
-            result = subprocess.run(
-                ['npm', 'list', '-g', 'oh-my-opencode', '--depth=0'],
-                capture_output=True,
-                text=True,
-                encoding='utf-8',
-                errors='replace',
-                timeout=2,  # 타임아웃 단축
-                shell=True
-            )
-            
-            if result.returncode == 0 and 'oh-my-opencode' in result.stdout:
-                return {'installed': True, 'method': '전역'}
-        except (subprocess.TimeoutExpired, FileNotFoundError, Exception):
-            pass
+        # npm 전역 설치 확인 (bunx 탐지와 같은 npm list -g 결과 사용)
+        if 'oh-my-opencode' in npm_global_packages():
+            return {'installed': True, 'method': '전역'}
         
         # npx는 너무 오래 걸릴 수 있으므로 스킵
         return {'installed': False}
 
 
-class OpenCodeInstallThread(QThread):
-    """OpenCode 설치 스레드"""
+class OpenCodeInstallSignals(QObject):
+    """
+    OpenCode 설치 결과 전달용 시그널 (OpenCodePage가 하나 생성)
+    
+    메인 스레드 객체이므로 워커에서 emit해도 GUI 스레드 이벤트 루프에서 슬롯 실행.
+    """
     install_complete = pyqtSignal(bool, str)
+
+
+class OpenCodeInstallTask(QRunnable):
+    """OpenCode 설치 작업 (한 번 실행하고 끝나므로 전용 QThread 대신 QThreadPool 워커 스레드에서 실행)"""
     
-    def __init__(self, installer: OpenCodeInstaller):
+    def __init__(self, installer: OpenCodeInstaller, signals: OpenCodeInstallSignals):
         super().__init__()
         self.installer = installer
+        self.signals = signals
     
     def run(self):
-        """설치 실행"""
-        success, message = self.installer.ensure_opencode_available()
-        self.install_complete.emit(success, message)
-
-
-class BunInstallThread(QThread):
-    """Bun 설치 스레드"""
-    install_complete = pyqtSignal(bool, str)
-    
-    def run(self):
-        """Bun 설치 실행"""
-        import subprocess
-        import logging
-        import platform
-        logger = logging.getLogger(__name__)
-        
+        """설치 실행 (예외도 실패 결과로 전달해 설치 중 상태가 풀리도록)"""
         try:
-            logger.info("[Bun] 설치 시작")
-            system = platform.system()
-            
-            if system == 'Windows':
-                # Windows: PowerShell을 통해 설치
-                # 실행 정책 우회 및 전체 URL 사용
-                install_script = '''
-                $ErrorActionPreference = "Stop"
-                try {
-                    $response = Invoke-WebRequest -Uri "https://bun.sh/install.ps1" -UseBasicParsing
-                    Invoke-Expression $response.Content
-                } catch {
-                    Write-Host "Error: $_"
-                    exit 1
-                }
-                '''
-                result = subprocess.run(
-                    ['powershell', '-NoProfile', '-ExecutionPolicy', 'Bypass', '-Command', install_script],
-                    shell=False,
-                    capture_output=True,
-                    text=True,
-                    encoding='utf-8',
-                    errors='replace',
-                    timeout=300
-                )
-            else:
-                # Linux/Mac: curl을 통해 설치
-                result = subprocess.run(
-                    ['curl', '-fsSL', 'https://bun.sh/install'],
-                    capture_output=True,
-                    text=True,
-                    encoding='utf-8',
-                    errors='replace',
-                    timeout=30
-                )
-                
-                if result.returncode == 0:
-                    # 스크립트를 bash로 실행
-                    install_script = result.stdout
-                    bash_result = subprocess.run(
-                        ['bash'],
-                        input=install_script,
-                        capture_output=True,
-                        text=True,
-                        encoding='utf-8',
-                        errors='replace',
-                        timeout=300
-                    )
-                    result = bash_result
-                else:
-                    # curl 실패 시 직접 bash로 실행
-                    result = subprocess.run(
-                        ['bash', '-c', 'curl -fsSL https://bun.sh/install | bash'],
-                        shell=False,
-                        capture_output=True,
-                        text=True,
-                        encoding='utf-8',
-                        errors='replace',
-                        timeout=300
-                    )
-            
-            if result.returncode == 0:
-                logger.info("[Bun] 설치 완료")
-                # 설치 후 bunx가 사용 가능한지 확인
-                try:
-                    check_result = subprocess.run(
-                        ['bunx', '--version'],
-                        capture_output=True,
-                        text=True,
-                        encoding='utf-8',
-                        errors='replace',
-                        timeout=5,
-                        shell=True
-                    )
-                    if check_result.returncode == 0:
-                        self.install_complete.emit(True, "Bun이 성공적으로 설치되었습니다.")
-                    else:
-                        self.install_complete.emit(False, "Bun 설치 후 bunx 확인에 실패했습니다. 터미널을 재시작해보세요.")
-                except Exception as e:
-                    logger.warning(f"[Bun] bunx 확인 실패: {str(e)}")
-                    self.install_complete.emit(True, "Bun이 설치되었습니다. 터미널을 재시작하면 bunx를 사용할 수 있습니다.")
-            else:
-                logger.error(f"[Bun] 설치 실패: returncode={result.returncode}")
-                logger.error(f"[Bun] stdout: {result.stdout[:500]}")
-                logger.error(f"[Bun] stderr: {result.stderr[:500]}")
-                
-                # 에러 메시지 구성
-                error_parts = []
-                if result.stderr:
-                    error_parts.append(f"오류: {result.stderr[:200]}")
-                if result.stdout:
-                    # stdout에 에러 정보가 있을 수 있음
-                    if 'error' in result.stdout.lower() or 'failed' in result.stdout.lower():
-                        error_parts.append(f"출력: {result.stdout[:200]}")
-                
-                error_msg = "\n".join(error_parts) if error_parts else f"설치 실패 (코드: {result.returncode})"
-                
-                # 대안 제시
-                error_msg += "\n\n대안: npm을 통해 설치할 수 있습니다:\nnpm install -g bun"
-                
-                self.install_complete.emit(False, error_msg)
-        except subprocess.TimeoutExpired:
-            logger.error("[Bun] 설치 타임아웃")
-            self.install_complete.emit(False, "Bun 설치가 타임아웃되었습니다.")
+            success, message = self.installer.ensure_opencode_available()
         except Exception as e:
-            logger.error(f"[Bun] 설치 오류: {str(e)}")
-            self.install_complete.emit(False, f"오류 발생: {str(e)}")
+            logger.error(f"[OpenCode] 설치 오류: {str(e)}", exc_info=True)
+            success, message = False, str(e)
+        self.signals.install_complete.emit(success, message)
 
 
-class BunxInstallThread(QThread):
-    """npm을 통한 bunx 설치 스레드"""
+class BunxInstaller(QObject):
+    """
+    npm을 통한 bunx 설치 (QProcess로 실행)
+    
+    설치를 기다리는 동안 스레드를 잡아두지 않고, npm 출력은 도착하는 대로 로그에 기록.
+    QThread와 같이 start() / isRunning()으로 사용
+    """
     install_complete = pyqtSignal(bool, str)
     
-    def run(self):
+    # bunx 설치 후에는 항상 Oh My OpenCode 설치가 이어지므로 한 번의 npm install로 같이 설치
+    # (npm 의존성 해석을 두 번 하지 않고, 이어지는 npx oh-my-opencode는 전역 패키지를 바로 사용)
+    PACKAGES = ['bunx', 'oh-my-opencode']
+    
+    TIMEOUT_MS = 300 * 1000
+    
+    def __init__(self, parent: Optional[QObject] = None):
+        super().__init__(parent)
+        self._process = QProcess(self)
+        self._process.readyReadStandardOutput.connect(self._on_output)
+        self._process.errorOccurred.connect(self._on_error)
+        self._process.finished.connect(self._on_finished)
+        self._timeout_timer = QTimer(self)
+        self._timeout_timer.setSingleShot(True)
+        self._timeout_timer.timeout.connect(self._on_timeout)
+        self._timed_out = False
+        self._cancelled = False
+        self._output_tail = ''  # 실패 메시지용 마지막 출력
+    
+    def isRunning(self) -> bool:
+        return self._process.state() != QProcess.ProcessState.NotRunning
+    
+    def start(self):
         """npm을 통해 bunx 설치 실행"""
-        import subprocess
-        import logging
-        logger = logging.getLogger(__name__)
-        
-        try:
-            logger.info("[bunx] npm을 통한 설치 시작")
-            result = subprocess.run(
-                ['npm', 'install', '-g', 'bunx'],
-                shell=True,
-                capture_output=True,
-                text=True,
-                encoding='utf-8',
-                errors='replace',
-                timeout=300
-            )
-            
-            if result.returncode == 0:
-                logger.info("[bunx] npm을 통한 설치 완료")
-                # 설치 후 bunx가 사용 가능한지 확인
-                try:
-                    check_result = subprocess.run(
-                        ['bunx', '--version'],
-                        capture_output=True,
-                        text=True,
-                        encoding='utf-8',
-                        errors='replace',
-                        timeout=5,
-                        shell=True
-                    )
-                    if check_result.returncode == 0:
-                        self.install_complete.emit(True, "bunx가 성공적으로 설치되었습니다.")
-                    else:
-                        self.install_complete.emit(True, "bunx가 설치되었습니다. 터미널을 재시작하면 사용할 수 있습니다.")
-                except Exception as e:
-                    logger.warning(f"[bunx] 확인 실패: {str(e)}")
-                    self.install_complete.emit(True, "bunx가 설치되었습니다. 터미널을 재시작하면 사용할 수 있습니다.")
-            else:
-                logger.error(f"[bunx] npm 설치 실패: {result.stderr}")
-                error_msg = result.stderr if result.stderr else result.stdout
-                self.install_complete.emit(False, f"npm을 통한 bunx 설치 실패: {error_msg[:200]}")
-        except subprocess.TimeoutExpired:
+        logger.info("[bunx] npm을 통한 설치 시작: %s", ' '.join(self.PACKAGES))
+        self._timed_out = False
+        self._cancelled = False
+        self._output_tail = ''
+        cmd = resolve_command(['npm', 'install', '-g'] + self.PACKAGES)
+        self._process.start(cmd[0], cmd[1:])
+        self._timeout_timer.start(self.TIMEOUT_MS)
+    
+    def cancel(self):
+        """설치 중단 (프로세스 종료, 결과는 전달하지 않음)"""
+        if self.isRunning():
+            self._cancelled = True
+            self._process.kill()
+            self._process.waitForFinished(3000)
+    
+    @pyqtSlot()
+    def _on_output(self):
+        """npm 출력 기록"""
+        output = self._process.readAllStandardOutput().data().decode('utf-8', errors='replace')
+        self._output_tail = (self._output_tail + output)[-200:]
+        for line in output.splitlines():
+            if line.strip():
+                logger.debug("[bunx] %s", line)
+    
+    @pyqtSlot()
+    def _on_timeout(self):
+        self._timed_out = True
+        self._process.kill()
+    
+    @pyqtSlot(QProcess.ProcessError)
+    def _on_error(self, error: QProcess.ProcessError):
+        """실행 자체가 실패한 경우 (npm 없음 등, 이때는 finished가 오지 않음)"""
+        if error == QProcess.ProcessError.FailedToStart:
+            self._timeout_timer.stop()
+            logger.error(f"[bunx] npm 설치 오류: {self._process.errorString()}")
+            self.install_complete.emit(False, f"오류 발생: {self._process.errorString()}")
+    
+    @pyqtSlot(int, QProcess.ExitStatus)
+    def _on_finished(self, exit_code: int, exit_status: QProcess.ExitStatus):
+        """설치 종료"""
+        self._timeout_timer.stop()
+        if self._cancelled:
+            logger.info("[bunx] npm 설치 취소됨")
+            return
+        if self._timed_out:
             logger.error("[bunx] npm 설치 타임아웃")
             self.install_complete.emit(False, "npm을 통한 bunx 설치가 타임아웃되었습니다.")
-        except Exception as e:
-            logger.error(f"[bunx] npm 설치 오류: {str(e)}")
-            self.install_complete.emit(False, f"오류 발생: {str(e)}")
+            return
+        
+        if exit_status == QProcess.ExitStatus.NormalExit and exit_code == 0:
+            logger.info("[bunx] npm을 통한 설치 완료")
+            # 설치 전에 캐시된 bunx 경로(없음) 버림 - 실제 확인은 이어지는 Oh My OpenCode 설치에서
+            invalidate_tool_probes()
+            self.install_complete.emit(True, "bunx가 설치되었습니다.")
+        else:
+            stderr = self._process.readAllStandardError().data().decode('utf-8', errors='replace')
+            logger.error(f"[bunx] npm 설치 실패: {stderr}")
+            error_msg = stderr if stderr else self._output_tail
+            self.install_complete.emit(False, f"npm을 통한 bunx 설치 실패: {error_msg[:200]}")
 
 
 class OhMyOpenCodeInstallThread(QThread):
     """Oh My OpenCode 설치 스레드"""
     install_complete = pyqtSignal(bool, str)
     
+    # 모든 설치 방법을 합친 최대 시간 (초) - 방법마다 따로 300초를 주면 최악의 경우 20분
+    TOTAL_TIMEOUT = 300
+    
     def run(self):
         """Oh My OpenCode 설치 실행"""
-        import subprocess
-        import logging
-        logger = logging.getLogger(__name__)
-        
         try:
             logger.info("[OhMyOpenCode] 설치 시작")
             
@@ -1077,20 +1106,23 @@ class OhMyOpenCodeInstallThread(QThread):
                 # 방법 4: 직접 bunx 실행
                 (['bunx', 'oh-my-opencode', 'install'], 'bunx'),
             ]
+            # PATH에 없는 실행기를 쓰는 방법은 미리 제외 (FileNotFoundError까지 가지 않도록)
+            available = {tool for tool in ('npx', 'npm', 'bunx') if which(tool)}
+            install_methods = [m for m in install_methods if m[0][0] in available]
             
-            last_error = None
+            last_error = None if install_methods else "npm / npx / bunx를 찾을 수 없습니다."
+            deadline = time.monotonic() + self.TOTAL_TIMEOUT
             for cmd, method_name in install_methods:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    logger.error("[OhMyOpenCode] 전체 설치 시간 초과 - 남은 방법 건너뜀")
+                    last_error = "설치가 타임아웃되었습니다."
+                    break
                 try:
                     logger.info(f"[OhMyOpenCode] {method_name} 방법으로 설치 시도")
-                    result = subprocess.run(
-                        cmd,
-                        capture_output=True,
-                        text=True,
-                        encoding='utf-8',
-                        errors='replace',
-                        timeout=300,
-                        shell=True
-                    )
+                    result = run_captured(resolve_command(cmd), timeout=remaining,
+                                          should_stop=self.isInterruptionRequested,
+                                          max_output=INSTALL_OUTPUT_LIMIT)
                     
                     if result.returncode == 0:
                         logger.info(f"[OhMyOpenCode] {method_name} 방법으로 설치 완료")
@@ -1099,15 +1131,18 @@ class OhMyOpenCodeInstallThread(QThread):
                     else:
                         logger.warning(f"[OhMyOpenCode] {method_name} 방법 실패: {result.stderr[:200]}")
                         last_error = result.stderr if result.stderr else result.stdout
+                except CommandCancelled:
+                    logger.info("[OhMyOpenCode] 설치 취소됨")
+                    return
                 except FileNotFoundError:
-                    logger.debug(f"[OhMyOpenCode] {method_name} 명령어를 찾을 수 없음")
+                    logger.debug("[OhMyOpenCode] %s 명령어를 찾을 수 없음", method_name)
                     continue
                 except subprocess.TimeoutExpired:
                     logger.error(f"[OhMyOpenCode] {method_name} 설치 타임아웃")
                     last_error = "설치가 타임아웃되었습니다."
                     continue
                 except Exception as e:
-                    logger.debug(f"[OhMyOpenCode] {method_name} 오류: {str(e)}")
+                    logger.debug("[OhMyOpenCode] %s 오류: %s", method_name, e)
                     last_error = str(e)
                     continue
             
@@ -1121,75 +1156,93 @@ class OhMyOpenCodeInstallThread(QThread):
             self.install_complete.emit(False, f"오류 발생: {str(e)}")
 
 
+# Agent 이름 키워드 -> 표시 형식 (정규식 한 번으로 키워드를 찾고 dict로 형식 선택)
+_AGENT_ROLE_RE = re.compile(r'planner|sisyphus|librarian|explore|oracle', re.IGNORECASE)
+_AGENT_ROLE_FORMATS = {
+    'planner': "🤖 {} (계획 수립 Agent)",
+    'sisyphus': "🤖 {} (계획 수립 Agent)",
+    'librarian': "📚 {} (문서 관리 Agent)",
+    'explore': "🔍 {} (코드 탐색 Agent)",
+    'oracle': "🔮 {} (분석 및 예측 Agent)",
+}
+_AGENT_NAME_SEPARATORS = str.maketrans('-_', '  ')
+
+
+# Oh My OpenCode 설정 파일 (우선순위 순, 새로고침마다 Path를 만들지 않도록 문자열로 한 번만 계산)
+_AGENT_CONFIG_PATHS = (
+    # 사용자 전역 설정
+    str(Path.home() / ".config" / "opencode" / "oh-my-opencode.json"),
+    # 프로젝트별 설정 (현재 작업 디렉토리 기준)
+    str(Path.cwd() / ".opencode" / "oh-my-opencode.json"),
+)
+
+# 설정 파일 경로 -> (수정 시각 ns, 표시용 Agent 목록) - 파일이 바뀌지 않았으면 다시 파싱하지 않음
+_agents_cache: Dict[str, Tuple[int, Tuple[str, ...]]] = {}
+
+
+def _format_agent_name(agent_name: str) -> str:
+    """Agent 이름을 읽기 쉽게 변환 (역할별 아이콘/설명 추가)"""
+    display_name = agent_name.translate(_AGENT_NAME_SEPARATORS).title()
+    match = _AGENT_ROLE_RE.search(agent_name)
+    if match is None:
+        return f"🤖 {display_name}"
+    return _AGENT_ROLE_FORMATS[match.group().lower()].format(display_name)
+
+
 class AgentsListThread(QThread):
     """Oh My OpenCode Agent Team 목록을 가져오는 스레드"""
     agents_loaded = pyqtSignal(list)  # Agent 목록
     
     def run(self):
         """Agent Team 목록 가져오기"""
-        import subprocess
-        import logging
-        import json
-        from pathlib import Path
-        logger = logging.getLogger(__name__)
-        
         agents = []
         
         try:
             # 방법 1: 설정 파일에서 직접 읽기 (가장 확실한 방법)
-            config_paths = [
-                # 사용자 전역 설정
-                Path.home() / ".config" / "opencode" / "oh-my-opencode.json",
-                # 프로젝트별 설정 (현재 작업 디렉토리 기준)
-                Path.cwd() / ".opencode" / "oh-my-opencode.json",
-            ]
-            
             config_found = False
-            for config_path in config_paths:
-                logger.info(f"[AgentsList] 설정 파일 확인: {config_path}")
-                if config_path.exists():
-                    try:
-                        logger.info(f"[AgentsList] 설정 파일에서 읽기: {config_path}")
-                        with open(config_path, 'r', encoding='utf-8') as f:
-                            config = json.load(f)
+            # 첫 파일에서 Agent를 찾으면 나머지 경로는 stat 하지 않음 (stat 한 번으로 존재 확인 + 수정 시각)
+            for config_path in _AGENT_CONFIG_PATHS:
+                try:
+                    mtime_ns = os.stat(config_path).st_mtime_ns
+                except OSError:
+                    continue
+                cached = _agents_cache.get(config_path)
+                if cached is not None and cached[0] == mtime_ns:
+                    logger.debug("[AgentsList] 변경 없음, 이전 결과 사용: %s", config_path)
+                    agents = list(cached[1])
+                    config_found = True
+                    break
+                try:
+                    logger.info(f"[AgentsList] 설정 파일에서 읽기: {config_path}")
+                    with open(config_path, 'rb') as f:
+                        data = f.read()
+                    config = orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
                         
-                        logger.debug(f"[AgentsList] 설정 파일 내용: {json.dumps(config, indent=2, ensure_ascii=False)}")
+                    # 설정 전체를 직렬화하므로 DEBUG가 꺼져 있으면 건너뜀
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug("[AgentsList] 설정 파일 내용: %s", json.dumps(config, indent=2, ensure_ascii=False))
                         
-                        # agents 섹션에서 Agent 목록 추출
-                        if 'agents' in config and isinstance(config['agents'], dict):
-                            for agent_name, agent_config in config['agents'].items():
-                                enabled = agent_config.get('enabled', True)
-                                status = "✓ 활성화" if enabled else "✗ 비활성화"
-                                
-                                # Agent 이름을 읽기 쉽게 변환
-                                display_name = agent_name.replace('-', ' ').replace('_', ' ').title()
-                                if 'planner' in agent_name.lower() or 'sisyphus' in agent_name.lower():
-                                    display_name = f"🤖 {display_name} (계획 수립 Agent)"
-                                elif 'librarian' in agent_name.lower():
-                                    display_name = f"📚 {display_name} (문서 관리 Agent)"
-                                elif 'explore' in agent_name.lower():
-                                    display_name = f"🔍 {display_name} (코드 탐색 Agent)"
-                                elif 'oracle' in agent_name.lower():
-                                    display_name = f"🔮 {display_name} (분석 및 예측 Agent)"
-                                else:
-                                    display_name = f"🤖 {display_name}"
+                    # agents 섹션에서 Agent 목록 추출
+                    if 'agents' in config and isinstance(config['agents'], dict):
+                        for agent_name, agent_config in config['agents'].items():
+                            enabled = agent_config.get('enabled', True)
+                            status = "✓ 활성화" if enabled else "✗ 비활성화"
                                 
-                                agents.append(f"{display_name} - {status}")
+                            agents.append(f"{_format_agent_name(agent_name)} - {status}")
                             
-                            if agents:
-                                logger.info(f"[AgentsList] 설정 파일에서 {len(agents)}개 Agent 발견")
-                                config_found = True
-                                break
-                        else:
-                            logger.warning(f"[AgentsList] 설정 파일에 'agents' 섹션이 없음: {config_path}")
-                    except json.JSONDecodeError as e:
-                        logger.error(f"[AgentsList] 설정 파일 JSON 파싱 오류 ({config_path}): {str(e)}")
-                        continue
-                    except Exception as e:
-                        logger.error(f"[AgentsList] 설정 파일 읽기 실패 ({config_path}): {str(e)}", exc_info=True)
-                        continue
-                else:
-                    logger.debug(f"[AgentsList] 설정 파일 없음: {config_path}")
+                        if agents:
+                            logger.info(f"[AgentsList] 설정 파일에서 {len(agents)}개 Agent 발견")
+                            _agents_cache[config_path] = (mtime_ns, tuple(agents))
+                            config_found = True
+                            break
+                    else:
+                        logger.warning(f"[AgentsList] 설정 파일에 'agents' 섹션이 없음: {config_path}")
+                except json.JSONDecodeError as e:
+                    logger.error(f"[AgentsList] 설정 파일 JSON 파싱 오류 ({config_path}): {str(e)}")
+                    continue
+                except Exception as e:
+                    logger.error(f"[AgentsList] 설정 파일 읽기 실패 ({config_path}): {str(e)}", exc_info=True)
+                    continue
             
             # 설정 파일이 없으면 기본 설정 파일 생성 제안
             if not config_found and not agents:
@@ -1210,13 +1263,13 @@ class AgentsListThread(QThread):
                     try:
                         logger.info(f"[AgentsList] {method_name} 방법으로 Agent Team 목록 가져오기 시도")
                         result = subprocess.run(
-                            cmd,
+                            resolve_command(cmd),
                             capture_output=True,
                             text=True,
                             encoding='utf-8',
                             errors='replace',
                             timeout=30,
-                            shell=True
+                            creationflags=NO_WINDOW
                         )
                         
                         if result.returncode == 0:
@@ -1241,10 +1294,10 @@ class AgentsListThread(QThread):
                                     logger.info(f"[AgentsList] {method_name} 방법으로 {len(agents)}개 Agent 발견")
                                     break
                     except (subprocess.TimeoutExpired, FileNotFoundError) as e:
-                        logger.debug(f"[AgentsList] {method_name} 방법 실패: {str(e)}")
+                        logger.debug("[AgentsList] %s 방법 실패: %s", method_name, e)
                         continue
                     except Exception as e:
-                        logger.debug(f"[AgentsList] {method_name} 오류: {str(e)}")
+                        logger.debug("[AgentsList] %s 오류: %s", method_name, e)
                         continue
             
             # Agent를 찾지 못한 경우 기본 Agent 목록 표시
@@ -0,0 +1,63 @@
+"""AI 모델 API 키 저장/불러오기 (keyring이 있으면 OS 자격 증명 저장소에 영구 저장)"""
+import logging
+import os
+from typing import Dict
+
+logger = logging.getLogger(__name__)
+
+# keyring (선택적): Windows 자격 증명 관리자 / macOS 키체인 등에 암호화 저장
+KEYRING_AVAILABLE = False
+try:
+    import keyring
+    KEYRING_AVAILABLE = True
+except ImportError:
+    keyring = None
+
+KEYRING_SERVICE = "logcatAI"
+
+# keyring 항목 이름 -> 환경 변수 이름
+API_KEY_ENV_VARS = {
+    'anthropic': 'ANTHROPIC_API_KEY',
+    'openai': 'OPENAI_API_KEY',
+}
+
+
+def save_api_keys(keys: Dict[str, str]) -> bool:
+    """
+    API 키를 현재 세션 환경 변수에 설정하고 keyring에 저장 (빈 값은 건너뜀)
+
+    Args:
+        keys: 항목 이름('anthropic' / 'openai') -> 키
+
+    Returns:
+        keyring에 영구 저장했으면 True (keyring이 없거나 저장 실패 시 False)
+    """
+    keys = {name: key for name, key in keys.items() if key}
+    for name, key in keys.items():
+        os.environ[API_KEY_ENV_VARS[name]] = key
+
+    if not KEYRING_AVAILABLE:
+        return False
+    try:
+        for name, key in keys.items():
+            keyring.set_password(KEYRING_SERVICE, name, key)
+        return True
+    except Exception as e:
+        logger.warning(f"[ApiKeys] keyring 저장 실패: {str(e)}")
+        return False
+
+
+def load_api_keys():
+    """keyring에 저장된 API 키를 환경 변수로 불러옴 (이미 설정된 환경 변수는 유지)"""
+    if not KEYRING_AVAILABLE:
+        return
+    for name, env_var in API_KEY_ENV_VARS.items():
+        if os.environ.get(env_var):
+            continue
+        try:
+            key = keyring.get_password(KEYRING_SERVICE, name)
+        except Exception as e:
+            logger.warning(f"[ApiKeys] keyring 읽기 실패: {str(e)}")
+            return
+        if key:
+            os.environ[env_var] = key
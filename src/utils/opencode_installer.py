@@ -1,14 +1,120 @@
 """OpenCode 자동 설치 유틸리티"""
 import subprocess
+import json
 import os
 import sys
 import logging
 import platform
+import threading
+import time
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from utils.tool_probe import NO_WINDOW, resolve_command, which
 
 logger = logging.getLogger(__name__)
 
+# node/npm/npx 확인 결과 재사용 시간 (초) - 페이지를 다시 열거나 새로고침할 때마다 프로세스를 띄우지 않도록
+PROBE_TTL = 30.0
+
+# 확인 종류 -> (확인 시각, 결과), 인스턴스가 여러 개여도 공유
+_probe_cache: Dict[str, Tuple[float, Any]] = {}
+# 확인 종류별 락 (같은 확인이 동시에 요청되면 한 번만 실행, 다른 확인끼리는 동시에 진행)
+_probe_locks: Dict[str, threading.Lock] = {
+    'node': threading.Lock(),
+    'npm': threading.Lock(),
+    'opencode': threading.Lock(),
+}
+
+
+def _cached_probe(key: str, probe: Callable[[], Any]) -> Any:
+    """PROBE_TTL 안의 결과가 있으면 재사용, 없으면 probe 실행 후 저장"""
+    with _probe_locks[key]:
+        cached = _probe_cache.get(key)
+        if cached is not None and time.monotonic() - cached[0] < PROBE_TTL:
+            return cached[1]
+        result = probe()
+        _probe_cache[key] = (time.monotonic(), result)
+        return result
+
+
+# node 한 번 실행으로 node/npm 버전을 함께 출력 (npm 버전은 node 옆 npm 패키지의 package.json에서 읽음)
+# Windows: <node 폴더>/node_modules/npm, 그 외: <prefix>/lib/node_modules/npm
+_TOOLCHAIN_SCRIPT = (
+    "const p=require('path'),d=p.dirname(process.execPath);let v='';"
+    "for(const c of [p.join(d,'node_modules','npm','package.json'),"
+    "p.join(d,'..','lib','node_modules','npm','package.json')])"
+    "{try{v=require(c).version;break}catch(e){}}"
+    "console.log(process.versions.node);console.log(v)"
+)
+
+
+# 마지막으로 확인된 정상 상태 (node/npm/npx 모두 있음)를 디스크에 저장해 앱 재시작 후에도 재사용
+# node/npm/npx 실행 파일 경로나 수정 시각이 바뀌면(재설치/업그레이드) 무효
+TOOLCHAIN_STATE_PATH = Path.home() / ".config" / "logcatAI" / "opencode_state.json"
+TOOLCHAIN_STATE_TTL = 24 * 60 * 60
+
+
+def _toolchain_fingerprint() -> Optional[Dict[str, list]]:
+    """node/npm/npx 실행 파일 경로와 수정 시각 (하나라도 없으면 None)"""
+    fingerprint = {}
+    for name in ('node', 'npm', 'npx'):
+        path = which(name)
+        if path is None:
+            return None
+        try:
+            fingerprint[name] = [path, os.path.getmtime(path)]
+        except OSError:
+            return None
+    return fingerprint
+
+
+def _load_toolchain_state() -> Optional[Dict[str, Any]]:
+    """저장된 정상 상태 (없거나 만료/무효면 None)"""
+    try:
+        with open(TOOLCHAIN_STATE_PATH, 'r', encoding='utf-8') as f:
+            state = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if time.time() - state.get('checked_at', 0) >= TOOLCHAIN_STATE_TTL:
+        return None
+    if state.get('fingerprint') != _toolchain_fingerprint():
+        return None
+    return state
+
+
+def _save_toolchain_state(node_version: str, npm_version: str):
+    """정상 상태 저장 (실패해도 다음에 다시 확인할 뿐이므로 무시)"""
+    fingerprint = _toolchain_fingerprint()
+    if fingerprint is None:
+        return
+    state = {
+        'checked_at': time.time(),
+        'node_version': node_version,
+        'npm_version': npm_version,
+        'fingerprint': fingerprint,
+    }
+    try:
+        TOOLCHAIN_STATE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        with open(TOOLCHAIN_STATE_PATH, 'w', encoding='utf-8') as f:
+            json.dump(state, f)
+    except OSError as e:
+        logger.debug("[OpenCodeInstaller] 상태 저장 실패: %s", e)
+
+
+def _is_fresh(key: str) -> bool:
+    cached = _probe_cache.get(key)
+    return cached is not None and time.monotonic() - cached[0] < PROBE_TTL
+
+
+def invalidate_probe_cache():
+    """확인 결과 버림 (설치 후 다시 확인)"""
+    _probe_cache.clear()
+    try:
+        TOOLCHAIN_STATE_PATH.unlink()
+    except OSError:
+        pass
+
 
 class OpenCodeInstaller:
     """OpenCode CLI 자동 설치 클래스"""
@@ -19,20 +125,26 @@ class OpenCodeInstaller:
     
     def check_nodejs(self) -> Tuple[bool, Optional[str]]:
         """
-        Node.js 설치 확인
+        Node.js 설치 확인 (PROBE_TTL 동안 결과 재사용)
         
         Returns:
             (is_installed, version_string)
         """
+        return _cached_probe('node', self._probe_nodejs)
+    
+    def _probe_nodejs(self) -> Tuple[bool, Optional[str]]:
+        """node --version 실행"""
+        if which('node') is None:
+            return False, None
         try:
             result = subprocess.run(
-                ['node', '--version'],
+                resolve_command(['node', '--version']),
                 capture_output=True,
                 text=True,
                 encoding='utf-8',
                 errors='replace',
                 timeout=2,
-                shell=True if self.system == 'Windows' else False
+                creationflags=NO_WINDOW
             )
             if result.returncode == 0:
                 version_str = result.stdout.strip()
@@ -45,20 +157,26 @@ class OpenCodeInstaller:
     
     def check_npm(self) -> Tuple[bool, Optional[str]]:
         """
-        npm 설치 확인
+        npm 설치 확인 (PROBE_TTL 동안 결과 재사용)
         
         Returns:
             (is_installed, version_string)
         """
+        return _cached_probe('npm', self._probe_npm)
+    
+    def _probe_npm(self) -> Tuple[bool, Optional[str]]:
+        """npm --version 실행"""
+        if which('npm') is None:
+            return False, None
         try:
             result = subprocess.run(
-                ['npm', '--version'],
+                resolve_command(['npm', '--version']),
                 capture_output=True,
                 text=True,
                 encoding='utf-8',
                 errors='replace',
                 timeout=2,
-                shell=True if self.system == 'Windows' else False
+                creationflags=NO_WINDOW
             )
             if result.returncode == 0:
                 version_str = result.stdout.strip()
@@ -69,54 +187,78 @@ class OpenCodeInstaller:
     
     def check_opencode(self) -> bool:
         """
-        OpenCode CLI 설치 확인
+        OpenCode CLI 설치 확인 (PROBE_TTL 동안 결과 재사용)
         
         Returns:
             설치 여부
         """
+        return _cached_probe('opencode', self._probe_opencode)
+    
+    def _probe_opencode(self) -> bool:
+        """npx --version 실행"""
+        if which('npx') is None:
+            return False
         # npx를 통해 확인 (npx는 자동 다운로드 가능)
         try:
             result = subprocess.run(
-                ['npx', '--version'],
+                resolve_command(['npx', '--version']),
                 capture_output=True,
                 text=True,
                 encoding='utf-8',
                 errors='replace',
                 timeout=2,
-                shell=True if self.system == 'Windows' else False
+                creationflags=NO_WINDOW
             )
             return result.returncode == 0
         except (subprocess.TimeoutExpired, FileNotFoundError):
             return False
     
-    def install_opencode_via_npx(self) -> Tuple[bool, str]:
+    def probe_toolchain(self) -> Tuple[Tuple[bool, Optional[str]], Tuple[bool, Optional[str]], bool]:
         """
-        npx를 통해 OpenCode 설치 (전역 설치)
+        Node.js / npm / npx 확인을 한 번에 (프로세스 세 개 대신 node 한 번 실행)
+        
+        결과는 check_nodejs / check_npm / check_opencode 캐시에 저장됨.
+        npm 버전을 파일에서 못 찾으면 check_npm으로 따로 확인.
         
         Returns:
-            (success, message)
+            ((node 설치 여부, 버전), (npm 설치 여부, 버전), npx 사용 가능 여부)
         """
-        try:
-            # npx를 통해 한 번 실행하여 캐시에 저장
-            logger.info("Installing OpenCode via npx...")
-            result = subprocess.run(
-                ['npx', '-y', '@opencode-ai/cli', '--version'],
-                capture_output=True,
-                text=True,
-                encoding='utf-8',
-                errors='replace',
-                timeout=60,
-                shell=True if self.system == 'Windows' else False
-            )
-            
-            if result.returncode == 0:
-                return True, "OpenCode is now available via npx"
-            else:
-                return False, f"Failed to install OpenCode: {result.stderr}"
-        except subprocess.TimeoutExpired:
-            return False, "Installation timed out"
-        except Exception as e:
-            return False, f"Error installing OpenCode: {str(e)}"
+        if not (_is_fresh('node') and _is_fresh('npm') and _is_fresh('opencode')):
+            # 디스크에 저장된 정상 상태가 유효하면 프로세스 실행 없이 사용
+            state = _load_toolchain_state()
+            if state is not None:
+                now = time.monotonic()
+                _probe_cache['node'] = (now, (True, state['node_version']))
+                _probe_cache['npm'] = (now, (True, state['npm_version']))
+                _probe_cache['opencode'] = (now, True)
+        
+        if not (_is_fresh('node') and _is_fresh('npm') and _is_fresh('opencode')) and which('node') is not None:
+            try:
+                result = subprocess.run(
+                    resolve_command(['node', '-e', _TOOLCHAIN_SCRIPT]),
+                    capture_output=True,
+                    text=True,
+                    encoding='utf-8',
+                    errors='replace',
+                    timeout=2,
+                    creationflags=NO_WINDOW
+                )
+                lines = result.stdout.splitlines() if result.returncode == 0 else []
+                now = time.monotonic()
+                if lines and lines[0].strip():
+                    _probe_cache['node'] = (now, (True, lines[0].strip()))
+                    npm_version = lines[1].strip() if len(lines) > 1 else ''
+                    if npm_version and which('npm') is not None:
+                        _probe_cache['npm'] = (now, (True, npm_version))
+                        # npx는 npm 패키지에 포함되어 있으므로 실행 파일이 있으면 사용 가능으로 판단
+                        _probe_cache['opencode'] = (now, which('npx') is not None)
+                        if which('npx') is not None:
+                            _save_toolchain_state(lines[0].strip(), npm_version)
+            except (subprocess.TimeoutExpired, FileNotFoundError):
+                pass
+        
+        # 위에서 채우지 못한 항목만 개별 확인 (이미 캐시에 있으면 프로세스 실행 없음)
+        return self.check_nodejs(), self.check_npm(), self.check_opencode()
     
     def install_opencode_global(self) -> Tuple[bool, str]:
         """
@@ -128,16 +270,17 @@ class OpenCodeInstaller:
         try:
             logger.info("Installing OpenCode globally via npm...")
             result = subprocess.run(
-                ['npm', 'install', '-g', '@opencode-ai/cli'],
+                resolve_command(['npm', 'install', '-g', '@opencode-ai/cli']),
                 capture_output=True,
                 text=True,
                 encoding='utf-8',
                 errors='replace',
                 timeout=300,  # 5분 타임아웃
-                shell=True if self.system == 'Windows' else False
+                creationflags=NO_WINDOW
             )
             
             if result.returncode == 0:
+                invalidate_probe_cache()
                 return True, "OpenCode installed successfully"
             else:
                 return False, f"Failed to install OpenCode: {result.stderr}"
@@ -180,30 +323,24 @@ class OpenCodeInstaller:
         Returns:
             (is_available, message)
         """
-        # Node.js 확인
-        node_installed, node_version = self.check_nodejs()
+        # Node.js / npm / npx 확인 (node 한 번 실행)
+        (node_installed, node_version), (npm_installed, npm_version), npx_available = self.probe_toolchain()
         if not node_installed:
             return False, self.install_nodejs_instructions()
         
         logger.info(f"Node.js version: {node_version}")
         
         # npm 확인
-        npm_installed, npm_version = self.check_npm()
         if not npm_installed:
             return False, "npm이 설치되어 있지 않습니다. Node.js를 재설치하세요."
         
         logger.info(f"npm version: {npm_version}")
         
-        # OpenCode 확인 (npx 사용 가능하면 OK)
-        if self.check_opencode():
+        # OpenCode 확인 (npx 사용 가능하면 OK - 실행 시 npx -y가 패키지를 받아 캐시에 저장)
+        if npx_available:
             return True, "OpenCode is available via npx"
         
-        # npx를 통해 한 번 실행하여 캐시에 저장
-        success, message = self.install_opencode_via_npx()
-        if success:
-            return True, message
-        
-        # 실패 시 전역 설치 시도
+        # npx가 PATH에 없으면 npx로 받아 두는 단계도 실패하므로 바로 전역 설치
         logger.info("Trying global installation...")
         success, message = self.install_opencode_global()
         return success, message
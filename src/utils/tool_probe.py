@@ -0,0 +1,199 @@
+"""외부 도구(bunx/npx/npm) 탐지 유틸리티"""
+import json
+import logging
+import os
+import shutil
+import subprocess
+import tempfile
+import threading
+import time
+from typing import Callable, Dict, FrozenSet, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# bunx 탐지 결과 재사용 시간 (초) - 상태 새로고침/설치 버튼마다 프로세스를 다시 띄우지 않도록
+BUNX_PROBE_TTL = 30.0
+
+_bunx_probe_cache: Optional[Tuple[float, Tuple[bool, str]]] = None  # (탐지 시각, (사용 가능 여부, 출처))
+_bunx_probe_lock = threading.Lock()
+
+# npm 전역 패키지 목록 (npm list -g 한 번으로 bunx / oh-my-opencode 확인을 같이 처리)
+_npm_global_cache: Optional[Tuple[float, FrozenSet[str]]] = None  # (조회 시각, 패키지 이름들)
+_npm_global_lock = threading.Lock()
+
+# npm_global_packages에서 확인하는 패키지 (이름을 넘기면 npm이 이 패키지만 출력하므로 JSON이 작아짐)
+NPM_GLOBAL_PACKAGES = ('bunx', 'oh-my-opencode')
+
+# Windows에서 콘솔 창이 잠깐 뜨지 않도록 (셸 없이 직접 실행할 때 creationflags로 전달)
+NO_WINDOW = subprocess.CREATE_NO_WINDOW if os.name == 'nt' else 0
+
+# run_captured에서 중단 요청을 확인하는 간격 (초)
+CANCEL_POLL_INTERVAL = 0.1
+
+# shutil.which로 찾은 실행 파일 경로 (없으면 None, bunx 설치 후 초기화)
+_tool_paths: Dict[str, Optional[str]] = {}
+
+
+def which(name: str) -> Optional[str]:
+    """shutil.which 결과 (프로세스 동안 재사용, invalidate_tool_probes로 초기화)"""
+    if name not in _tool_paths:
+        _tool_paths[name] = shutil.which(name)
+    return _tool_paths[name]
+
+
+def resolve_command(cmd: List[str]) -> List[str]:
+    """
+    명령의 실행 파일을 절대 경로로 바꿈 (npm.cmd 등도 cmd.exe 없이 shell=False로 실행 가능)
+
+    PATH에 없으면 그대로 두어 subprocess가 FileNotFoundError를 내도록 함
+    """
+    path = which(cmd[0])
+    return [path if path else cmd[0]] + cmd[1:]
+
+
+class CommandCancelled(Exception):
+    """run_captured 실행 중 중단 요청으로 프로세스를 종료함"""
+
+
+def run_captured(cmd: List[str], timeout: float, input_data: Optional[str] = None,
+                 should_stop: Optional[Callable[[], bool]] = None,
+                 max_output: Optional[int] = None) -> subprocess.CompletedProcess:
+    """
+    출력이 많은 명령(설치 스크립트 등) 실행
+
+    stdout/stderr를 파이프 대신 임시 파일로 받아 자식 프로세스가 직접 쓰게 하고,
+    끝난 뒤 한 번에 읽어 디코딩함 (파이프를 작은 read로 계속 비우지 않음).
+    타임아웃 시 subprocess.run과 같이 프로세스를 종료하고 TimeoutExpired 발생.
+
+    Args:
+        should_stop: 실행 중 CANCEL_POLL_INTERVAL마다 호출, True면 프로세스를 종료하고
+                     CommandCancelled 발생 (예: QThread.isInterruptionRequested)
+        max_output: stdout/stderr를 각각 앞에서부터 이 바이트 수까지만 읽어 디코딩
+                    (오류 메시지에만 쓰는 출력이면 전체를 메모리에 올리지 않도록, None이면 전체)
+
+    Returns:
+        stdout/stderr가 str인 실행 결과
+    """
+    # SpooledTemporaryFile은 자식 프로세스에 fileno()를 넘기는 순간 디스크로 넘어가므로 처음부터 TemporaryFile 사용
+    # 입력도 임시 파일로 넘겨 기다리는 동안 stdin 쓰기로 막히지 않도록 함
+    with tempfile.TemporaryFile() as stdin, tempfile.TemporaryFile() as out, tempfile.TemporaryFile() as err:
+        if input_data is not None:
+            stdin.write(input_data.encode('utf-8'))
+            stdin.seek(0)
+        deadline = time.monotonic() + timeout
+        with subprocess.Popen(
+            cmd,
+            stdin=stdin if input_data is not None else None,
+            stdout=out,
+            stderr=err,
+            bufsize=-1,
+            creationflags=NO_WINDOW
+        ) as proc:
+            while True:
+                try:
+                    proc.wait(timeout=min(CANCEL_POLL_INTERVAL, max(deadline - time.monotonic(), 0)))
+                    break
+                except subprocess.TimeoutExpired:
+                    if time.monotonic() >= deadline:
+                        proc.kill()
+                        proc.wait()
+                        raise subprocess.TimeoutExpired(cmd, timeout)
+                    if should_stop is not None and should_stop():
+                        proc.kill()
+                        proc.wait()
+                        raise CommandCancelled(cmd[0])
+        out.seek(0)
+        err.seek(0)
+        return subprocess.CompletedProcess(
+            proc.args,
+            proc.returncode,
+            out.read(max_output).decode('utf-8', errors='replace'),
+            err.read(max_output).decode('utf-8', errors='replace')
+        )
+
+
+def run_tool(name: str, args: List[str], timeout: float) -> Optional[subprocess.CompletedProcess]:
+    """
+    실행 파일을 셸(cmd.exe) 없이 직접 실행
+
+    Returns:
+        실행 결과 (실행 파일이 PATH에 없거나 실행 실패 시 None)
+    """
+    path = which(name)
+    if path is None:
+        return None
+    try:
+        return subprocess.run(
+            [path] + args,
+            capture_output=True,
+            text=True,
+            encoding='utf-8',
+            errors='replace',
+            timeout=timeout,
+            creationflags=NO_WINDOW
+        )
+    except (OSError, subprocess.SubprocessError) as e:
+        # 실행 파일 삭제/권한 문제(OSError) 또는 타임아웃(TimeoutExpired)
+        logger.debug("[%s] 실행 실패: %s", name, e)
+        return None
+
+
+def detect_bunx() -> Tuple[bool, str]:
+    """
+    bunx 사용 가능 여부 (PATH 또는 npm 전역 패키지, BUNX_PROBE_TTL 동안 결과 재사용)
+
+    Returns:
+        (사용 가능 여부, 출처 'PATH' / 'npm' / '')
+    """
+    global _bunx_probe_cache
+    with _bunx_probe_lock:
+        if _bunx_probe_cache is not None and time.monotonic() - _bunx_probe_cache[0] < BUNX_PROBE_TTL:
+            return _bunx_probe_cache[1]
+
+        probe = (False, '')
+        result = run_tool('bunx', ['--version'], timeout=3)
+        if result is not None and result.returncode == 0:
+            logger.info(f"[bunx] 확인됨: {result.stdout.strip()}")
+            probe = (True, 'PATH')
+        elif 'bunx' in npm_global_packages():
+            # npm 전역 패키지에서도 확인
+            logger.info("[bunx] npm 전역 패키지에서 확인됨")
+            probe = (True, 'npm')
+
+        _bunx_probe_cache = (time.monotonic(), probe)
+        return probe
+
+
+def npm_global_packages() -> FrozenSet[str]:
+    """
+    NPM_GLOBAL_PACKAGES 중 npm 전역 설치된 패키지 이름 (BUNX_PROBE_TTL 동안 결과 재사용)
+
+    Returns:
+        패키지 이름 집합 (npm이 없거나 조회 실패 시 빈 집합)
+    """
+    global _npm_global_cache
+    with _npm_global_lock:
+        if _npm_global_cache is not None and time.monotonic() - _npm_global_cache[0] < BUNX_PROBE_TTL:
+            return _npm_global_cache[1]
+
+        packages: FrozenSet[str] = frozenset()
+        # 찾는 패키지가 없으면 returncode가 0이 아니어도 JSON은 출력되므로 stdout만 확인
+        result = run_tool('npm', ['list', '-g', '--depth=0', '--json', *NPM_GLOBAL_PACKAGES], timeout=3)
+        if result is not None and result.stdout.strip():
+            try:
+                packages = frozenset(json.loads(result.stdout).get('dependencies', {}))
+            except (ValueError, AttributeError) as e:
+                logger.debug("[npm] 전역 패키지 목록 파싱 실패: %s", e)
+
+        _npm_global_cache = (time.monotonic(), packages)
+        return packages
+
+
+def invalidate_tool_probes():
+    """탐지 결과 버림 (bunx / 전역 패키지 설치 후 다시 확인)"""
+    global _bunx_probe_cache, _npm_global_cache
+    with _bunx_probe_lock:
+        _bunx_probe_cache = None
+        _tool_paths.clear()
+    with _npm_global_lock:
+        _npm_global_cache = None
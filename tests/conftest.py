@@ -0,0 +1,16 @@
+"""테스트 공통 설정 - src를 import 경로에 추가하고 화면 없이 Qt 실행"""
+import os
+import sys
+
+import pytest
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
+
+
+@pytest.fixture(scope='session')
+def qapp():
+    """세션 공용 QCoreApplication"""
+    from PyQt6.QtCore import QCoreApplication
+    app = QCoreApplication.instance() or QCoreApplication([])
+    yield app
@@ -0,0 +1,96 @@
+"""LogcatThread 배치 전달 테스트 (adb 없이 가짜 collector 사용)"""
+import threading
+import time
+
+from core.ringbuf import SPSCRingBuffer
+from ui.log_table.threads import LogcatThread
+
+
+class FakeCollector:
+    """lines를 한 번에 보낸 뒤 stop()까지 readline에서 블록된 것처럼 대기"""
+
+    def __init__(self, lines):
+        self.lines = lines
+        self.sent = threading.Event()
+        self._stopped = threading.Event()
+        self.on_log_received = None
+        self.on_error = None
+
+    def collect(self):
+        for line in self.lines:
+            self.on_log_received(line)
+        self.sent.set()
+        self._stopped.wait()
+
+    def stop(self):
+        self._stopped.set()
+
+
+def _log_lines(count):
+    return [f"01-01 00:00:00.000 I/Tag( 123  456) message {i}" for i in range(count)]
+
+
+def _make_thread(lines, ring, batch_interval, batch_size=1000):
+    thread = LogcatThread(batch_size=batch_size, batch_interval=batch_interval, log_ring=ring)
+    collector = FakeCollector(lines)
+    collector.on_log_received = thread._on_log_received
+    collector.on_error = thread._on_error
+    thread.collector = collector
+    return thread, collector
+
+
+def _drain_until(ring, count, timeout):
+    """timeout 안에 ring에서 count개를 꺼낼 때까지 소비 (GUI 타이머 역할)"""
+    received = []
+    deadline = time.monotonic() + timeout
+    while len(received) < count and time.monotonic() < deadline:
+        received.extend(ring.drain_up_to(count))
+        time.sleep(0.005)
+    return received
+
+
+def test_partial_batch_flushed_without_new_lines(qapp):
+    """N줄 이후 입력이 끊겨도 batch_interval의 약 2배 안에 N줄 모두 링 버퍼에 들어옴"""
+    batch_interval = 0.05
+    lines = _log_lines(37)
+    ring = SPSCRingBuffer(capacity=1024)
+    thread, collector = _make_thread(lines, ring, batch_interval)
+
+    thread.start()
+    try:
+        assert collector.sent.wait(1.0)
+        received = _drain_until(ring, len(lines), batch_interval * 2)
+        assert [log[4] for log in received] == [f"message {i}" for i in range(len(lines))]
+    finally:
+        thread.stop()
+        assert thread.wait(1000)
+
+
+def test_full_batch_pushed_before_interval(qapp):
+    """batch_size개가 모이면 batch_interval을 기다리지 않고 링 버퍼에 넣음"""
+    lines = _log_lines(1000)
+    ring = SPSCRingBuffer(capacity=4096)
+    thread, collector = _make_thread(lines, ring, batch_interval=10.0)
+
+    thread.start()
+    try:
+        assert collector.sent.wait(1.0)
+        assert len(_drain_until(ring, len(lines), 1.0)) == len(lines)
+    finally:
+        thread.stop()
+        assert thread.wait(1000)
+
+
+def test_full_ring_waits_for_consumer(qapp):
+    """링 버퍼가 가득 차면 로그를 버리지 않고 소비자가 비울 때까지 기다림"""
+    lines = _log_lines(300)
+    ring = SPSCRingBuffer(capacity=64)
+    thread, collector = _make_thread(lines, ring, batch_interval=0.01, batch_size=100)
+
+    thread.start()
+    try:
+        received = _drain_until(ring, len(lines), 2.0)
+        assert len(received) == len(lines)
+    finally:
+        thread.stop()
+        assert thread.wait(1000)